@@ -50,39 +50,45 @@ A powerful Windows system administration tool with modern UI and advanced automa
 *Built with ❤️ for Windows system administrators*
 """
 
-import sys, os, time, json, subprocess, ctypes, shlex, shutil, html, threading, tempfile, math
-from queue import Queue, Empty
+import sys, os, re, time, json, subprocess, ctypes, shlex, shutil, codecs, threading, tempfile, math, functools, weakref, random
+from queue import SimpleQueue, Empty
+from collections import deque
 from ctypes import wintypes
 from datetime import datetime, timezone
 from dataclasses import dataclass, replace, asdict
-from typing import Dict, Tuple, List, Optional, Any
-import importlib.util
+from typing import Dict, Tuple, List, Optional, Any, Callable
 
 # Import our window utilities - KREATIVER ANSATZ!
+_WU = None
+
 def get_window_utils():
-    """Dynamischer Import mit mehreren Fallback-Strategien"""
+    """Dynamischer Import mit mehreren Fallback-Strategien (einmalig, dann gecacht)"""
+    global _WU
+    if _WU is not None:
+        return _WU
     
     # Strategie 1: Direkter Import
     try:
         import window_utils
-        return window_utils
+        _WU = window_utils
+        return _WU
     except ImportError:
         pass
     
     # Strategie 2: Import aus dem aktuellen Verzeichnis
     try:
-        import sys
-        import os
         current_dir = os.path.dirname(os.path.abspath(__file__))
         if current_dir not in sys.path:
             sys.path.insert(0, current_dir)
         import window_utils
-        return window_utils
+        _WU = window_utils
+        return _WU
     except ImportError:
         pass
     
     # Strategie 3: Datei-basierter Import (für Entwicklung)
     try:
+        import importlib.util
         script_dir = os.path.dirname(os.path.abspath(__file__))
         module_path = os.path.join(script_dir, "window_utils.py")
         
@@ -91,7 +97,8 @@ def get_window_utils():
             if spec and spec.loader:
                 wu = importlib.util.module_from_spec(spec)
                 spec.loader.exec_module(wu)
-                return wu
+                _WU = wu
+                return _WU
     except Exception:
         pass
     
@@ -100,33 +107,136 @@ def get_window_utils():
     class DummyWindowUtils:
         def enable_dpi_awareness(self): pass
         def get_quadrant_physical(self, *args): return 1
-        def move_window(self, *args): pass
+        def move_window(self, *args, **kwargs): pass
+        def move_window_unchecked(self, *args, **kwargs): pass
         def get_image_name_basename(self, *args): return "unknown"
-        def find_windows_by_criteria(self, *args): return []
+        def find_windows_by_criteria(self, *args, **kwargs): return []
+        def find_windows_multi(self, queries, *args, **kwargs): return [[] for _ in queries]
+        def get_explorer_windows(self): return []
+        def get_window_area(self, *args): return 0
+        def clamp_rect_to_primary(self, x, y, w, h): return x, y, w, h
+        def set_win_event_hook(self, *args, **kwargs): return 0
+        def unhook_win_event(self, *args): pass
+        def move_windows(self, placements, *args, **kwargs): return {p[0]: False for p in placements}
+        def enum_visible_toplevel_windows(self): return []
+        def refresh_monitors(self): pass
+        def clear_process_caches(self): pass
     
-    return DummyWindowUtils()
-
-# Verwende die Funktion
-wu = get_window_utils()
-enable_dpi_awareness = wu.enable_dpi_awareness
-get_quadrant_physical = wu.get_quadrant_physical
-move_window = wu.move_window
-get_image_name_basename = wu.get_image_name_basename
-find_windows_by_criteria = wu.find_windows_by_criteria
-get_explorer_windows = wu.get_explorer_windows
-get_window_area = wu.get_window_area
-clamp_rect_to_primary = wu.clamp_rect_to_primary
+    _WU = DummyWindowUtils()
+    return _WU
+
+# Names re-exported from window_utils; bound on first use instead of at import time
+_WU_EXPORTS = (
+    "enable_dpi_awareness", "get_quadrant_physical", "move_window", "get_image_name_basename",
+    "find_windows_by_criteria", "get_explorer_windows", "get_window_area", "clamp_rect_to_primary",
+    "set_win_event_hook", "unhook_win_event", "move_windows", "enum_visible_toplevel_windows",
+    "refresh_monitors", "clear_process_caches", "move_window_unchecked", "find_windows_multi",
+)
+
+def _wu_noop(*args, **kwargs):
+    return None
+
+def _bind_window_utils():
+    """Resolve window_utils once and replace the lazy proxies below with the real functions."""
+    wu = get_window_utils()
+    g = globals()
+    for name in _WU_EXPORTS:
+        # Fehlende Exporte (ältere window_utils / Dummy) dürfen den Start nicht abbrechen
+        g[name] = getattr(wu, name, _wu_noop)
+    return wu
+
+def _lazy_wu(name: str):
+    def proxy(*args, **kwargs):
+        _bind_window_utils()
+        return globals()[name](*args, **kwargs)
+    proxy.__name__ = name
+    return proxy
+
+enable_dpi_awareness = _lazy_wu("enable_dpi_awareness")
+get_quadrant_physical = _lazy_wu("get_quadrant_physical")
+move_window = _lazy_wu("move_window")
+get_image_name_basename = _lazy_wu("get_image_name_basename")
+find_windows_by_criteria = _lazy_wu("find_windows_by_criteria")
+get_explorer_windows = _lazy_wu("get_explorer_windows")
+get_window_area = _lazy_wu("get_window_area")
+clamp_rect_to_primary = _lazy_wu("clamp_rect_to_primary")
+set_win_event_hook = _lazy_wu("set_win_event_hook")
+unhook_win_event = _lazy_wu("unhook_win_event")
+move_windows = _lazy_wu("move_windows")
+enum_visible_toplevel_windows = _lazy_wu("enum_visible_toplevel_windows")
+refresh_monitors = _lazy_wu("refresh_monitors")
+clear_process_caches = _lazy_wu("clear_process_caches")
+move_window_unchecked = _lazy_wu("move_window_unchecked")
+find_windows_multi = _lazy_wu("find_windows_multi")
 
 from PySide6.QtWidgets import (
     QApplication, QWidget, QGridLayout, QVBoxLayout,
     QToolButton, QLabel, QTextEdit, QSplitter, QHBoxLayout, QMessageBox,
-    QComboBox, QGraphicsDropShadowEffect, QGraphicsBlurEffect
+    QComboBox, QListView, QGraphicsDropShadowEffect, QGraphicsBlurEffect, QSpacerItem
+)
+from PySide6.QtCore import (
+    Qt, QTimer, QRect, QRectF, QFileSystemWatcher, QObject, QRunnable, QThreadPool, Signal,
+)
+from PySide6.QtGui import (
+    QGuiApplication, QTextCursor, QTextCharFormat, QFont, QIcon, QPixmap, QColor, QPainter, QPen, QRadialGradient, QMouseEvent
+)
+import win32gui, win32con, win32process, pywintypes
+
+# WinAPI-Einstiege und Flag-Kombinationen der Platzierungs-Helfer einmal binden
+_SetWindowPos = win32gui.SetWindowPos
+_MoveWindow = win32gui.MoveWindow
+_ShowWindow = win32gui.ShowWindow
+_IsWindow = win32gui.IsWindow
+_HWND_TOP = win32con.HWND_TOP
+_SW_RESTORE = win32con.SW_RESTORE
+_SWP_NOACTIVATE = win32con.SWP_NOACTIVATE
+_SWP_SHOWWINDOW = win32con.SWP_SHOWWINDOW
+_SWP_SHOWNOZORDER = win32con.SWP_SHOWWINDOW | win32con.SWP_NOZORDER
+_SWP_NOACTIVATE_NOZORDER = win32con.SWP_NOACTIVATE | win32con.SWP_NOZORDER
+_SWP_SHOW_NOACTIVATE = win32con.SWP_SHOWWINDOW | win32con.SWP_NOACTIVATE
+_SWP_SHOW_NOACTIVATE_NOZORDER = win32con.SWP_SHOWWINDOW | win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE
+
+# Fallback-Reihenfolgen fuer widerspenstige Fenster: (Name, Restore vorher, Funktion, InsertAfter, Flags).
+# flags=None -> MoveWindow(hwnd, x, y, w, h, True). Erfolgreichste Methode nach vorne schieben.
+_PS_PLACEMENT_STRATEGIES = (
+    ("WinAPI", False, _SetWindowPos, 0, _SWP_SHOWNOZORDER),
+    ("MoveWindow", False, _MoveWindow, None, None),
+    ("SetWindowPos", False, _SetWindowPos, 0, _SWP_SHOW_NOACTIVATE_NOZORDER),
+)
+_ALT_MOVE_STRATEGIES = (
+    ("SetWindowPos", False, _SetWindowPos, None, _SWP_NOACTIVATE_NOZORDER),
+    ("MoveWindow", False, _MoveWindow, None, None),
+    ("ShowWindow+SetWindowPos", True, _SetWindowPos, _HWND_TOP, _SWP_NOACTIVATE),
+)
+_CONSOLE_PLACEMENT_STRATEGIES = (
+    ("ShowWindow+SetWindowPos", True, _SetWindowPos, _HWND_TOP, _SWP_SHOW_NOACTIVATE),
+    ("MoveWindow", False, _MoveWindow, None, None),
+    ("SetWindowPos", False, _SetWindowPos, None, _SWP_NOACTIVATE_NOZORDER),
 )
-from PySide6.QtCore import Qt, QTimer, QRect, QPoint
-from PySide6.QtGui import QGuiApplication, QTextCursor, QFont, QIcon, QPixmap, QColor
-import win32gui, win32process, win32con, win32api
+_RDS_PLACEMENT_STRATEGIES = (
+    ("ShowWindow+SetWindowPos", True, _SetWindowPos, _HWND_TOP, _SWP_SHOW_NOACTIVATE),
+    ("SetWindowPos", False, _SetWindowPos, None, _SWP_SHOW_NOACTIVATE_NOZORDER),
+    ("MoveWindow", False, _MoveWindow, None, None),
+)
+
+def _apply_placement_strategies(hwnd: int, x: int, y: int, w: int, h: int, strategies, on_restore=None) -> Optional[str]:
+    """Probiert die Strategien der Reihe nach; liefert den Namen der ersten, die nicht wirft."""
+    for name, restore, fn, insert_after, flags in strategies:
+        try:
+            if restore:
+                _ShowWindow(hwnd, _SW_RESTORE)
+                if on_restore:
+                    on_restore(hwnd)
+            if flags is None:
+                fn(hwnd, x, y, w, h, True)
+            else:
+                fn(hwnd, insert_after, x, y, w, h, flags)
+            return name
+        except pywintypes.error:
+            continue
+    return None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     CONFIG_FILENAME: str = "grid.config.json"
     TOOLS_DIR: str = r"C:\Support\Tools"
@@ -147,6 +257,7 @@ class Config:
     BASELINE_UAC: bool = False
     DEFAULT_CLUSTER: Optional[str] = None
     CONSOLE_LOG_LEVEL: str = "INFO"  # DEBUG, INFO, WARNING, ERROR
+    CONSOLE_MAX_LINES: int = 5000  # ältere Zeilen verwirft das Dokument selbst; 0 = unbegrenzt
 
 def _expand_env(p: str) -> str:
     try: return os.path.expandvars(p)
@@ -158,78 +269,137 @@ def _is_abs(p: str) -> bool:
     except Exception:
         return False
 
+CONFIG_CANDIDATES = ("grid.config.json", "config.supportcockpit.json", "config.json")
+_CONFIG_FLAGS = frozenset(("--config", "-configpath"))
+
+def _first_candidate(d: str) -> str:
+    for n in CONFIG_CANDIDATES:
+        p = os.path.join(d, n)
+        if os.path.isfile(p): return p
+    return ""
+
+@functools.lru_cache(maxsize=8)
+def _discover_config_path_cached(argv: Tuple[str, ...], base_dir: str) -> str:
+    argv_iter = iter(argv)
+    for a in argv_iter:
+        if a.lower() in _CONFIG_FLAGS:
+            c = next(argv_iter, None)
+            if c is None:
+                break
+            c = os.path.abspath(c)
+            if os.path.isdir(c):
+                return _first_candidate(c)
+            return c if os.path.isfile(c) else ""
+    return _first_candidate(base_dir)
+
 def _discover_config_path(argv: List[str], base_dir: str) -> str:
     # In PyInstaller EXE, use the directory where the EXE is located
     if getattr(sys, 'frozen', False):
         # Running as PyInstaller EXE
         base_dir = os.path.dirname(sys.executable)
-    
-    for i,a in enumerate(argv):
-        if a.lower() in ("--config","-configpath"):
-            if i+1 < len(argv):
-                c = os.path.abspath(argv[i+1])
-                if os.path.isdir(c):
-                    for n in ("grid.config.json","config.supportcockpit.json","config.json"):
-                        p=os.path.join(c,n)
-                        if os.path.isfile(p): return p
-                    return ""
-                return c if os.path.isfile(c) else ""
-    for n in ("grid.config.json","config.supportcockpit.json","config.json"):
-        p=os.path.join(base_dir,n)
-        if os.path.isfile(p): return p
-    return ""
+    return _discover_config_path_cached(tuple(argv), base_dir)
+
+# Parsed config cache: abs path -> (st_mtime_ns, st_size, payload)
+_JSON_CACHE: Dict[str, Tuple[int, int, dict]] = {}
+_CFG_CACHE: Dict[str, Tuple[int, int, Config, Config]] = {}
+
+def _stat_key(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
 
 def _load_json(path: str) -> dict:  # type: ignore
-    with open(path, "r", encoding="utf-8") as f: return json.load(f)
+    """Load JSON once per file version; unchanged files are served from _JSON_CACHE."""
+    path = os.path.abspath(path)
+    mtime, size = _stat_key(path)
+    hit = _JSON_CACHE.get(path)
+    if hit and hit[0] == mtime and hit[1] == size:
+        return hit[2]
+    with open(path, "r", encoding="utf-8") as f: j = json.load(f)
+    _JSON_CACHE[path] = (mtime, size, j)
+    return j
+
+def load_config(path: str, base_cfg: Config) -> Config:
+    """Return the fully applied Config for path, memoized on (mtime_ns, size)."""
+    path = os.path.abspath(path)
+    mtime, size = _stat_key(path)
+    hit = _CFG_CACHE.get(path)
+    if hit and hit[0] == mtime and hit[1] == size and hit[2] == base_cfg:
+        return hit[3]
+    cfg = apply_json_overrides(base_cfg, _load_json(path))
+    _CFG_CACHE[path] = (mtime, size, base_cfg, cfg)
+    return cfg
+
+def _set_dir(acc: Dict[str, Any], k: str, v: Any):
+    if isinstance(v, str) and v:
+        expanded = _expand_env(v)
+        # Für SCRIPTS_DIR: Auflösung zu absolutem Pfad
+        if k == "SCRIPTS_DIR" and expanded.startswith("./"):
+            if getattr(sys, 'frozen', False):
+                # Running as PyInstaller EXE
+                script_dir = os.path.dirname(sys.executable)
+            else:
+                # Running as script
+                script_dir = os.path.dirname(os.path.abspath(__file__))
+            expanded = os.path.join(script_dir, expanded[2:])
+            expanded = os.path.abspath(expanded)
+        acc[k] = expanded
+
+def _set_rr(acc: Dict[str, Any], k: str, v: Any):
+    if isinstance(v, list) and len(v) >= 3:
+        acc[k] = tuple(str(v[i]) for i in range(3))
+
+def _set_float(acc: Dict[str, Any], k: str, v: Any):
+    if isinstance(v, (int,float)):
+        acc[k] = float(v)
+
+def _set_int(acc: Dict[str, Any], k: str, v: Any):
+    if isinstance(v, int):
+        acc[k] = int(v)
+
+def _set_str(acc: Dict[str, Any], k: str, v: Any):
+    if isinstance(v, str):
+        acc[k] = v
+
+def _set_stripped(acc: Dict[str, Any], k: str, v: Any):
+    if isinstance(v, str) and v:
+        acc[k] = v.strip()
+
+# JSON-Schlüssel -> Handler; apply_json_overrides läuft einmal über j
+_OVERRIDE_HANDLERS: Dict[str, Callable[[Dict[str, Any], str, Any], None]] = {
+    "TOOLS_DIR": _set_dir,
+    "SCRIPTS_DIR": _set_dir,
+    "LOCAL_LOG_DIR": _set_dir,
+    "CENTRAL_LOG_DIR": _set_dir,
+    "RR_ORDER": _set_rr,
+    "FILL_RATIO": _set_float,
+    "EDGE_MARGIN_RATIO": _set_float,
+    "MAX_TOOL_BUTTONS": _set_int,
+    "BUTTON_COLUMNS": _set_int,
+    "BASELINE_DELAY_MS": _set_int,
+    "CONSOLE_MAX_LINES": _set_int,
+    "GUI_START_QUADRANT": _set_str,
+    "DEFAULT_CLUSTER": _set_stripped,
+}
 
 def apply_json_overrides(cfg: Config, j: dict) -> Config:
-    c = cfg
-    for key, attr in [
-        ("TOOLS_DIR","TOOLS_DIR"), ("SCRIPTS_DIR","SCRIPTS_DIR"),
-        ("LOCAL_LOG_DIR","LOCAL_LOG_DIR"), ("CENTRAL_LOG_DIR","CENTRAL_LOG_DIR")
-    ]:
-        v = j.get(key)
-        if isinstance(v, str) and v:
-            expanded = _expand_env(v)
-            # Für SCRIPTS_DIR: Auflösung zu absolutem Pfad
-            if attr == "SCRIPTS_DIR" and expanded.startswith("./"):
-                if getattr(sys, 'frozen', False):
-                    # Running as PyInstaller EXE
-                    script_dir = os.path.dirname(sys.executable)
-                else:
-                    # Running as script
-                    script_dir = os.path.dirname(os.path.abspath(__file__))
-                expanded = os.path.join(script_dir, expanded[2:])
-                expanded = os.path.abspath(expanded)
-            c = replace(c, **{attr: expanded})  # type: ignore
-
-    if isinstance(j.get("RR_ORDER"), list) and len(j["RR_ORDER"]) >= 3:
-        rr = tuple(str(j["RR_ORDER"][i]) for i in range(3))
-        c = replace(c, RR_ORDER=rr)  # type: ignore
-    if isinstance(j.get("FILL_RATIO"), (int,float)):
-        c = replace(c, FILL_RATIO=float(j["FILL_RATIO"]))
-    if isinstance(j.get("EDGE_MARGIN_RATIO"), (int,float)):
-        c = replace(c, EDGE_MARGIN_RATIO=float(j["EDGE_MARGIN_RATIO"]))
-    if isinstance(j.get("MAX_TOOL_BUTTONS"), int):
-        c = replace(c, MAX_TOOL_BUTTONS=int(j["MAX_TOOL_BUTTONS"]))
-    if isinstance(j.get("BUTTON_COLUMNS"), int):
-        c = replace(c, BUTTON_COLUMNS=int(j["BUTTON_COLUMNS"]))
-    if isinstance(j.get("GUI_START_QUADRANT"), str):
-        c = replace(c, GUI_START_QUADRANT=str(j["GUI_START_QUADRANT"]))
-
+    # Overrides sammeln und Config nur einmal neu bauen
+    overrides: Dict[str, Any] = {}
+    handlers = _OVERRIDE_HANDLERS
+    for k, v in j.items():
+        h = handlers.get(k)
+        if h is not None:
+            h(overrides, k, v)
+
+    # BASELINE_PATH gegen die (überschriebenen) Verzeichnisse auflösen
     bp = j.get("BASELINE_PATH")
-    if isinstance(bp, str) and bp:
-        c = replace(c, BASELINE_PATH=resolve_path(c, bp, "ps1"))
-    else:
-        c = replace(c, BASELINE_PATH=resolve_path(c, "Baseline.ps1", "ps1"))
-    if isinstance(j.get("BASELINE_DELAY_MS"), int):
-        c = replace(c, BASELINE_DELAY_MS=int(j["BASELINE_DELAY_MS"]))
-
-    dc = j.get("DEFAULT_CLUSTER")
-    if isinstance(dc, str) and dc:
-        c = replace(c, DEFAULT_CLUSTER=dc.strip())
+    overrides["BASELINE_PATH"] = _resolve_in_dirs(
+        overrides.get("SCRIPTS_DIR", cfg.SCRIPTS_DIR),
+        overrides.get("TOOLS_DIR", cfg.TOOLS_DIR),
+        bp if isinstance(bp, str) and bp else "Baseline.ps1",
+        "ps1",
+    )
 
-    return c
+    return replace(cfg, **overrides)  # type: ignore
 
 def resolve_path(cfg: Config, path: str, path_type: str = "auto") -> str:
     """
@@ -248,6 +418,13 @@ def resolve_path(cfg: Config, path: str, path_type: str = "auto") -> str:
         resolve_path(cfg, "./scripts/Baseline.ps1", "ps1") -> "C:\\Support\\v81\\scripts\\Baseline.ps1"
         resolve_path(cfg, "C:\\Windows\\explorer.exe", "exe") -> "C:\\Windows\\explorer.exe"
     """
+    return _resolve_in_dirs(cfg.SCRIPTS_DIR, cfg.TOOLS_DIR, path, path_type)
+
+_EXT_TO_TYPE = {".ps1": "ps1", ".cmd": "cmd", ".exe": "exe", ".msc": "exe"}
+_SCRIPT_TYPES = frozenset(("ps1", "cmd"))
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_in_dirs(scripts_dir: str, tools_dir: str, path: str, path_type: str = "auto") -> str:
     if not path:
         return path
     
@@ -262,20 +439,16 @@ def resolve_path(cfg: Config, path: str, path_type: str = "auto") -> str:
     if _is_abs(expanded_path):
         return os.path.abspath(expanded_path)
     
-    # Automatische Erkennung des Pfadtyps
+    # Automatische Erkennung des Pfadtyps (Default für unbekannte Typen: exe)
     if path_type == "auto":
-        if expanded_path.lower().endswith((".ps1", ".cmd")):
-            path_type = "ps1" if expanded_path.lower().endswith(".ps1") else "cmd"
-        elif expanded_path.lower().endswith((".exe", ".msc")):
-            path_type = "exe"
-        else:
-            path_type = "exe"  # Default für unbekannte Typen
+        low = expanded_path.lower()
+        path_type = _EXT_TO_TYPE.get(low[low.rfind("."):], "exe")
     
     # Basisverzeichnis bestimmen
-    if path_type in ("ps1", "cmd"):
-        base_dir = cfg.SCRIPTS_DIR
+    if path_type in _SCRIPT_TYPES:
+        base_dir = scripts_dir
     else:
-        base_dir = cfg.TOOLS_DIR
+        base_dir = tools_dir
     
     # UNC-kompatible Pfadauflösung für relative Basisverzeichnisse
     if base_dir.startswith("./"):
@@ -290,62 +463,149 @@ def resolve_path(cfg: Config, path: str, path_type: str = "auto") -> str:
     resolved_path = os.path.join(base_dir, expanded_path)
     return os.path.abspath(resolved_path)
 
-def _resolve_tool_path(cfg: Config, ttype: str, path: str) -> str:
-    p = _expand_env(path or "")
+@functools.lru_cache(maxsize=1024)
+def _expand_env_cached(p: str) -> str:
+    return _expand_env(p)
+
+@functools.lru_cache(maxsize=2048)
+def _resolve_cached(base: str, rel: str, make_abs: bool) -> str:
+    # (Basis, relativer Pfad) -> aufgelöster Pfad; Existenzprüfung nur einmal pro Kombination
+    candidate = os.path.join(base, rel)
+    if not os.path.exists(candidate):
+        return rel
+    return os.path.abspath(candidate) if make_abs else candidate
+
+def _resolve_tool_path_in(scripts_base: str, tools_base: str, ttype: str, path: str) -> str:
+    p = _expand_env_cached(path or "")
     if ttype == "url" or not p:
         return p
     if _is_abs(p):
         return p
     # Für ps1/cmd: Normale Auflösung mit SCRIPTS_DIR
-    if ttype in ("ps1","cmd"):
-        base = cfg.SCRIPTS_DIR
-        candidate = os.path.join(base, p)
-        return os.path.abspath(candidate) if os.path.exists(candidate) else p
+    if ttype in _SCRIPT_TYPES:
+        return _resolve_cached(scripts_base, p, True)
     # Für andere Dateien: Normale Auflösung
-    base = cfg.TOOLS_DIR
-    candidate = os.path.join(base, p)
-    return candidate if os.path.exists(candidate) else p
+    return _resolve_cached(tools_base, p, False)
+
+def _resolve_tool_path(cfg: Config, ttype: str, path: str) -> str:
+    return _resolve_tool_path_in(cfg.SCRIPTS_DIR, cfg.TOOLS_DIR, ttype, path)
 
 def _split_args(argval: Any) -> List[str]:
     if argval is None: return []
     if isinstance(argval, list):
         return [str(x) for x in argval]
     if isinstance(argval, str):
-        s = argval.strip()
-        if not s: return []
-        try:
-            return shlex.split(s)
-        except Exception:
-            return [s]
+        return list(_split_args_str(argval))
     return [str(argval)]
 
-def extract_menus(j: dict, cfg: Config) -> Dict[str, List[Dict[str,Any]]]:
-    menus: Dict[str, List[Dict[str,Any]]] = {}
+_SHLEX_CHARS = frozenset("\"'\\")
+
+@functools.lru_cache(maxsize=512)
+def _split_args_str(argval: str) -> Tuple[str, ...]:
+    s = argval.strip()
+    if not s: return ()
+    # Ohne Quotes/Escapes liefert str.split() dasselbe wie shlex, nur in C
+    if _SHLEX_CHARS.isdisjoint(s):
+        return tuple(s.split())
+    try:
+        return tuple(shlex.split(s))
+    except Exception:
+        return (s,)
+
+@dataclass(frozen=True, slots=True)
+class ToolEntry:
+    """One launcher button; built once per config version, read-only afterwards."""
+    label: str
+    path: str
+    type: str
+    args: Tuple[str, ...] = ()
+    uac: bool = False
+    browser: Optional[str] = None
+    rds_session: bool = False
+    session_detection: bool = False
+    window_placement: Optional[Dict[str, Any]] = None
+    ps_args: str = ""  # args bereits für die PowerShell-Kommandozeile gequotet
+    kind: str = "exe"  # Launch-Handler, siehe _tool_kind / CommandCenter._LAUNCH_DISPATCH
+
+def _tool_kind(ttype: str, path: str, rds_session: bool) -> str:
+    """Classify a tool once at load: ps1, cmd, url, explorer, rds, ps_blank or exe."""
+    low = path.lower()
+    if ttype == "ps1": return "ps1"
+    if ttype == "cmd": return "cmd"
+    if ttype == "url": return "url"
+    if ttype == "exe" or "explorer" in low:
+        if "explorer" in low: return "explorer"
+        return "rds" if rds_session else "exe"
+    # Fallback detection
+    if low.endswith(".ps1"): return "ps1"
+    if low == "cmd:blank": return "cmd"
+    if low == "ps:blank": return "ps_blank"
+    if low.startswith("http"): return "url"
+    return "exe"
+
+def extract_menus(j: dict, cfg: Config) -> Dict[str, Tuple[ToolEntry, ...]]:
+    menus: Dict[str, Tuple[ToolEntry, ...]] = {}
+    scripts_base, tools_base = cfg.SCRIPTS_DIR, cfg.TOOLS_DIR
 
     if isinstance(j.get("TOOLS"), dict):
         for mname, items in j["TOOLS"].items():
             if not isinstance(items, list): continue
-            out: List[Dict[str,Any]] = []
+            out: List[ToolEntry] = []
             for it in items:
                 if not isinstance(it, dict): continue
                 lab = it.get("label") or it.get("name")
-                ttype = (it.get("type") or "").strip().lower()
+                ttype = sys.intern((it.get("type") or "").strip().lower())
                 raw_path = it.get("path") or it.get("Path") or ""
                 if not lab or not raw_path: continue
-                p = _resolve_tool_path(cfg, ttype, raw_path)
-                entry = {"label": lab, "path": p, "type": ttype}
-                if "elevate" in it: entry["uac"] = bool(it.get("elevate", False))
-                if isinstance(it.get("browser"), str):
-                    entry["browser"] = it["browser"].strip().lower()
-                entry["args"] = _split_args(it.get("args"))
-                out.append(entry)
-            menus[mname] = out
+                p = _resolve_tool_path_in(scripts_base, tools_base, ttype, raw_path)
+                browser = it.get("browser")
+                wp = it.get("window_placement")
+                args = tuple(_split_args(it.get("args")))
+                rds = bool(it.get("rds_session", False))
+                out.append(ToolEntry(
+                    label=lab, path=p, type=ttype,
+                    args=args,
+                    ps_args=_quote_ps_args(args),
+                    kind=_tool_kind(ttype, p, rds),
+                    uac=bool(it.get("elevate", False)),
+                    browser=browser.strip().lower() if isinstance(browser, str) else None,
+                    rds_session=rds,
+                    session_detection=bool(it.get("session_detection", False)),
+                    window_placement=wp if isinstance(wp, dict) else None,
+                ))
+            menus[mname] = tuple(out)
+    return menus
+
+# Vorgebaute Menüs pro Dateiversion: (abs path, st_mtime_ns) -> menus
+_MENUS_CACHE: Dict[Tuple[str, int], Dict[str, Tuple[ToolEntry, ...]]] = {}
+
+def load_menus(path: str, cfg: Config) -> Dict[str, Tuple[ToolEntry, ...]]:
+    """Return the extracted menus for path; unchanged files reuse the prebuilt dict."""
+    path = os.path.abspath(path)
+    key = (path, _stat_key(path)[0])
+    hit = _MENUS_CACHE.get(key)
+    if hit is not None:
+        return hit
+    menus = extract_menus(_load_json(path), cfg)
+    for k in [k for k in _MENUS_CACHE if k[0] == path]:
+        del _MENUS_CACHE[k]
+    _MENUS_CACHE[key] = menus
     return menus
 
 def _ts(): return time.strftime("%H:%M:%S")
 
+# Baseline-Zeilen einfärben: ein case-insensitiver Durchlauf statt lower() + drei any()-Scans
+_STYLE_RE = re.compile(r"(?P<err>err|fail)|(?P<warn>warn)|(?P<ok>success|ok|passed|done)", re.IGNORECASE)
+_STYLE_COLOR = {"err": "#ff6b6b", "warn": "#ffd166", "ok": "#06d6a0"}
+# Monotone Uhr für Idle-/TTL-Messungen (springt nicht bei NTP-Korrekturen)
+_now = time.monotonic
+# Maus-Y einmal auflösen: Qt6 hat position(), ältere Bindings nur pos()
+_event_y = ((lambda e: e.position().y()) if hasattr(QMouseEvent, "position")
+            else (lambda e: e.pos().y()))
+
 # Log levels for console filtering
 class LogLevel:
+    __slots__ = ()
     DEBUG = 0
     INFO = 1
     WARNING = 2
@@ -353,12 +613,16 @@ class LogLevel:
     
     @staticmethod
     def from_string(level_str: str) -> int:
-        return {
-            "DEBUG": LogLevel.DEBUG,
-            "INFO": LogLevel.INFO,
-            "WARNING": LogLevel.WARNING,
-            "ERROR": LogLevel.ERROR
-        }.get(level_str.upper(), LogLevel.INFO)
+        return _LEVEL_NUM.get(level_str.upper(), LogLevel.INFO)
+
+_LEVEL_NUM = {"DEBUG": LogLevel.DEBUG, "INFO": LogLevel.INFO,
+              "WARNING": LogLevel.WARNING, "ERROR": LogLevel.ERROR}
+_LEVEL_COLOR = {
+    "DEBUG": "#6c757d",    # Gray
+    "INFO": "#bfe0bf",     # Green (original)
+    "WARNING": "#ffc107",  # Yellow
+    "ERROR": "#dc3545"     # Red
+}
 
 class Logger:
     def __init__(self, local_dir: str, central_dir: Optional[str]):
@@ -367,12 +631,53 @@ class Logger:
         ts=datetime.now().strftime("%Y%m%d_%H%M%S")
         base=f"cockpit_{self.user}_{self.host}_{ts}"
         self.txt=os.path.join(local_dir, base+".log")
+        # Datei-I/O im Hintergrund: UI-Thread stellt nur noch Zeilen in die Queue
+        self._q: SimpleQueue = SimpleQueue()
+        self._t = threading.Thread(target=self._drain, name="cockpit-log", daemon=True)
+        self._t.start()
+
+    FSYNC_INTERVAL_S = 5.0
+
+    # Zeilenende wie zuvor im Textmodus (CRLF unter Windows), auch für \n innerhalb der Meldung
+    EOL = os.linesep
 
     def text(self, msg: str):
-        line=f"[{_ts()}] {msg}"
+        # Bytes vorkodiert → Writer schreibt ohne Codec-Umweg in die Binärdatei
+        line = f"[{_ts()}] {msg}\n"
+        if self.EOL != "\n":
+            line = line.replace("\n", self.EOL)
+        self._q.put_nowait(line.encode("utf-8", "replace"))
+
+    def _drain(self):
         try:
-            with open(self.txt,"a",encoding="utf-8") as f: f.write(line+"\n")
-        except Exception: pass
+            f = open(self.txt, "ab", buffering=1 << 16)
+        except Exception:
+            f = None
+        last_sync = time.monotonic()
+        while True:
+            batch = [self._q.get()]
+            while len(batch) < 256:
+                try: batch.append(self._q.get_nowait())
+                except Empty: break
+            stop = None in batch
+            if f:
+                try:
+                    f.writelines(line for line in batch if line is not None)
+                    f.flush()
+                    now = time.monotonic()
+                    if stop or now - last_sync >= self.FSYNC_INTERVAL_S:
+                        os.fsync(f.fileno())
+                        last_sync = now
+                except Exception: pass
+            if stop: break
+        if f:
+            try: f.close()
+            except Exception: pass
+
+    def close(self):
+        """Flush pending lines and stop the writer thread."""
+        self._q.put(None)
+        self._t.join(timeout=2.0)
 
 def primary_rect_logical() -> QRect:
     return QGuiApplication.primaryScreen().availableGeometry()
@@ -395,17 +700,57 @@ class SHELLEXECUTEINFO(ctypes.Structure):
         ("dwHotKey", wintypes.DWORD), ("hIcon", wintypes.HANDLE), ("hProcess", wintypes.HANDLE),
     ]
 
+# Einmal gebunden, mit argtypes/restype → kein windll-Lookup und kein Default-Marshalling pro Start
+_SHELL32 = ctypes.WinDLL("shell32", use_last_error=True)
+_KERNEL32 = ctypes.WinDLL("kernel32", use_last_error=True)
+_ShellExecuteExW = _SHELL32.ShellExecuteExW
+_ShellExecuteExW.argtypes = [ctypes.POINTER(SHELLEXECUTEINFO)]
+_ShellExecuteExW.restype = wintypes.BOOL
+_GetProcessId = _KERNEL32.GetProcessId
+_GetProcessId.argtypes = [wintypes.HANDLE]
+_GetProcessId.restype = wintypes.DWORD
+_CloseHandle = _KERNEL32.CloseHandle
+_CloseHandle.argtypes = [wintypes.HANDLE]
+_CloseHandle.restype = wintypes.BOOL
+_OLE32 = ctypes.WinDLL("ole32")
+_CoInitializeEx = _OLE32.CoInitializeEx
+_CoInitializeEx.argtypes = [wintypes.LPVOID, wintypes.DWORD]
+_CoInitializeEx.restype = ctypes.c_long
+_CoUninitialize = _OLE32.CoUninitialize
+_CoUninitialize.argtypes = []
+_CoUninitialize.restype = None
+COINIT_APARTMENTTHREADED = 0x2
+COINIT_DISABLE_OLE1DDE = 0x4
+_USER32 = ctypes.WinDLL("user32", use_last_error=True)
+_RegisterShellHookWindow = _USER32.RegisterShellHookWindow
+_RegisterShellHookWindow.argtypes = [wintypes.HWND]
+_RegisterShellHookWindow.restype = wintypes.BOOL
+_DeregisterShellHookWindow = _USER32.DeregisterShellHookWindow
+_DeregisterShellHookWindow.argtypes = [wintypes.HWND]
+_DeregisterShellHookWindow.restype = wintypes.BOOL
+_RegisterWindowMessageW = _USER32.RegisterWindowMessageW
+_RegisterWindowMessageW.argtypes = [wintypes.LPCWSTR]
+_RegisterWindowMessageW.restype = wintypes.UINT
+HSHELL_WINDOWCREATED = 1
+# Hidden-Console (CREATE_NO_WINDOW) schreibt in der OEM-Codepage, die Baseline-Reader dekodieren damit
+_KERNEL32.GetOEMCP.restype = wintypes.UINT
+_OEM_ENCODING = f"cp{_KERNEL32.GetOEMCP()}"
+try:
+    codecs.lookup(_OEM_ENCODING)
+except LookupError:
+    _OEM_ENCODING = "utf-8"
+
 def _shell_run(verb:str, file:str, params:str, cwd:Optional[str]=None):
     sei=SHELLEXECUTEINFO(); sei.cbSize=ctypes.sizeof(SHELLEXECUTEINFO)
     sei.fMask=SEE_MASK_NOCLOSEPROCESS; sei.hwnd=None; sei.lpVerb=verb
     sei.lpFile=file; sei.lpParameters=params; sei.lpDirectory=cwd or None
     sei.nShow=win32con.SW_SHOWNORMAL
-    ok=ctypes.windll.shell32.ShellExecuteExW(ctypes.byref(sei))
+    ok=_ShellExecuteExW(ctypes.byref(sei))
     if not ok: return False, None, f"ShellExecuteExW failed ({verb})"
     pid=None
     if sei.hProcess:
-        pid=int(ctypes.windll.kernel32.GetProcessId(sei.hProcess)) or None
-        ctypes.windll.kernel32.CloseHandle(sei.hProcess)
+        pid=int(_GetProcessId(sei.hProcess)) or None
+        _CloseHandle(sei.hProcess)
     return True, pid, None
 
 def try_start_exe(path: str, args: List[str]|None=None, cwd: Optional[str]=None):
@@ -426,24 +771,100 @@ def try_start_exe_uac(path:str, args:List[str]|None=None, cwd:Optional[str]=None
     ok,pid,err=_shell_run("runas", path, " ".join(args), cwd)
     return (ok, pid, True, err if not ok else None)
 
+@functools.lru_cache(maxsize=64)
 def which(*names: str) -> str:
+    # PATH-Scan einmal pro Prozess; Ergebnis ist für die Sitzung invariant
     for n in names:
         p = shutil.which(n)
         if p: return p
     return ""
 
+# Prozess-invariant: einmal lesen statt pro Start
+_USERNAME = os.environ.get("USERNAME", "User")
+_COMPUTERNAME = os.environ.get("COMPUTERNAME", "Host")
+_EXPLORER_PATH = os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "explorer.exe")
+
+# Reihenfolge = Priorität für isolierte URL-Starts
+_BROWSER_CANDIDATES = (
+    ("edge", "msedge.exe", r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe"),
+    ("chrome", "chrome.exe", r"C:\Program Files\Google\Chrome\Application\chrome.exe"),
+    ("firefox", "firefox.exe", r"C:\Program Files\Mozilla Firefox\firefox.exe"),
+)
+
+@functools.lru_cache(maxsize=1)
+def _resolve_browser() -> Optional[Tuple[str, str]]:
+    # PATH-Suche + Standardpfade nur beim ersten URL-Start
+    for name, exe, fallback in _BROWSER_CANDIDATES:
+        for path in (which(exe), fallback):
+            if path and os.path.exists(path):
+                return path, name
+    return None
+
+# Heuristiken für die exe-basierte Platzierung: Image-Namen, Fensterklassen, Titel-Hinweise
+_TASKMGR_IMAGES = frozenset(("taskmgr.exe", "taskmanager.exe"))
+_BROWSER_IMAGES = frozenset(("msedge.exe", "chrome.exe", "firefox.exe"))
+_EVENTVWR_IMAGES = frozenset(("eventvwr.exe", "mmc.exe"))
+
+@functools.lru_cache(maxsize=256)
+def _classify_exe(exe_path: str) -> Tuple[str, frozenset, frozenset, Tuple[str, ...]]:
+    # Tool-Pfade sind ein fester Satz: Klassifikation einmal pro exe
+    exe_name = os.path.basename(exe_path).lower()
+    if exe_name in _TASKMGR_IMAGES:
+        return exe_name, frozenset((exe_name,)), frozenset(("TaskManagerWindow",)), ("task manager", "taskmanager")
+    if exe_name in _BROWSER_IMAGES:
+        return exe_name, _BROWSER_IMAGES, frozenset(("Chrome_WidgetWin_1", "MozillaWindowClass", "ApplicationFrameWindow")), ()
+    if exe_name in _EVENTVWR_IMAGES:
+        return exe_name, frozenset((exe_name,)), frozenset(("MMCMainFrame",)), ("event viewer", "ereignisanzeige")
+    return exe_name, frozenset((exe_name,)), frozenset(), ()
+
+@functools.lru_cache(maxsize=1)
+def _current_session_id() -> int:
+    # Die Session eines Prozesses ändert sich nicht
+    try:
+        import win32ts
+        return win32ts.WTSGetCurrentSessionId()
+    except Exception:
+        return 0
+
+@functools.lru_cache(maxsize=128)
+def _resolve_script(path: str) -> Tuple[str, bool, str]:
+    # Skriptpfad pro Tool stabil; Cache wird beim Config-Reload geleert
+    ap = os.path.abspath(path)
+    return ap, os.path.isfile(ap), os.path.dirname(ap)
+
+@functools.lru_cache(maxsize=1)
+def _ps_exe() -> str:
+    return which("pwsh.exe", "powershell.exe") or r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe"
+
 def build_cmd_command(title:str, run_after:Optional[str]=None, keep_open:bool=True) -> List[str]:
     args = ["cmd.exe", "/K" if keep_open else "/C", f"title {title}"]
     if run_after: args[-1] = args[-1] + f" & {run_after}"
     return args
 
+# Statischer Teil der elevated -Command Zeile
+_PS_CMD_PREFIX = sys.intern("-NoLogo -NoProfile -ExecutionPolicy Bypass -NoExit -Command ")
+
+def _quote_ps_args(args) -> str:
+    return " ".join(shlex.quote(a) for a in args) if args else ""
+
+# Parameternamen (-Name / -Name:) bleiben nackt, alles andere wird ein PowerShell-Literal
+_PS_PARAM_NAME = re.compile(r"-[A-Za-z_]\w*:?\Z")
+_PS_SINGLE_QUOTES = re.compile("(['\u2018\u2019\u201a\u201b])")
+
+def _ps_literal(arg: str) -> str:
+    """One argv entry as a PowerShell token (single-quoted, embedded quotes doubled)."""
+    if _PS_PARAM_NAME.match(arg):
+        return arg
+    return "'" + _PS_SINGLE_QUOTES.sub(r"\1\1", arg) + "'"
+
 def build_ps_command(script_path: Optional[str], title: str,
                      extra_args: Optional[List[str]] = None,
-                     keep_open: bool = True) -> List[str]:
-    extra_args = extra_args or []
-    ps = which("pwsh.exe", "powershell.exe") or r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe"
+                     keep_open: bool = True, quoted_args: Optional[str] = None) -> List[str]:
+    ps = _ps_exe()
     if script_path:
-        cmd = f"[Console]::OutputEncoding=[System.Text.Encoding]::UTF8; [Console]::InputEncoding=[System.Text.Encoding]::UTF8; chcp 65001 > $null; $Host.UI.RawUI.WindowTitle='{title}'; & '{script_path}' " + " ".join(map(shlex.quote, extra_args))
+        if quoted_args is None:
+            quoted_args = _quote_ps_args(extra_args)
+        cmd = f"[Console]::OutputEncoding=[System.Text.Encoding]::UTF8; [Console]::InputEncoding=[System.Text.Encoding]::UTF8; chcp 65001 > $null; $Host.UI.RawUI.WindowTitle='{title}'; & '{script_path}' {quoted_args}"
     else:
         cmd = f"[Console]::OutputEncoding=[System.Text.Encoding]::UTF8; [Console]::InputEncoding=[System.Text.Encoding]::UTF8; chcp 65001 > $null; $Host.UI.RawUI.WindowTitle='{title}'"
     args = [ps, "-NoLogo", "-NoProfile", "-ExecutionPolicy", "Bypass"]
@@ -454,9 +875,53 @@ def build_ps_command(script_path: Optional[str], title: str,
 def spawn_console(args: List[str], cwd: Optional[str]=None) -> subprocess.Popen:
     return subprocess.Popen(args, creationflags=CREATE_NEW_CONSOLE, cwd=cwd)
 
+class _LaunchBus(QObject):
+    # (callback, result, exception) → im GUI-Thread zugestellt (queued, da aus Worker emittiert)
+    finished = Signal(object)
+
+class _BaselineBus(QObject):
+    # Reader-Threads → GUI-Thread (queued): (Zeilen eines Pipe-Reads, stderr?) und Exit-Code nach dem letzten Byte
+    lines = Signal(list, bool)
+    finished = Signal(int)
+
+class _LaunchTask(QRunnable):
+    """Run a blocking launch (Popen / ShellExecuteEx) on the thread pool."""
+    def __init__(self, fn, bus: _LaunchBus, on_done):
+        super().__init__()
+        self._fn = fn
+        self._bus = bus
+        self._on_done = on_done
+
+    def run(self):
+        # ShellExecuteEx erwartet COM im aufrufenden Thread (STA)
+        com = _CoInitializeEx(None, COINIT_APARTMENTTHREADED | COINIT_DISABLE_OLE1DDE) in (0, 1)
+        try:
+            res, err = self._fn(), None
+        except Exception as e:
+            res, err = None, e
+        finally:
+            if com: _CoUninitialize()
+        self._bus.finished.emit((self._on_done, res, err))
+
+# Fensterklassen / Images für Snapshot-Platzierung (einmal gebaut, direkt als Set übergeben)
+_BROWSER_CLASSES = frozenset(("Chrome_WidgetWin_1", "MozillaWindowClass", "ApplicationFrameWindow"))
+_MMC_CLASSES = frozenset(("MMCMainFrame",))
+_MMC_IMAGES = frozenset(("mmc.exe",))
+_EXPLORER_CLASSES = frozenset(("CabinetWClass", "ExploreWClass", "ApplicationFrameWindow"))
+_EXPLORER_IMAGES = frozenset(("explorer.exe",))
+
+_CONSOLE_CLASSES = frozenset(("ConsoleWindowClass", "VirtualConsoleClass"))
+
+EVENT_OBJECT_LOCATIONCHANGE = 0x800B  # WinEvent-ID, wie in window_utils
+EVENT_OBJECT_NAMECHANGE = 0x800C
+
 class AppState:
-    def __init__(self, cfg: Config, menus: Dict[str, List[Dict[str,Any]]], start_menu: str):
+    __slots__ = ("cfg", "logger", "menus", "menu_name", "rr_index", "config_path")
+
+    def __init__(self, cfg: Config, menus: Dict[str, Tuple[ToolEntry, ...]], start_menu: str,
+                 config_path: str = ""):
         self.cfg = cfg
+        self.config_path = config_path
         os.makedirs(cfg.LOCAL_LOG_DIR, exist_ok=True)
         self.logger = Logger(cfg.LOCAL_LOG_DIR, cfg.CENTRAL_LOG_DIR)
         self.menus = menus
@@ -468,8 +933,8 @@ class AppState:
         self.rr_index = (self.rr_index+1) % len(self.cfg.RR_ORDER)
         return q
     
-    def tools_for_current(self) -> List[Dict[str,Any]]:
-        return list(self.menus.get(self.menu_name, []))
+    def tools_for_current(self) -> Tuple[ToolEntry, ...]:
+        return self.menus.get(self.menu_name, ())
 
 def _btn_style() -> str:
     return (
@@ -478,17 +943,182 @@ def _btn_style() -> str:
         "QToolButton:hover{background:#343a41;}"
     )
 
+_QSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_QSS_WS = re.compile(r"\s+")
+_QSS_PUNCT_WS = re.compile(r"\s*([{}:;,()])\s*")
+
+def _compact_qss(qss: str) -> str:
+    """Strip comments and redundant whitespace once at import, so Qt tokenizes fewer bytes."""
+    qss = _QSS_COMMENT.sub("", qss)
+    qss = _QSS_WS.sub(" ", qss)
+    return _QSS_PUNCT_WS.sub(r"\1", qss).strip()
+
+# Ein Stylesheet für das ganze Fenster (Selektoren per objectName), einmal beim Import aufbereitet.
+# Der Chrome-Puls läuft über die Property "boost" (Alpha-Bin) statt über neue Sheets.
+_CHROME_ALPHA_STEP = 4
+_CHROME_BOOST_BINS = tuple(range(60, 101, _CHROME_ALPHA_STEP))
+
+_CHROME_QSS = _compact_qss("""
+    QWidget#chrome {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(26, 26, 46, 180), stop:0.2 rgba(22, 33, 62, 160), stop:0.5 rgba(15, 52, 96, 140), stop:0.8 rgba(22, 33, 62, 160), stop:1 rgba(26, 26, 46, 180)
+        );
+        border-radius: 16px;
+    }
+    QSplitter#split::handle {
+        background: transparent;
+        margin: 0px;
+        height: 1px;
+    }
+    """)
+
+_CHROME_BORDER_TEMPLATE = """
+    QWidget#chrome[boost="{a}"] {{
+        border: 1px solid qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 rgba(74, 144, 226, {a}), 
+            stop:0.3 rgba(123, 179, 240, {a}), 
+            stop:0.7 rgba(123, 179, 240, {a}), 
+            stop:1 rgba(74, 144, 226, {a})
+        );
+    }}
+    """
+
+def _chrome_bucket(border_boost: float) -> str:
+    """Boost 0..1 → Wert der "boost"-Property (Alpha 60..100, auf _CHROME_ALPHA_STEP gerastert)."""
+    glow_intensity = int(60 + (40 * max(0.0, min(1.0, border_boost))))
+    return str(min(255, glow_intensity) // _CHROME_ALPHA_STEP * _CHROME_ALPHA_STEP)
+
+_CHROME_BOOST_QSS = "".join(_compact_qss(_CHROME_BORDER_TEMPLATE.format(a=a)) for a in _CHROME_BOOST_BINS)
+
+# Sinus-Tabelle für den Puls: 256 Einträge, Index in 1/256 Umdrehung.
+# Phase läuft ganzzahlig 0.._PHASE_STEPS-1 (≈ 2π / 0.05); die Faktoren bilden
+# sin(phase_rad * k) als (n * M) >> 8 ab, M = round(0.05 * k * 256/(2π) * 256).
+_SIN_LUT = tuple(math.sin(2 * math.pi * i / 256) for i in range(256))
+_PHASE_STEPS = 126
+_PULSE_M_CHROME = 156   # k = 0.3
+_PULSE_M_BUTTON = 209   # k = 0.4
+_PULSE_M_CONSOLE = 104  # k = 0.2
+
+_HEADER_QSS = _compact_qss("""
+    QLabel#hdr { 
+        color: #e8f4fd; 
+        font-weight: 700; 
+        font-size: 14px;
+        /* text-shadow: 0 0 10px #e8f4fd; */  /* Qt doesn't support text-shadow */
+    }
+    QLabel#hdrsub { 
+        color: #7bb3f0; 
+        font-weight: 500; 
+        font-size: 12px;
+        /* text-shadow: 0 0 5px #7bb3f0; */  /* Qt doesn't support text-shadow */
+    }
+    """)
+
+_COMBO_QSS = _compact_qss("""
+    QComboBox#menucombo {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 #1a1a2e, stop:0.3 #16213e, stop:0.7 #0f3460, stop:1 #1a1a2e
+        );
+        color: #e8f4fd;
+        border: 1px solid qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 rgba(74, 144, 226, 120), stop:0.5 rgba(123, 179, 240, 100), stop:1 rgba(74, 144, 226, 120)
+        );
+        border-radius: 10px;
+        padding: 6px 10px;
+        min-width: 160px;
+        font-weight: 500;
+    }
+    QComboBox#menucombo::drop-down { 
+        width: 0px; 
+        border: none;
+        background: transparent;
+    }
+    QComboBox#menucombo::drop-down:hover {
+        background: transparent;
+    }
+    QComboBox#menucombo:hover { 
+        border: 1px solid rgba(123, 179, 240, 150);
+        color: #f0f8ff;
+    }
+    QComboBox QAbstractItemView {
+        background: #1a1a2e;
+        color: #e8f4fd;
+        selection-background-color: #4a90e2;
+        selection-color: #ffffff;
+        border: 1px solid rgba(123, 179, 240, 120);
+        border-radius: 8px;
+        padding: 4px;
+    }
+    QComboBox QAbstractItemView::item {
+        padding: 6px 10px;
+        border-radius: 4px;
+    }
+    QComboBox QAbstractItemView::item:hover {
+        background: #1a1a1a;
+        color: #00ffff;
+    }
+    """)
+
+_CONSOLE_QSS = _compact_qss("""
+    QTextEdit#console {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 #0a0a0a, stop:0.3 #1a1a1a, stop:0.7 #0f0f0f, stop:1 #0a0a0a
+        );
+        color: #00ff41;
+        border: 1px solid qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 rgba(74, 144, 226, 120), stop:0.5 rgba(123, 179, 240, 100), stop:1 rgba(74, 144, 226, 120)
+        );
+        border-radius: 12px;
+        font-family: 'Consolas', 'Cascadia Mono', 'Courier New', monospace;
+        font-size: 11px;
+        padding: 12px;
+        selection-background-color: #00ff41;
+        selection-color: #000000;
+    }
+    QTextEdit#console::scrollbar:vertical {
+        background: #1a1a1a;
+        width: 14px;
+        border-radius: 7px;
+        border: 1px solid #00ff41;
+    }
+    QTextEdit#console::scrollbar::handle:vertical {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #4a90e2, stop:0.5 #7bb3f0, stop:1 #4a90e2
+        );
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    QTextEdit#console::scrollbar::handle:vertical:hover {
+        background: #00ffff;
+    }
+    QTextEdit#console::scrollbar::add-line:vertical,
+    QTextEdit#console::scrollbar::sub-line:vertical {
+        height: 0px;
+    }
+    """)
+
+_WINDOW_QSS = _CHROME_QSS + _CHROME_BOOST_QSS + _HEADER_QSS + _COMBO_QSS + _CONSOLE_QSS
+
 class NeonButton(QToolButton):
-    def __init__(self, text: str, square: Optional[int] = None):
-        super().__init__(text=text)
-        self.setCursor(Qt.PointingHandCursor)
-        s = square or 0
-        if s > 0:
-            self.setFixedSize(s, s)
-        else:
-            self.setMinimumSize(132, 40)
-        self._install_futuristic_effects()
-        self.setStyleSheet("""
+    # Geteilte Glow-Pixmaps: (w, h, dpr, glow_alpha, outer_alpha) -> QPixmap
+    _GLOW_CACHE: Dict[Tuple[int, int, float, int, int], QPixmap] = {}
+
+    # Alle lebenden Buttons für den gemeinsamen Puls-Tick
+    _instances: "weakref.WeakSet[NeonButton]" = weakref.WeakSet()
+    _BASE_GLOW = 100
+    _BASE_OUTER = 50
+    # Gemeinsamer Puls-Glow aller Buttons (glow_alpha, outer_alpha); pro Tick einmal gesetzt
+    _shared_glow: Tuple[int, int] = (_BASE_GLOW, _BASE_OUTER)
+
+    # Einmal pro QApplication gesetzt (Selektor QToolButton#neon), nicht pro Button
+    STYLE = _compact_qss("""
         QToolButton {
             background: qlineargradient(
                 x1:0, y1:0, x2:1, y2:1,
@@ -522,270 +1152,104 @@ class NeonButton(QToolButton):
             border: 1px solid rgba(74, 144, 226, 100);
             color: #c8e6f5;
         }
-        """)
-        
-        # Force style refresh
-        self.style().unpolish(self)
-        self.style().polish(self)
-        self.update()
+    """)
+
+    def __init__(self, text: str, square: Optional[int] = None):
+        super().__init__(text=text)
+        self.setObjectName("neon")
+        self.setCursor(Qt.PointingHandCursor)
+        s = square or 0
+        if s > 0:
+            self.setFixedSize(s, s)
+        else:
+            self.setMinimumSize(132, 40)
+        self._install_futuristic_effects()
+
+    @classmethod
+    def app_style(cls) -> str:
+        return cls.STYLE.replace("QToolButton", "QToolButton#neon")
 
     def _install_futuristic_effects(self):
-        """Install holographic glow and shadow effects with animation support."""
-        # Primary glow effect (animatable)
-        self.glow = QGraphicsDropShadowEffect(self)
-        self.glow.setBlurRadius(20)
-        self.glow.setOffset(0, 0)
-        self.glow.setColor(QColor(74, 144, 226, 100))  # Chrome blue with transparency
-        self.setGraphicsEffect(self.glow)
-        
-        # Secondary outer glow for depth (animatable)
-        self.outer_glow = QGraphicsDropShadowEffect(self)
-        self.outer_glow.setBlurRadius(35)
-        self.outer_glow.setOffset(0, 0)
-        self.outer_glow.setColor(QColor(123, 179, 240, 50))  # Light blue outer glow
-        self.setGraphicsEffect(self.outer_glow)
-        
-        # Store base values for animation
-        self._base_glow_intensity = 100
-        self._base_outer_intensity = 50
+        """Install painted holographic glow (no QGraphicsEffect → no offscreen rendering)."""
+        self._glow: Optional[Tuple[int, int]] = None  # Eigener Wert statt _shared_glow (selten)
+        NeonButton._instances.add(self)
+
+    @classmethod
+    def _glow_alphas(cls, pulse_intensity: float) -> Tuple[int, int]:
+        glow_alpha = min(255, int(cls._BASE_GLOW * (0.8 + 0.4 * pulse_intensity)))
+        outer_alpha = min(255, int(cls._BASE_OUTER * (0.6 + 0.8 * pulse_intensity)))
+        return glow_alpha, outer_alpha
+
+    @classmethod
+    def _tick_all(cls, pulse_intensity: float):
+        """Swap the shared glow once and repaint each button parent (children repaint with it)."""
+        glow = cls._glow_alphas(pulse_intensity)
+        if glow == cls._shared_glow:
+            return
+        cls._shared_glow = glow
+        parents = set()
+        for btn in list(cls._instances):
+            if btn._glow is not None:
+                continue
+            parent = btn.parentWidget()
+            if parent is None:
+                btn.update()
+            elif parent not in parents:
+                parents.add(parent)
+                parent.update()
 
     def _update_glow(self, pulse_intensity):
         """Update glow effects with pulsing animation - CPU efficient."""
-        try:
-            # Calculate animated intensities
-            glow_alpha = int(self._base_glow_intensity * (0.8 + 0.4 * pulse_intensity))
-            outer_alpha = int(self._base_outer_intensity * (0.6 + 0.8 * pulse_intensity))
-            
-            # Update glow colors
-            self.glow.setColor(QColor(74, 144, 226, min(255, glow_alpha)))
-            self.outer_glow.setColor(QColor(123, 179, 240, min(255, outer_alpha)))
-            
-        except Exception:
-            # Silent fail for VDI compatibility
-            pass
-
-    def _init_hotkeys(self):
-        """Initialize hotkey system for window management."""
-        # Track last active window for round-robin placement
-        self._last_active_window = None
-        self._last_active_pid = None
-        
-        # Enable key events
-        self.setFocusPolicy(Qt.StrongFocus)
-        
-    def keyPressEvent(self, event):
-        """Handle hotkey presses for window management."""
-        try:
-            # Check for Ctrl+Number combinations
-            if event.modifiers() == Qt.ControlModifier:
-                if event.key() == Qt.Key_0:
-                    self._center_gui()
-                    event.accept()
-                    return
-                elif event.key() == Qt.Key_1:
-                    self._place_last_window("TL")
-                    event.accept()
-                    return
-                elif event.key() == Qt.Key_2:
-                    self._place_last_window("TR")
-                    event.accept()
-                    return
-                elif event.key() == Qt.Key_3:
-                    self._place_last_window("BL")
-                    event.accept()
-                    return
-                    
-        except Exception as e:
-            self._log(f"Hotkey error: {e}")
-            
-        # Call parent keyPressEvent for other keys
-        super().keyPressEvent(event)
-
-    def _center_gui(self):
-        """Center the GUI window in its configured start quadrant."""
-        try:
-            # Get primary screen geometry
-            screen = QApplication.primaryScreen()
-            screen_geometry = screen.availableGeometry()
-            
-            # Get configured start quadrant (default: TR)
-            quadrant = getattr(self.cfg, 'GUI_START_QUADRANT', 'TR')
-            
-            # Calculate quadrant dimensions with DPI scaling
-            margin = int(screen_geometry.width() * self.cfg.EDGE_MARGIN_RATIO)
-            
-            # Get DPI scaling factor
-            dpi_scale = screen.devicePixelRatio()
-            logical_dpi = screen.logicalDotsPerInch()
-            scale_factor = logical_dpi / 96.0  # 96 DPI is standard
-            
-            # Calculate scaled dimensions based on screen size
-            if screen_geometry.width() <= 1920:  # 1080p or smaller
-                w = int(screen_geometry.width() * 0.6) - margin  # 60% for smaller screens
-                h = int(screen_geometry.height() * 0.7) - margin  # 70% height for better visibility
-            else:  # 4K or larger
-                w = int(screen_geometry.width() * 0.4) - margin  # 40% for larger screens
-                h = int(screen_geometry.height() * 0.5) - margin  # 50% height
-                
-            # Apply minimum and maximum size constraints
-            min_width = int(600 * scale_factor)
-            min_height = int(400 * scale_factor)
-            max_width = int(screen_geometry.width() * 0.8)
-            max_height = int(screen_geometry.height() * 0.8)
-            
-            w = max(min_width, min(w, max_width))
-            h = max(min_height, min(h, max_height))
-            
-            # Calculate position based on quadrant
-            if quadrant == "TL":  # Top-Left
-                x = margin
-                y = margin
-            elif quadrant == "TR":  # Top-Right
-                x = int(screen_geometry.width() * 0.5) + margin
-                y = margin
-            elif quadrant == "BL":  # Bottom-Left
-                x = margin
-                y = int(screen_geometry.height() * 0.5) + margin
-            elif quadrant == "BR":  # Bottom-Right
-                x = int(screen_geometry.width() * 0.5) + margin
-                y = int(screen_geometry.height() * 0.5) + margin
-            else:  # Fallback to TR
-                x = int(screen_geometry.width() * 0.5) + margin
-                y = margin
-                quadrant = "TR"
-            
-            # Center within the quadrant
-            center_x = x + (w - self.width()) // 2
-            center_y = y + (h - self.height()) // 2
-            
-            # Move to quadrant center
-            self.move(center_x, center_y)
-            self._log(f"GUI centered in {quadrant} quadrant at ({center_x}, {center_y})")
-            
-        except Exception as e:
-            self._log(f"Center GUI error: {e}")
-
-    def _place_last_window(self, quadrant):
-        """Place the last active window in the specified quadrant."""
-        try:
-            if not self._last_active_window:
-                self.log("No last active window to place")
-                return
-                
-            # Get window handle and PID
-            hwnd = self._last_active_window
-            pid = self._last_active_pid
-            
-            if not hwnd or not win32gui.IsWindow(hwnd):
-                self.log("Last active window no longer valid")
-                self._last_active_window = None
-                self._last_active_pid = None
-                return
-                
-            # Place window using existing logic
-            if quadrant == "TL":
-                self._place_window_tl(hwnd, pid)
-            elif quadrant == "TR":
-                self._place_window_tr(hwnd, pid)
-            elif quadrant == "BL":
-                self._place_window_bl(hwnd, pid)
-            elif quadrant == "BR":
-                self._place_window_br(hwnd, pid)
-                
-            self.log(f"Last active window placed in {quadrant}")
-            
-        except Exception as e:
-            self.log(f"Place last window error: {e}")
+        self._set_glow(*self._glow_alphas(pulse_intensity))
 
-    def _update_last_active_window(self, hwnd, pid):
-        """Update the last active window for hotkey placement."""
+    def _set_glow(self, glow_alpha: int, outer_alpha: int):
         try:
-            if hwnd and win32gui.IsWindow(hwnd):
-                self._last_active_window = hwnd
-                self._last_active_pid = pid
-                self.log(f"Last active window updated: hwnd={hwnd}, pid={pid}")
+            # Only repaint when the visible glow actually changes
+            if (glow_alpha, outer_alpha) != (self._glow or NeonButton._shared_glow):
+                self._glow = (glow_alpha, outer_alpha)
+                self.update()
         except Exception:
+            # Silent fail for VDI compatibility
             pass
 
-    def _place_window_tl(self, hwnd, pid):
-        """Place window in Top-Left quadrant."""
-        try:
-            # Get screen dimensions
-            screen_width = QApplication.primaryScreen().availableGeometry().width()
-            screen_height = QApplication.primaryScreen().availableGeometry().height()
-            
-            # Calculate TL quadrant dimensions
-            x = int(screen_width * 0.01)  # Edge margin
-            y = int(screen_height * 0.01)  # Edge margin
-            w = int(screen_width * 0.48)   # Half width minus margin
-            h = int(screen_height * 0.48)  # Half height minus margin
-            
-            # Place window
-            win32gui.SetWindowPos(hwnd, 0, x, y, w, h, win32con.SWP_SHOWWINDOW)
-            self.log(f"Window placed TL: ({x}, {y}, {w}, {h})")
-            
-        except Exception as e:
-            self.log(f"TL placement error: {e}")
-
-    def _place_window_tr(self, hwnd, pid):
-        """Place window in Top-Right quadrant."""
-        try:
-            # Get screen dimensions
-            screen_width = QApplication.primaryScreen().availableGeometry().width()
-            screen_height = QApplication.primaryScreen().availableGeometry().height()
-            
-            # Calculate TR quadrant dimensions
-            x = int(screen_width * 0.51)  # Right half
-            y = int(screen_height * 0.01)  # Edge margin
-            w = int(screen_width * 0.48)   # Half width minus margin
-            h = int(screen_height * 0.48)  # Half height minus margin
-            
-            # Place window
-            win32gui.SetWindowPos(hwnd, 0, x, y, w, h, win32con.SWP_SHOWWINDOW)
-            self.log(f"Window placed TR: ({x}, {y}, {w}, {h})")
-            
-        except Exception as e:
-            self.log(f"TR placement error: {e}")
-
-    def _place_window_bl(self, hwnd, pid):
-        """Place window in Bottom-Left quadrant."""
-        try:
-            # Get screen dimensions
-            screen_width = QApplication.primaryScreen().availableGeometry().width()
-            screen_height = QApplication.primaryScreen().availableGeometry().height()
-            
-            # Calculate BL quadrant dimensions
-            x = int(screen_width * 0.01)  # Edge margin
-            y = int(screen_height * 0.51)  # Bottom half
-            w = int(screen_width * 0.48)   # Half width minus margin
-            h = int(screen_height * 0.48)  # Half height minus margin
-            
-            # Place window
-            win32gui.SetWindowPos(hwnd, 0, x, y, w, h, win32con.SWP_SHOWWINDOW)
-            self.log(f"Window placed BL: ({x}, {y}, {w}, {h})")
-            
-        except Exception as e:
-            self.log(f"BL placement error: {e}")
-
-    def _place_window_br(self, hwnd, pid):
-        """Place window in Bottom-Right quadrant."""
-        try:
-            # Get screen dimensions
-            screen_width = QApplication.primaryScreen().availableGeometry().width()
-            screen_height = QApplication.primaryScreen().availableGeometry().height()
-            
-            # Calculate BR quadrant dimensions
-            x = int(screen_width * 0.51)  # Right half
-            y = int(screen_height * 0.51)  # Bottom half
-            w = int(screen_width * 0.48)   # Half width minus margin
-            h = int(screen_height * 0.48)  # Half height minus margin
-            
-            # Place window
-            win32gui.SetWindowPos(hwnd, 0, x, y, w, h, win32con.SWP_SHOWWINDOW)
-            self.log(f"Window placed BR: ({x}, {y}, {w}, {h})")
-            
-        except Exception as e:
-            self.log(f"BR placement error: {e}")
+    def _glow_pixmap(self) -> QPixmap:
+        """Glow overlay for the current size/intensity, shared by all equal-sized buttons."""
+        w, h = self.width(), self.height()
+        dpr = self.devicePixelRatioF()
+        glow_alpha, outer_alpha = self._glow or NeonButton._shared_glow
+        key = (w, h, dpr, glow_alpha, outer_alpha)
+        pm = NeonButton._GLOW_CACHE.get(key)
+        if pm is None:
+            if len(NeonButton._GLOW_CACHE) > 64:
+                NeonButton._GLOW_CACHE.clear()
+            pm = QPixmap(int(w * dpr), int(h * dpr))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.transparent)
+            p = QPainter(pm)
+            p.setRenderHint(QPainter.Antialiasing)
+            rect = QRectF(0.5, 0.5, w - 1.0, h - 1.0)
+            # Outer glow: soft radial falloff towards the border
+            grad = QRadialGradient(w / 2.0, h / 2.0, max(w, h) / 2.0)
+            grad.setColorAt(0.0, QColor(123, 179, 240, 0))
+            grad.setColorAt(0.7, QColor(123, 179, 240, 0))
+            grad.setColorAt(1.0, QColor(123, 179, 240, outer_alpha))
+            p.setPen(Qt.NoPen)
+            p.setBrush(grad)
+            p.drawRoundedRect(rect, 12, 12)
+            # Primary glow: thin chrome-blue rim
+            p.setBrush(Qt.NoBrush)
+            p.setPen(QPen(QColor(74, 144, 226, glow_alpha), 1.5))
+            p.drawRoundedRect(rect.adjusted(1, 1, -1, -1), 12, 12)
+            p.end()
+            NeonButton._GLOW_CACHE[key] = pm
+        return pm
+
+    def paintEvent(self, ev):
+        super().paintEvent(ev)
+        if self.width() > 0 and self.height() > 0:
+            p = QPainter(self)
+            p.drawPixmap(0, 0, self._glow_pixmap())
+            p.end()
 
 class CommandCenter(QWidget):
     def __init__(self, state: AppState, parent=None):
@@ -794,6 +1258,18 @@ class CommandCenter(QWidget):
         self.state = state
         self.cfg   = state.cfg
 
+        # Ein Resize-Timer für alle Events; neu starten statt pro Event neu anlegen
+        self._built_cols = 0
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._rebuild_buttons_on_resize)
+        # PID -> Image-Memo in window_utils periodisch leeren (PIDs werden wiederverwendet)
+        self._pid_cache_timer = QTimer(self)
+        self._pid_cache_timer.setInterval(30000)
+        self._pid_cache_timer.timeout.connect(clear_process_caches)
+        self._pid_cache_timer.start()
+
         self.setWindowTitle(f"Support Cockpit — {self.state.menu_name}")
         self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint | Qt.Window | Qt.WindowMaximizeButtonHint)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
@@ -803,15 +1279,22 @@ class CommandCenter(QWidget):
         self.setMinimumSize(600, 400)
         self.setMaximumSize(1600, 1200)
 
-        self._dragging = False
-        self._drag_off = QPoint()
-
         # Remember original geometry for maximize toggle
         self._original_geometry = None
         self._is_maximized = False
-        self._q_out: Optional[Queue] = None
-        self._q_err: Optional[Queue] = None
-        self._baseline_timer: Optional[QTimer] = None
+        self._baseline_bus = _BaselineBus(self)
+        self._baseline_bus.lines.connect(self._on_baseline_lines)
+        self._baseline_bus.finished.connect(self._on_baseline_finished)
+
+        # Konsolen-Ausgabe: Level einmal auflösen, Zeilen gesammelt alle 50 ms einfügen
+        self._console_level = LogLevel.from_string(self.cfg.CONSOLE_LOG_LEVEL)
+        self._console_pending: deque = deque(maxlen=512)
+        self._console_flush_pending = False
+        self._console_formats: Dict[str, QTextCharFormat] = {}
+        self._copy_banner: Optional[QLabel] = None
+
+        # Einmal für das ganze Fenster; Kinder bekommen nur objectName/Property
+        self.setStyleSheet(_WINDOW_QSS)
 
         # Layout
         lay = QVBoxLayout(self)
@@ -821,23 +1304,17 @@ class CommandCenter(QWidget):
         # Chrome container
         self.chrome = QWidget(self)
         self.chrome.setObjectName("chrome")
+        # Einziger Schatten des Chroms; Style-Refreshes fassen den Effekt nicht mehr an
+        self._chrome_shadow = QGraphicsDropShadowEffect(self.chrome)
+        self._chrome_shadow.setBlurRadius(24)
+        self._chrome_shadow.setOffset(0, 6)
+        self._chrome_shadow.setColor(Qt.black)
+        self.chrome.setGraphicsEffect(self._chrome_shadow)
         self._apply_chrome_style(self.chrome, border_boost=0.0)
         chrome_lay = QVBoxLayout(self.chrome)
         chrome_lay.setContentsMargins(14, 14, 14, 14)
         chrome_lay.setSpacing(10)
         lay.addWidget(self.chrome)
-        
-        # Force style refresh
-        self.style().unpolish(self)
-        self.style().polish(self)
-        self.update()
-
-        # Add outer shadow to chrome
-        outer_shadow = QGraphicsDropShadowEffect(self.chrome)
-        outer_shadow.setBlurRadius(24)
-        outer_shadow.setOffset(0, 6)
-        outer_shadow.setColor(Qt.black)
-        self.chrome.setGraphicsEffect(outer_shadow)
 
         # Initialize animation system
         self._init_animations()
@@ -847,6 +1324,51 @@ class CommandCenter(QWidget):
         self._last_active_pid = None
         self.setFocusPolicy(Qt.StrongFocus)
 
+        # Prozessstarts laufen im Thread-Pool; Ergebnisse kommen über den Bus zurück
+        self._launch_bus = _LaunchBus(self)
+        self._launch_bus.finished.connect(self._on_launch_done)
+        # PID → Callback für Fenster, die per EVENT_OBJECT_SHOW-Hook statt Polling gefunden werden
+        self._pending_placements: Dict[int, Callable[[int], None]] = {}
+        self._pid_hook = 0
+        # Shell-Hook (HSHELL_WINDOWCREATED) als zweiter Kanal; Message-ID != 0 nur solange registriert
+        self._shell_hook_msg = 0
+        # RDSH: zuletzt erfolgreiche Platzierungsmethode pro Label, wird zuerst probiert
+        self._rds_success_method: Dict[str, int] = {}
+        # Fenster-Moves derselben Event-Loop-Runde, gesammelt für ein DeferWindowPos-Commit
+        self._move_batch: List[Tuple[int, int, int, int, int, Callable[[bool], None]]] = []
+        # Gemeinsamer EnumWindows-Snapshot (monotonic ts, HWNDs, PID -> Image) für parallele Platzierungen
+        self._win_snapshot: Optional[Tuple[float, List[int], Dict[int, str]]] = None
+        # Letzter Konsolen-Scan (monotonic ts, PID -> HWNDs), geteilt von allen Pollern
+        self._console_scan: Optional[Tuple[float, Dict[int, List[int]]]] = None
+
+        # Bildschirm-Metriken + Quadrant-Tabellen lazy gecacht; Screen-Signale invalidieren nur
+        self._screen_cache: Optional[Tuple[QRect, float, float]] = None
+        self._quad_rects: Dict[str, QRect] = {}
+        self._gui_quad_rects: Dict[str, QRect] = {}
+        # Platzierungs-Rechtecke (physisch, FILL_RATIO/EDGE_MARGIN) je Quadrant, bis zum nächsten Screen-Signal
+        self._placement_rects: Dict[str, Tuple[int, int, int, int]] = {}
+        # (min_w, min_h, max_w, max_h) der GUI, DPI-skaliert; nur bei Screen-/DPI-Wechsel neu
+        self._size_constraints: Tuple[int, int, int, int] = (600, 400, 1600, 1200)
+        self._screen_hooked = False
+        # Config ist frozen: Hotkey-/Quadrant-Werte einmal auf die Instanz binden
+        self._start_quadrant: str = self.cfg.GUI_START_QUADRANT
+        self._rr_order: Tuple[str, ...] = tuple(self.cfg.RR_ORDER)
+        self._edge_margin_ratio = float(self.cfg.EDGE_MARGIN_RATIO)
+        # RDSH-Session des Prozesses, ändert sich nicht
+        self._session_id: int = self._get_current_session_id()
+        # Ctrl+Taste → Aktion; Ctrl+0 zentriert die GUI, Ctrl+1..3 = RR_ORDER[0..2] für das letzte Fenster
+        self._ctrl_hotkeys: Dict[int, Callable[[], None]] = {
+            int(Qt.Key_0): self._center_gui,
+            int(Qt.Key_1): functools.partial(self._place_last_window_rr, 0),
+            int(Qt.Key_2): functools.partial(self._place_last_window_rr, 1),
+            int(Qt.Key_3): functools.partial(self._place_last_window_rr, 2),
+        }
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self._invalidate_screen_cache)
+        app.screenRemoved.connect(self._invalidate_screen_cache)
+        app.primaryScreenChanged.connect(self._watch_primary_screen)
+        self._watch_primary_screen(QGuiApplication.primaryScreen())
+
         # Header row
         head = QHBoxLayout()
         head.setSpacing(8)
@@ -898,17 +1420,6 @@ class CommandCenter(QWidget):
         head.addWidget(self.btn_max)
         head.addWidget(btn_close)
         
-        # Force style refresh for header elements
-        self.header.style().unpolish(self.header)
-        self.header.style().polish(self.header)
-        self.header.update()
-        lbl.style().unpolish(lbl)
-        lbl.style().polish(lbl)
-        lbl.update()
-        self.menu_combo.style().unpolish(self.menu_combo)
-        self.menu_combo.style().polish(self.menu_combo)
-        self.menu_combo.update()
-
         # Accent line - removed for cleaner look
 
         # Splitter
@@ -918,17 +1429,16 @@ class CommandCenter(QWidget):
         chrome_lay.addWidget(self.splitter, 1)
 
         self._build_log()
+        self._btn_cols = self._compute_btn_cols()
         self._build_buttons()
+        self._init_config_watch()
         self.place_command_center()
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(lambda: None)
-        self.timer.start(200)
-
         self._log("Grid60.03 gestartet (clean final)", "INFO")
 
-        baseline_path = getattr(self.cfg, "BASELINE_PATH", None)
-        baseline_delay = int(getattr(self.cfg, "BASELINE_DELAY_MS", 0) or 0)
+        # Config ist ein frozen dataclass: alle Felder existieren, kein getattr mit Default
+        baseline_path = self.cfg.BASELINE_PATH
+        baseline_delay = self.cfg.BASELINE_DELAY_MS or 0
 
         if baseline_path and os.path.isfile(baseline_path):
             delay = max(0, baseline_delay)
@@ -938,194 +1448,262 @@ class CommandCenter(QWidget):
     # ===== NEW FIXED BUTTON SYSTEM =====
     def _build_buttons(self):
         """Build button grid with dynamic column count based on window width."""
-        w = QWidget()
-        g = QGridLayout(w)
-        g.setSpacing(8)
-        self.btns = {}
-        
+        # 1) Reads: items and column count
         items = self.state.tools_for_current()[:max(0, self.cfg.MAX_TOOL_BUTTONS)]
         self._log(f"★ BUILDING {len(items)} buttons", "DEBUG")
         
-        # Calculate dynamic columns based on window width
-        # Default to 4 columns, but adjust based on available width
-        window_width = self.width() if hasattr(self, 'width') else 640
-        button_width = 140  # Approximate button width including spacing
-        max_cols = max(2, min(6, window_width // button_width))  # 2-6 columns
-        
-        # Use config override if available, otherwise use dynamic calculation
-        cols = getattr(self.cfg, 'BUTTON_COLUMNS', max_cols)
-        if cols <= 0:  # If config is 0 or negative, use dynamic
-            cols = max_cols
+        # Spaltenzahl wird bei init/resize berechnet, hier nur gelesen
+        cols = self._built_cols = self._btn_cols
         
-        self._log(f"★ BUTTON GRID: {cols} columns (window_width={window_width})", "DEBUG")
+        self._log(f"★ BUTTON GRID: {cols} columns (window_width={self.width()})", "DEBUG")
         
-        r = c = 0
+        # 2) Creation: all buttons without parent, grid positions up front
+        buttons = []
         for i, tool in enumerate(items):
-            label = tool["label"]
-            path = tool["path"] 
-            tool_type = tool.get("type", "")
-            uac = bool(tool.get("uac", False))
-            args = tool.get("args", [])
+            label = tool.label
+            uac = tool.uac
             
-            self._log(f"★ BTN[{i}]: '{label}' type='{tool_type}' path='{path}' uac={uac}", "DEBUG")
+            self._log(f"★ BTN[{i}]: '{label}' type='{tool.type}' path='{tool.path}' uac={uac}", "DEBUG")
             
             # Add UAC symbol if elevated
             if uac:
                 label += " 🛡️"
             b = NeonButton(text=label)
-            key = f"{r}:{c}"
-            
-            # Create proper closure
-            b.clicked.connect(self._make_button_handler(tool))
             
+            # Ein gemeinsamer Slot; das Tool hängt als dynamische Property am Button
+            b.setProperty("tool", tool)
+            b.clicked.connect(self._on_button_clicked)
+            buttons.append(b)
+        cells = [divmod(i, cols) for i in range(len(buttons))]
+        
+        # 3) Mutation: one addWidget burst with updates off, then one splitter swap
+        w = QWidget()
+        w.setUpdatesEnabled(False)
+        g = QGridLayout(w)
+        g.setSpacing(8)
+        # Layout während des Bursts aus: kein Relayout pro addWidget, am Ende ein activate()
+        g.setEnabled(False)
+        # Platzhalter in der letzten Zelle: Zeilen/Spalten-Tabellen einmal auf Endgröße
+        rows = (len(buttons) + cols - 1) // cols
+        presize = QSpacerItem(0, 0) if rows else None
+        if presize is not None:
+            g.addItem(presize, rows - 1, cols - 1)
+        self.btns = {}
+        for b, (r, c) in zip(buttons, cells):
             g.addWidget(b, r, c)
-            self.btns[key] = b
-            c += 1
-            if c >= cols: 
-                c = 0
-                r += 1
+            self.btns[f"{r}:{c}"] = b
+        if presize is not None:
+            g.removeItem(presize)
+        g.setEnabled(True)
         
         self._log(f"★ BUTTONS CREATED: {len(self.btns)} in {cols} columns", "DEBUG")
         
-        # Force style refresh for buttons
-        for btn in self.btns.values():
-            btn.style().unpolish(btn)
-            btn.style().polish(btn)
-            btn.update()
-        
-        if self.splitter.count() > 0:
-            self.splitter.insertWidget(0, w)
-            old = self.splitter.widget(1)
-            if isinstance(old, QWidget) and old is not self.console:
-                old.setParent(None)
-        else:
-            self.splitter.addWidget(w)
+        # 4) Swap ohne Zwischen-Paint des Splitters, danach einmal messen
+        self.splitter.setUpdatesEnabled(False)
+        try:
+            if self.splitter.count() > 0:
+                self.splitter.insertWidget(0, w)
+                old = self.splitter.widget(1)
+                if isinstance(old, QWidget) and old is not self.console:
+                    old.setParent(None)
+            else:
+                self.splitter.addWidget(w)
+            g.activate()
+        finally:
+            w.setUpdatesEnabled(True)
+            self.splitter.setUpdatesEnabled(True)
+
+    def _compute_btn_cols(self) -> int:
+        """Button columns: BUTTON_COLUMNS if > 0, otherwise 2-6 based on window width."""
+        cols = self.cfg.BUTTON_COLUMNS
+        if cols > 0:
+            return cols
+        button_width = 140  # Approximate button width including spacing
+        return max(2, min(6, self.width() // button_width))
 
-    def _make_button_handler(self, tool):
-        """Create button click handler with proper closure."""
-        def handler():
+    def _on_button_clicked(self):
+        """Shared click slot for all tool buttons."""
+        btn = self.sender()
+        tool = btn.property("tool") if btn is not None else None
+        if tool is not None:
             self._handle_tool_launch(tool)
-        return handler
 
     def _handle_tool_launch(self, tool):
         """Handle tool launch based on JSON type with RDSH support."""
-        label = tool["label"]
-        path = tool["path"]
-        tool_type = tool.get("type", "")
-        uac = bool(tool.get("uac", False))
-        args = tool.get("args", [])
+        label = tool.label
+        path = tool.path
+        tool_type = tool.type
+        uac = tool.uac
+        args = list(tool.args)
         quad = self.state.next_quad()
         
         # RDSH-specific parameters
-        is_rds_session = bool(tool.get("rds_session", False))
-        session_detection = bool(tool.get("session_detection", False))
-        window_placement = tool.get("window_placement", {})
+        is_rds_session = tool.rds_session
         
         self._log(f"★ LAUNCH: '{label}' type='{tool_type}' path='{path}' uac={uac} rds={is_rds_session} → {quad}", "INFO")
         
         try:
-            if tool_type == "ps1":
-                self._launch_powershell(path, label, args, uac, quad)
-            elif tool_type == "cmd":
-                self._launch_cmd(label, uac, quad)
-            elif tool_type == "url":
-                self._launch_url_isolated(path, quad)
-            elif tool_type == "exe" or "explorer" in path.lower():
-                if "explorer" in path.lower():
-                    self._launch_explorer_fixed(label, path, args, quad)
-                elif is_rds_session:
-                    self._launch_rds_application(path, label, args, uac, quad, window_placement)
-                else:
-                    self._launch_executable(path, label, args, uac, quad)
-            else:
-                # Fallback detection
-                if path.lower().endswith(".ps1"):
-                    self._launch_powershell(path, label, args, uac, quad)
-                elif path.lower() == "cmd:blank":
-                    self._launch_cmd(label, uac, quad)
-                elif path.lower() == "ps:blank":
-                    self._launch_powershell_blank(label, uac, quad)
-                elif path.lower().startswith("http"):
-                    self._launch_url_isolated(path, quad)
-                else:
-                    self._launch_executable(path, label, args, uac, quad)
+            self._LAUNCH_DISPATCH[tool.kind](self, tool, args, quad)
+        except Exception as e:
+            self._log(f"★ LAUNCH ERROR: {e}", "ERROR")
+
+    # Kind -> Launcher; tool.kind wird einmal beim Laden der Menüs bestimmt
+    def _launch_kind_ps1(self, tool, args, quad):
+        self._launch_powershell(tool.path, tool.label, args, tool.uac, quad, tool.ps_args)
+
+    def _launch_kind_exe(self, tool, args, quad):
+        self._launch_executable(tool.path, tool.label, args, tool.uac, quad)
+
+    def _launch_kind_rds(self, tool, args, quad):
+        self._launch_rds_application(tool.path, tool.label, args, tool.uac, quad, tool.window_placement or {})
+
+    _LAUNCH_DISPATCH = {
+        "ps1": _launch_kind_ps1,
+        "cmd": lambda self, tool, args, quad: self._launch_cmd(tool.label, tool.uac, quad),
+        "url": lambda self, tool, args, quad: self._launch_url_isolated(tool.path, quad),
+        "explorer": lambda self, tool, args, quad: self._launch_explorer_fixed(tool.label, tool.path, args, quad),
+        "rds": _launch_kind_rds,
+        "ps_blank": lambda self, tool, args, quad: self._launch_powershell_blank(tool.label, tool.uac, quad),
+        "exe": _launch_kind_exe,
+    }
+
+    def _run_async(self, fn, on_done):
+        """Run fn() on the global thread pool; on_done(result, exc) runs on the GUI thread."""
+        QThreadPool.globalInstance().start(_LaunchTask(fn, self._launch_bus, on_done))
+
+    def _on_launch_done(self, payload):
+        on_done, res, err = payload
+        try:
+            on_done(res, err)
         except Exception as e:
             self._log(f"★ LAUNCH ERROR: {e}", "ERROR")
 
-    def _launch_powershell(self, script_path: str, label: str, args: List[str], uac: bool, quad: str):
+    def _start_exe_async(self, path: str, args: List[str], uac: bool, on_result, err_prefix: str,
+                         check_exists: bool = False, before=None):
+        """Start path via try_start_exe(_uac) on the pool; on_result(ok, pid, err, snap) on the GUI thread.
+
+        check_exists moves the file/PATH lookup into the worker; before() (e.g. a window
+        snapshot) also runs there, right before the start, and its result is passed as snap.
+        """
+        start = try_start_exe_uac if uac else try_start_exe
+
+        def work():
+            if check_exists and not os.path.exists(path) and not shutil.which(path):
+                return None
+            snap = before() if before else None
+            ok, pid, _elevated, err = start(path, args=args)
+            return ok, pid, err, snap
+
+        def done(res, exc):
+            if exc:
+                self._log(f"{err_prefix}: {exc}")
+            elif res is None:
+                self._log(f"Executable not found: {path}")
+            else:
+                on_result(*res)
+        self._run_async(work, done)
+
+    def _launch_powershell(self, script_path: str, label: str, args: List[str], uac: bool, quad: str,
+                           quoted_args: Optional[str] = None):
         """Launch PowerShell script with RDSH-aware placement."""
         if script_path == "ps:blank":
             self._launch_powershell_blank(label, uac, quad)
             return
             
         # Der Pfad wurde bereits von _resolve_tool_path aufgelöst
-        # Stelle nur sicher, dass der Pfad absolut ist
-        script_path = os.path.abspath(script_path)
-        
-        if not os.path.isfile(script_path):
-            self._log(f"PS1 script not found: {script_path}")
-            return
+        # abspath/isfile/dirname einmal pro Skript; fehlende Datei wird im Worker nachgeprüft
+        script_path, exists, cwd = _resolve_script(script_path)
             
         # RDSH-aware title with session info
-        session_id = self._get_current_session_id()
-        title = f"{label} – {os.environ.get('USERNAME','User')}@{os.environ.get('COMPUTERNAME','Host')} [S{session_id}]"
+        session_id = self._session_id
+        title = f"{label} – {_USERNAME}@{_COMPUTERNAME} [S{session_id}]"
         
         if uac:
             # Elevated PowerShell
-            ps = which("pwsh.exe", "powershell.exe") or r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe"
-            script_args = " ".join(map(shlex.quote, args)) if args else ""
-            cmd = (
-                f'-NoLogo -NoProfile -ExecutionPolicy Bypass -NoExit -Command '
-                f'"$Host.UI.RawUI.WindowTitle=\'{title}\'; & \'{script_path}\' {script_args}"'
-            )
-            ok, pid, err = _shell_run("runas", ps, cmd, cwd=os.path.dirname(script_path))
-            if ok:
-                self._log(f"PS script elevated started: '{title}' → {quad} (Session {session_id})")
-                # Enhanced PowerShell placement for elevated
-                self._schedule_powershell_placement(pid, quad, label, title)
-            else:
-                self._log(f"PS script elevated failed: {err}")
+            ps = _ps_exe()
+            script_args = quoted_args if quoted_args is not None else _quote_ps_args(args)
+            cmd = f'{_PS_CMD_PREFIX}"$Host.UI.RawUI.WindowTitle=\'{title}\'; & \'{script_path}\' {script_args}"'
+            def work():
+                if not (exists or os.path.isfile(script_path)): return None
+                return _shell_run("runas", ps, cmd, cwd=cwd)
+
+            def done(res, exc):
+                if exc: raise exc
+                if res is None:
+                    self._log(f"PS1 script not found: {script_path}")
+                    return
+                ok, pid, err = res
+                if ok:
+                    self._log(f"PS script elevated started: '{title}' → {quad} (Session {session_id})")
+                    # Enhanced PowerShell placement for elevated
+                    self._schedule_powershell_placement(pid, quad, label, title)
+                else:
+                    self._log(f"PS script elevated failed: {err}")
+            self._run_async(work, done)
         else:
             # Normal PowerShell
-            ps_args = build_ps_command(script_path, title, extra_args=args, keep_open=True)
-            p = spawn_console(ps_args, cwd=os.path.dirname(script_path))
-            self._log(f"PS script started: '{title}' → {quad} (Session {session_id})")
-            # Enhanced PowerShell placement
-            self._schedule_powershell_placement(p.pid, quad, label, title)
+            ps_args = build_ps_command(script_path, title, extra_args=args, keep_open=True,
+                                       quoted_args=quoted_args)
+            def work():
+                if not (exists or os.path.isfile(script_path)): return None
+                return spawn_console(ps_args, cwd=cwd)
+
+            def done(p, exc):
+                if exc: raise exc
+                if p is None:
+                    self._log(f"PS1 script not found: {script_path}")
+                    return
+                self._log(f"PS script started: '{title}' → {quad} (Session {session_id})")
+                # Enhanced PowerShell placement
+                self._schedule_powershell_placement(p.pid, quad, label, title)
+            self._run_async(work, done)
 
     def _launch_powershell_blank(self, label: str, uac: bool, quad: str):
         """Launch blank PowerShell console with basic placement."""
         if uac:
-            ps = which("pwsh.exe", "powershell.exe") or r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe"
+            ps = _ps_exe()
             cmd = f'-NoLogo -NoProfile -ExecutionPolicy Bypass -NoExit -Command "$Host.UI.RawUI.WindowTitle=\'{label}\'"'
-            ok, pid, err = _shell_run("runas", ps, cmd)
-            if ok:
-                self._log(f"PS elevated started: '{label}' → {quad}")
-                # Enhanced PowerShell placement for elevated
-                self._schedule_powershell_placement(pid, quad, label, label)
-            else:
-                self._log(f"PS elevated failed: {err}")
+
+            def done(res, exc):
+                if exc: raise exc
+                ok, pid, err = res
+                if ok:
+                    self._log(f"PS elevated started: '{label}' → {quad}")
+                    # Enhanced PowerShell placement for elevated
+                    self._schedule_powershell_placement(pid, quad, label, label)
+                else:
+                    self._log(f"PS elevated failed: {err}")
+            self._run_async(functools.partial(_shell_run, "runas", ps, cmd), done)
         else:
             args = build_ps_command(None, label, keep_open=True)
-            p = spawn_console(args)
-            self._log(f"PS started: '{label}' → {quad}")
-            # Only try placement for non-elevated
-            self._schedule_window_placement_by_pid(p.pid, quad, label)
+
+            def done(p, exc):
+                if exc: raise exc
+                self._log(f"PS started: '{label}' → {quad}")
+                # Only try placement for non-elevated
+                self._schedule_window_placement_by_pid(p.pid, quad, label)
+            self._run_async(functools.partial(spawn_console, args), done)
 
     def _launch_cmd(self, label: str, uac: bool, quad: str):
         """Launch CMD console with basic placement."""
         if uac:
-            ok, pid, err = _shell_run("runas", "cmd.exe", f'/K "title {label}"')
-            if ok:
-                self._log(f"CMD elevated started: '{label}' → {quad}")
-            else:
-                self._log(f"CMD elevated failed: {err}")
+            def done(res, exc):
+                if exc: raise exc
+                ok, pid, err = res
+                if ok:
+                    self._log(f"CMD elevated started: '{label}' → {quad}")
+                else:
+                    self._log(f"CMD elevated failed: {err}")
+            self._run_async(functools.partial(_shell_run, "runas", "cmd.exe", f'/K "title {label}"'), done)
         else:
             args = build_cmd_command(label, keep_open=True)
-            p = spawn_console(args)
-            self._log(f"CMD started: '{label}' → {quad}")
-            # Only try placement for non-elevated
-            self._schedule_window_placement_by_pid(p.pid, quad, label)
+
+            def done(p, exc):
+                if exc: raise exc
+                self._log(f"CMD started: '{label}' → {quad}")
+                # Only try placement for non-elevated
+                self._schedule_window_placement_by_pid(p.pid, quad, label)
+            self._run_async(functools.partial(spawn_console, args), done)
 
     def _launch_executable(self, path: str, label: str, args: List[str], uac: bool, quad: str):
         """Launch executable with window placement."""
@@ -1136,27 +1714,18 @@ class CommandCenter(QWidget):
                 self._log(f"Settings URI launched: {path}")
             return
             
-        if not os.path.exists(path) and not shutil.which(path):
-            self._log(f"Executable not found: {path}")
-            return
-        
         # Special case: Browser with snapshot-based placement
-        exe_name = os.path.basename(path).lower()
-        if exe_name in ("msedge.exe", "chrome.exe", "firefox.exe") and any(arg for arg in args if "user-data-dir" in str(arg)):
+        exe_name = _classify_exe(path)[0]
+        if exe_name in _BROWSER_IMAGES and any(arg for arg in args if "user-data-dir" in str(arg)):
             self._launch_browser_with_snapshot(path, label, args, uac, quad)
             return
         
         # Special case: MMC-based tools with snapshot (to handle single-instance behavior)
-        if exe_name in ("eventvwr.exe", "mmc.exe"):
+        if exe_name in _EVENTVWR_IMAGES:
             self._launch_mmc_with_snapshot(path, label, args, uac, quad)
             return
             
-        try:
-            if uac:
-                ok, pid, elevated, err = try_start_exe_uac(path, args=args)
-            else:
-                ok, pid, elevated, err = try_start_exe(path, args=args)
-
+        def started(ok, pid, err, _snap):
             if ok and pid:
                 self._log(f"{'EXE elevated' if uac else 'EXE'} started (PID={pid}) → {quad}")
                 # Use simple PID-based placement for non-browsers
@@ -1166,159 +1735,418 @@ class CommandCenter(QWidget):
                 self._schedule_window_placement_generic(path, quad, label)
             else:
                 self._log(f"EXE start failed: {label} | {err}")
-        except Exception as e:
-            self._log(f"EXE launch exception: {e}")
+        self._start_exe_async(path, args, uac, started, "EXE launch exception", check_exists=True)
 
     def _launch_browser_with_snapshot(self, path: str, label: str, args: List[str], uac: bool, quad: str):
         """Launch isolated browser with snapshot-based window placement."""
-        exe_name = os.path.basename(path).lower()
+        exe_name = _classify_exe(path)[0]
         
-        # Take snapshot of current browser windows BEFORE launch
-        before_windows = find_windows_by_criteria(
-            image_names=[exe_name],
-            class_names=["Chrome_WidgetWin_1", "MozillaWindowClass", "ApplicationFrameWindow"]
-        )
-        
-        try:
-            if uac:
-                ok, pid, elevated, err = try_start_exe_uac(path, args=args)
-            else:
-                ok, pid, elevated, err = try_start_exe(path, args=args)
+        # Take snapshot of current browser windows BEFORE launch (im Worker, direkt vor dem Start)
+        def snapshot():
+            return find_windows_by_criteria(
+                image_names=frozenset((exe_name,)),
+                class_names=_BROWSER_CLASSES
+            )
 
+        def started(ok, pid, err, before_windows):
             if ok:
                 self._log(f"{'Browser elevated' if uac else 'Browser'} started → {quad}")
                 # Schedule snapshot-based placement
-                self._schedule_browser_placement_by_snapshot(before_windows, exe_name, quad, label)
+                self._schedule_browser_placement_by_snapshot(before_windows, exe_name, quad, label, pid)
             else:
                 self._log(f"Browser start failed: {label} | {err}")
+        self._start_exe_async(path, args, uac, started, "Browser launch exception",
+                              check_exists=True, before=snapshot)
+
+    def _watch_for_new_window(self, snapshot, before_windows: List[int], class_names, on_found, on_timeout,
+                              budget_ms: int = 10000, first_delay_ms: int = 200, pid: Optional[int] = None,
+                              images=None):
+        """Wait for a window from snapshot() that is not in before_windows.
+
+        Polls with exponential backoff (capped at 2 s) within budget_ms; an EVENT_OBJECT_SHOW
+        hook for class_names short-circuits the wait as soon as a candidate window appears.
+        If that window belongs to pid (or, for single-instance hosts like MMC where the
+        launched PID differs, to a process whose image is in images), it is taken directly
+        without enumerating snapshot().
+        """
+        before = set(before_windows)
+        classes = frozenset(class_names)
+        st = {"done": False, "hook": 0, "waited": first_delay_ms}
+
+        def finish():
+            st["done"] = True
+            unhook_win_event(st["hook"])
+            st["hook"] = 0
+
+        def check() -> bool:
+            if st["done"]:
+                return True
+            new_windows = [h for h in snapshot() if h not in before]
+            if not new_windows:
+                return False
+            finish()
+            # Take the largest new window
+            on_found(max(new_windows, key=get_window_area))
+            return True
+
+        def poll(attempt=0):
+            if check():
+                return
+            attempt += 1
+            if st["waited"] >= budget_ms:
+                finish()
+                on_timeout(attempt)
+                return
+            delay = min(2000, int(200 * 1.5 ** attempt))
+            st["waited"] += delay
+            QTimer.singleShot(delay, functools.partial(poll, attempt))
+
+        def take(hwnd):
+            if st["done"]:
+                return
+            finish()
+            on_found(hwnd)
+
+        def on_show(_event, hwnd):
+            if st["done"] or hwnd in before:
+                return
+            try:
+                if win32gui.GetClassName(hwnd) not in classes:
+                    return
+                # Fenster des gestarteten Prozesses: HWND steht fest, keine Enumeration nötig
+                owner = win32process.GetWindowThreadProcessId(hwnd)[1] if (pid or images) else 0
+                direct = bool(owner) and (owner == pid or
+                                          (images is not None and get_image_name_basename(owner) in images))
+            except Exception:
+                return
+            # Aus dem Hook-Callback raus, Platzierung regulär in der Event-Loop;
+            # ausstehende Poll-Timer laufen nach finish() leer
+            if direct:
+                QTimer.singleShot(0, functools.partial(take, hwnd))
+            else:
+                QTimer.singleShot(0, check)
+
+        st["hook"] = set_win_event_hook(on_show)
+        QTimer.singleShot(first_delay_ms, poll)
+
+    def _queue_move(self, hwnd: int, x: int, y: int, w: int, h: int, on_result: Callable[[bool], None]):
+        """Queue a move; all moves queued in the same event-loop turn are committed together.
+
+        Rects come from _quadrant() and are already clamped to the workarea.
+        """
+        if not self._move_batch:
+            QTimer.singleShot(0, self._flush_moves)
+        self._move_batch.append((hwnd, x, y, w, h, on_result))
+
+    def _flush_moves(self):
+        batch, self._move_batch = self._move_batch, []
+        if not batch:
+            return
+        try:
+            results = move_windows([b[:5] for b in batch], clamp=False)
         except Exception as e:
-            self._log(f"Browser launch exception: {e}")
+            self._log(f"Batched placement failed: {e}")
+            results = {}
+        for hwnd, _x, _y, _w, _h, on_result in batch:
+            on_result(results.get(hwnd, False))
+
+    def _hook_for_window(self, scan: Callable[[], List[int]], on_found: Callable[[int], None],
+                         on_timeout: Callable[[], None], timeout_ms: int, first_delay_ms: int = 0,
+                         pid: int = 0, poll_ms: int = 1000, watch_titles: bool = False):
+        """Wait until scan() returns a window, re-scanning only when a top-level window is shown.
+
+        An EVENT_OBJECT_SHOW hook (limited to pid if given) triggers the scan, a first scan after
+        first_delay_ms catches windows that already exist, and a last one at timeout_ms is the
+        safety net. Without a hook scan() is polled every poll_ms. on_found gets the largest match.
+        watch_titles also re-scans on EVENT_OBJECT_NAMECHANGE, for scans that match on a title
+        the app sets only after showing its window.
+        """
+        st = {"done": False, "hook": 0, "name_hook": 0, "queued": False}
+
+        def finish():
+            st["done"] = True
+            unhook_win_event(st["hook"])
+            unhook_win_event(st["name_hook"])
+            st["hook"] = st["name_hook"] = 0
+
+        def check(final=False) -> bool:
+            st["queued"] = False
+            if st["done"]:
+                return True
+            windows = scan()
+            if windows:
+                finish()
+                on_found(max(windows, key=get_window_area))
+                return True
+            if final:
+                finish()
+                on_timeout()
+            return False
+
+        def on_show(event, hwnd):
+            if st["done"]:
+                return
+            try:
+                # Child-Controls feuern dasselbe Event, nur Top-Level-Fenster lösen einen Scan aus
+                if win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE) & win32con.WS_CHILD:
+                    return
+            except Exception:
+                return
+            # Neues Top-Level-Fenster: gemeinsamer Snapshot ist veraltet (Titel werden ohnehin frisch gelesen)
+            if event != EVENT_OBJECT_NAMECHANGE:
+                self._win_snapshot = None
+            if st["queued"]:
+                return
+            st["queued"] = True
+            QTimer.singleShot(0, check)
+
+        def poll(waited):
+            if check():
+                return
+            waited += poll_ms
+            if waited < timeout_ms:
+                QTimer.singleShot(poll_ms, functools.partial(poll, waited))
+
+        st["hook"] = set_win_event_hook(on_show, pid=pid)
+        if st["hook"] and watch_titles:
+            st["name_hook"] = set_win_event_hook(on_show, EVENT_OBJECT_NAMECHANGE, pid=pid)
+        if st["hook"] and (st["name_hook"] or not watch_titles):
+            QTimer.singleShot(first_delay_ms, check)
+        else:
+            QTimer.singleShot(first_delay_ms, functools.partial(poll, first_delay_ms))
+        QTimer.singleShot(timeout_ms, functools.partial(check, True))
+
+    def _await_pid_window(self, pid: int, on_window: Callable[[int], None], budget_ms: int) -> bool:
+        """Register pid with the shared EVENT_OBJECT_SHOW hook.
 
-    def _schedule_browser_placement_by_snapshot(self, before_windows: List[int], exe_name: str, quad: str, label: str):
+        on_window(hwnd) runs once in the event loop when a top-level window of pid is shown.
+        Returns False if no hook is available, so the caller keeps its full polling loop.
+        """
+        if not pid:
+            return False
+        if not self._pid_hook:
+            self._pid_hook = set_win_event_hook(self._on_pid_window_show)
+        if not self._shell_hook_msg:
+            self._register_shell_hook()
+        if not (self._pid_hook or self._shell_hook_msg):
+            return False
+        self._pending_placements[pid] = on_window
+        QTimer.singleShot(budget_ms, functools.partial(self._drop_pending_placement, pid, on_window))
+        return True
+
+    def _register_shell_hook(self):
+        try:
+            hwnd = int(self.winId())
+            if _RegisterShellHookWindow(hwnd):
+                self._shell_hook_msg = _RegisterWindowMessageW("SHELLHOOK")
+        except Exception:
+            self._shell_hook_msg = 0
+
+    def nativeEvent(self, event_type, message):
+        # Läuft für jede native Nachricht: ohne registrierten Shell-Hook sofort weiter
+        if self._shell_hook_msg:
+            try:
+                msg = wintypes.MSG.from_address(int(message))
+                if msg.message == self._shell_hook_msg and (msg.wParam & 0x7FFF) == HSHELL_WINDOWCREATED:
+                    self._on_pid_window_show(None, msg.lParam)
+            except Exception:
+                pass
+        return super().nativeEvent(event_type, message)
+
+    def _on_pid_window_show(self, _event, hwnd):
+        if not self._pending_placements:
+            return
+        try:
+            owner = win32process.GetWindowThreadProcessId(hwnd)[1]
+            if owner not in self._pending_placements:
+                return
+            # Nur Top-Level-Fenster (Child-Controls feuern dasselbe Event)
+            if win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE) & win32con.WS_CHILD:
+                return
+            # Splash, Tooltips und kleine Helfer-Popups nicht platzieren: Eintrag bleibt offen,
+            # bis das eigentliche Fenster kommt (gleiche Schwelle wie die Polling-Suche)
+            if not win32gui.IsWindowVisible(hwnd):
+                return
+            l, t, r, b = win32gui.GetWindowRect(hwnd)
+            if (r - l) < 200 or (b - t) < 120:
+                return
+        except Exception:
+            return
+        cb = self._pending_placements.pop(owner)
+        QTimer.singleShot(0, functools.partial(cb, hwnd))
+        QTimer.singleShot(0, self._release_pid_hook_if_idle)
+
+    def _drop_pending_placement(self, pid: int, on_window):
+        if self._pending_placements.get(pid) is on_window:
+            del self._pending_placements[pid]
+        self._release_pid_hook_if_idle()
+
+    def _release_pid_hook_if_idle(self):
+        if self._pending_placements:
+            return
+        if self._pid_hook:
+            unhook_win_event(self._pid_hook)
+            self._pid_hook = 0
+        if self._shell_hook_msg:
+            self._shell_hook_msg = 0
+            try:
+                _DeregisterShellHookWindow(int(self.winId()))
+            except Exception:
+                pass
+
+    def _hold_placement(self, hwnd: int, reapply: Callable[[], Any], hold_ms: int = 1500, max_reapply: int = 2):
+        """Re-apply a placement only if the app moves its window itself within hold_ms.
+
+        Replaces the blind second move 500 ms after placement: an EVENT_OBJECT_LOCATIONCHANGE
+        hook on the window's process fires reapply() when the rect drifts from the placed one.
+        """
+        try:
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            placed = win32gui.GetWindowRect(hwnd)
+        except Exception:
+            return
+        st = {"hook": 0, "placed": placed, "left": max_reapply, "queued": False}
+
+        def release():
+            unhook_win_event(st["hook"])
+            st["hook"] = 0
+
+        def apply():
+            st["queued"] = False
+            if not st["hook"]:
+                return
+            reapply()
+            st["left"] -= 1
+            try:
+                st["placed"] = win32gui.GetWindowRect(hwnd)
+            except Exception:
+                st["left"] = 0
+            if st["left"] <= 0:
+                release()
+
+        def on_move(_event, h):
+            if h != hwnd or st["queued"]:
+                return
+            try:
+                if win32gui.GetWindowRect(hwnd) == st["placed"]:
+                    return
+            except Exception:
+                return
+            st["queued"] = True
+            QTimer.singleShot(0, apply)
+
+        st["hook"] = set_win_event_hook(on_move, EVENT_OBJECT_LOCATIONCHANGE, pid=pid)
+        if st["hook"]:
+            QTimer.singleShot(hold_ms, release)
+
+    def _schedule_browser_placement_by_snapshot(self, before_windows: List[int], exe_name: str, quad: str, label: str,
+                                                pid: Optional[int] = None):
         """Place browser window using before/after snapshot comparison."""
-        def place_by_snapshot(attempt=0):
-            attempt += 1
-            
+        image_names = frozenset((exe_name,))
+        pid2img: Dict[int, str] = {}  # PID -> Image, lebt so lange wie die Poll-Schleife
+
+        def snapshot():
             # Get current browser windows
-            current_windows = find_windows_by_criteria(
-                image_names=[exe_name],
-                class_names=["Chrome_WidgetWin_1", "MozillaWindowClass", "ApplicationFrameWindow"]
-            )
-            
-            # Find new windows (not in before snapshot)
-            new_windows = [h for h in current_windows if h not in before_windows]
-            
-            if new_windows:
-                # Take the largest new window
-                target = max(new_windows, key=get_window_area)
-                x, y, w, h = get_quadrant_for_config(quad, self.cfg)
-                ok = move_window(target, x, y, w, h)
-                if ok:
-                    self._log(f"Browser placed: {label} → {quad} (hwnd={target}, new window)")
-                    
-                    # Update last active window for hotkey system
-                    self._update_last_active_window(target, None)
-                    
-                    QTimer.singleShot(500, lambda: move_window(target, x, y, w, h))
-                else:
-                    self._log(f"Browser placement failed for {label} (hwnd={target})")
-                return
-            
-            if attempt < 20:  # ~10 seconds for browsers
-                QTimer.singleShot(500, lambda: place_by_snapshot(attempt))
+            return find_windows_by_criteria(image_names=image_names, class_names=_BROWSER_CLASSES,
+                                            pid_cache=pid2img)
+
+        def place(target):
+            x, y, w, h = self._quadrant(quad)
+            ok = move_window_unchecked(target, x, y, w, h)
+            if ok:
+                self._log(f"Browser placed: {label} → {quad} (hwnd={target}, new window)")
+                
+                # Update last active window for hotkey system
+                self._update_last_active_window(target, None)
+                
+                self._hold_placement(target, functools.partial(move_window_unchecked, target, x, y, w, h, restore=False))
             else:
-                self._log(f"Browser placement timeout for {label} after {attempt} attempts")
+                self._log(f"Browser placement failed for {label} (hwnd={target})")
+
+        def timeout(attempt):
+            self._log(f"Browser placement timeout for {label} after {attempt} attempts")
+
+        # ~10 seconds for browsers
+        # Eigenes Fenster des neuen Prozesses direkt nehmen; Übergabe an laufende Instanz → Snapshot
+        self._watch_for_new_window(snapshot, before_windows, _BROWSER_CLASSES, place, timeout, budget_ms=10000,
+                                   pid=pid)
         
     def _launch_mmc_with_snapshot(self, path: str, label: str, args: List[str], uac: bool, quad: str):
         """Launch MMC-based tool with snapshot to handle single-instance behavior."""
-        # Take snapshot of current MMC windows BEFORE launch
-        before_windows = find_windows_by_criteria(
-            image_names=["mmc.exe"],
-            class_names=["MMCMainFrame"]
-        )
-        
-        try:
-            if uac:
-                ok, pid, elevated, err = try_start_exe_uac(path, args=args)
-            else:
-                ok, pid, elevated, err = try_start_exe(path, args=args)
+        # Take snapshot of current MMC windows BEFORE launch (im Worker, direkt vor dem Start)
+        def snapshot():
+            return find_windows_by_criteria(
+                image_names=_MMC_IMAGES,
+                class_names=_MMC_CLASSES
+            )
 
+        def started(ok, pid, err, before_windows):
             if ok:
                 self._log(f"{'MMC elevated' if uac else 'MMC'} started → {quad}")
                 # Schedule snapshot-based placement
                 self._schedule_mmc_placement_by_snapshot(before_windows, quad, label)
             else:
                 self._log(f"MMC start failed: {label} | {err}")
-        except Exception as e:
-            self._log(f"MMC launch exception: {e}")
+        self._start_exe_async(path, args, uac, started, "MMC launch exception",
+                              check_exists=True, before=snapshot)
 
     def _schedule_mmc_placement_by_snapshot(self, before_windows: List[int], quad: str, label: str):
         """Place MMC window using before/after snapshot comparison."""
-        def place_by_snapshot(attempt=0):
-            attempt += 1
-            
+        pid2img: Dict[int, str] = {}  # PID -> Image, lebt so lange wie die Poll-Schleife
+
+        def snapshot():
             # Get current MMC windows
-            current_windows = find_windows_by_criteria(
-                image_names=["mmc.exe"],
-                class_names=["MMCMainFrame"]
-            )
-            
-            # Find new windows (not in before snapshot)
-            new_windows = [h for h in current_windows if h not in before_windows]
+            return find_windows_by_criteria(image_names=_MMC_IMAGES, class_names=_MMC_CLASSES,
+                                            pid_cache=pid2img)
+
+        def place(target):
+            x, y, w, h = self._quadrant(quad)
+            self._log(f"MMC trying to place hwnd={target} at ({x},{y},{w},{h})")
             
-            if new_windows:
-                # Take the largest new window
-                target = max(new_windows, key=get_window_area)
-                x, y, w, h = get_quadrant_for_config(quad, self.cfg)
-                self._log(f"MMC trying to place hwnd={target} at ({x},{y},{w},{h})")
+            # Try standard move first
+            ok = move_window_unchecked(target, x, y, w, h)
+            if ok:
+                self._log(f"MMC placed: {label} → {quad} (hwnd={target}, new window)")
                 
-                # Try standard move first
-                ok = move_window(target, x, y, w, h)
-                if ok:
-                    self._log(f"MMC placed: {label} → {quad} (hwnd={target}, new window)")
-                    
-                    # Update last active window for hotkey system
-                    self._update_last_active_window(target, None)
-                    
-                    QTimer.singleShot(500, lambda: move_window(target, x, y, w, h))
-                    return
+                # Update last active window for hotkey system
+                self._update_last_active_window(target, None)
                 
-                # If standard move fails, try alternative WinAPI flags
-                self._log(f"Standard move failed, trying alternative WinAPI flags...")
-                ok_alt = self._try_alternative_window_move(target, x, y, w, h)
-                if ok_alt:
-                    self._log(f"MMC placed (alternative): {label} → {quad} (hwnd={target})")
-                    
-                    # Update last active window for hotkey system
-                    self._update_last_active_window(target, None)
-                    
-                    QTimer.singleShot(500, lambda: self._try_alternative_window_move(target, x, y, w, h))
-                    return
+                self._hold_placement(target, functools.partial(move_window_unchecked, target, x, y, w, h, restore=False))
+                return
+            
+            # If standard move fails, try alternative WinAPI flags
+            self._log(f"Standard move failed, trying alternative WinAPI flags...")
+            ok_alt = self._try_alternative_window_move(target, x, y, w, h)
+            if ok_alt:
+                self._log(f"MMC placed (alternative): {label} → {quad} (hwnd={target})")
                 
-                # Last resort: just detect and log
-                try:
-                    import win32gui
-                    rect = win32gui.GetWindowRect(target)
-                    self._log(f"MMC placement failed for {label} (hwnd={target}) - window rect: {rect}")
-                    self._log(f"MMC detected but unmoveable: {label} → {quad} (hwnd={target})")
-                except Exception as e:
-                    self._log(f"MMC placement failed for {label} (hwnd={target}) - error: {e}")
+                # Update last active window for hotkey system
+                self._update_last_active_window(target, None)
+                
+                self._hold_placement(target, functools.partial(self._try_alternative_window_move, target, x, y, w, h))
                 return
             
-            if attempt < 18:  # MMC can be slow to start
-                QTimer.singleShot(600, lambda: place_by_snapshot(attempt))
-            else:
-                self._log(f"MMC placement timeout for {label} after {attempt} attempts")
-        
-        # MMC needs time to initialize
-        QTimer.singleShot(1200, place_by_snapshot)
+            # Last resort: just detect and log
+            try:
+                rect = win32gui.GetWindowRect(target)
+                self._log(f"MMC placement failed for {label} (hwnd={target}) - window rect: {rect}")
+                self._log(f"MMC detected but unmoveable: {label} → {quad} (hwnd={target})")
+            except Exception as e:
+                self._log(f"MMC placement failed for {label} (hwnd={target}) - error: {e}")
+
+        def timeout(attempt):
+            self._log(f"MMC placement timeout for {label} after {attempt} attempts")
+
+        # MMC needs time to initialize and can be slow to start
+        # MMCMainFrame gibt es nur als Hauptfenster → Klasse + Image reichen ohne PID
+        self._watch_for_new_window(snapshot, before_windows, _MMC_CLASSES, place, timeout,
+                                   budget_ms=12000, first_delay_ms=1200, images=_MMC_IMAGES)
 
     def _load_logo(self):
         """Load logo.png if it exists, otherwise show placeholder."""
         try:
             logo_path = os.path.join(os.path.dirname(__file__), "logo.png")
             if os.path.exists(logo_path):
-                from PySide6.QtGui import QPixmap
                 pixmap = QPixmap(logo_path)
                 if not pixmap.isNull():
                     scaled_pixmap = pixmap.scaled(30, 30, Qt.KeepAspectRatio, Qt.SmoothTransformation)
@@ -1342,243 +2170,189 @@ class CommandCenter(QWidget):
                 "color:#7fd0ff;font-size:12px;font-weight:bold;"
             )
 
+    # Skaliertes Logo einmal pro Prozess laden, für alle Instanzen geteilt
+    _LOGO_PIXMAP: Optional[QPixmap] = None
+    _LOGO_CHECKED = False
+
+    @classmethod
+    def _logo_pixmap(cls) -> Optional[QPixmap]:
+        if not cls._LOGO_CHECKED:
+            cls._LOGO_CHECKED = True
+            try:
+                logo_path = os.path.join(os.path.dirname(__file__), "logo.png")
+                if os.path.exists(logo_path):
+                    pm = QPixmap(logo_path)
+                    if not pm.isNull():
+                        cls._LOGO_PIXMAP = pm.scaledToHeight(18, Qt.SmoothTransformation)
+            except Exception:
+                pass
+        return cls._LOGO_PIXMAP
+
     def _maybe_logo_label(self) -> Optional[QLabel]:
-        """Load logo.png if it exists, otherwise return None."""
-        try:
-            logo_path = os.path.join(os.path.dirname(__file__), "logo.png")
-            if os.path.exists(logo_path):
-                pm = QPixmap(logo_path)
-                if not pm.isNull():
-                    h = 18
-                    pm = pm.scaledToHeight(h, Qt.SmoothTransformation)
-                    lbl = QLabel()
-                    lbl.setPixmap(pm)
-                    lbl.setContentsMargins(0, 0, 6, 0)
-                    return lbl
-        except Exception:
-            pass
-        return None
+        """Return a label with the cached logo, or None if logo.png is missing."""
+        pm = self._logo_pixmap()
+        if pm is None:
+            return None
+        lbl = QLabel()
+        lbl.setPixmap(pm)
+        lbl.setContentsMargins(0, 0, 6, 0)
+        return lbl
 
     def _apply_chrome_style(self, w: QWidget, border_boost: float = 0.0):
         """Apply futuristic chrome container styling with glowing effects."""
-        # Enhanced glow intensity based on boost
-        glow_intensity = int(60 + (40 * max(0.0, min(1.0, border_boost))))
-        glow_alpha = min(255, glow_intensity)
-        
-        w.setStyleSheet(f"""
-        QWidget#chrome {{
-            background: qlineargradient(
-                x1:0, y1:0, x2:1, y2:1,
-                stop:0 rgba(26, 26, 46, 180), stop:0.2 rgba(22, 33, 62, 160), stop:0.5 rgba(15, 52, 96, 140), stop:0.8 rgba(22, 33, 62, 160), stop:1 rgba(26, 26, 46, 180)
-            );
-            border: 1px solid qlineargradient(
-                x1:0, y1:0, x2:1, y2:0,
-                stop:0 rgba(74, 144, 226, {glow_alpha}), 
-                stop:0.3 rgba(123, 179, 240, {glow_alpha}), 
-                stop:0.7 rgba(123, 179, 240, {glow_alpha}), 
-                stop:1 rgba(74, 144, 226, {glow_alpha})
-            );
-            border-radius: 16px;
-        }}
-        QSplitter#split::handle {{
-            background: transparent;
-            margin: 0px;
-            height: 1px;
-        }}
-        """)
-        
-        # Force style refresh
-        w.style().unpolish(w)
-        w.style().polish(w)
-        w.update()
-        
-        # Add glowing shadow effect
-        self._add_glow_effect(w, intensity=0.4)
-
-    def _add_glow_effect(self, widget, intensity=0.3, color=None):
-        """Add futuristic glowing effect to widget."""
+        # Enhanced glow intensity based on boost, snapped to a bin of the window stylesheet
+        bucket = _chrome_bucket(border_boost)
+        # Gleicher Bin → kein Re-Polish; sonst nur das Chrom neu auflösen
+        if w.property("boost") != bucket:
+            w.setProperty("boost", bucket)
+            st = w.style()
+            st.unpolish(w)
+            st.polish(w)
+
+    def _add_glow_effect(self, widget, intensity=0.3, color=None, blur_radius=25):
+        """Add futuristic glowing effect to widget (reuses an existing shadow)."""
         if color is None:
             color = QColor(74, 144, 226)  # Chrome blue
         
-        glow = QGraphicsDropShadowEffect()
-        glow.setBlurRadius(25)
+        glow = widget.graphicsEffect()
+        if not isinstance(glow, QGraphicsDropShadowEffect):
+            glow = QGraphicsDropShadowEffect(widget)
+            widget.setGraphicsEffect(glow)
+        glow.setBlurRadius(blur_radius)
         glow.setOffset(0, 0)
         glow.setColor(QColor(color.red(), color.green(), color.blue(), int(255 * intensity)))
-        widget.setGraphicsEffect(glow)
 
     def _apply_header_style(self, lbl: QLabel):
-        """Apply futuristic header styling with glow effects."""
-        lbl.setStyleSheet("""
-        QLabel#hdr { 
-            color: #e8f4fd; 
-            font-weight: 700; 
-            font-size: 14px;
-            /* text-shadow: 0 0 10px #e8f4fd; */  /* Qt doesn't support text-shadow */
-        }
-        QLabel#hdrsub { 
-            color: #7bb3f0; 
-            font-weight: 500; 
-            font-size: 12px;
-            /* text-shadow: 0 0 5px #7bb3f0; */  /* Qt doesn't support text-shadow */
-        }
-        """)
-        
-        # Force style refresh
-        lbl.style().unpolish(lbl)
-        lbl.style().polish(lbl)
-        lbl.update()
-        
-        # Add subtle glow effect to header
-        self._add_glow_effect(lbl, intensity=0.3, color=QColor(123, 179, 240))
+        """Apply futuristic header styling with glow effects (QSS via window stylesheet)."""
+        # Add subtle glow effect to header (small radius: blur cost grows ~r²)
+        self._add_glow_effect(lbl, intensity=0.3, color=QColor(123, 179, 240), blur_radius=8)
 
     def _apply_combo_style(self, combo: QComboBox):
-        """Apply futuristic combo box styling."""
-        combo.setStyleSheet("""
-        QComboBox#menucombo {
-            background: qlineargradient(
-                x1:0, y1:0, x2:1, y2:1,
-                stop:0 #1a1a2e, stop:0.3 #16213e, stop:0.7 #0f3460, stop:1 #1a1a2e
-            );
-            color: #e8f4fd;
-            border: 1px solid qlineargradient(
-                x1:0, y1:0, x2:1, y2:0,
-                stop:0 rgba(74, 144, 226, 120), stop:0.5 rgba(123, 179, 240, 100), stop:1 rgba(74, 144, 226, 120)
-            );
-            border-radius: 10px;
-            padding: 6px 10px;
-            min-width: 160px;
-            font-weight: 500;
-        }
-        QComboBox#menucombo::drop-down { 
-            width: 0px; 
-            border: none;
-            background: transparent;
-        }
-        QComboBox#menucombo::drop-down:hover {
-            background: transparent;
-        }
-        QComboBox#menucombo:hover { 
-            border: 1px solid rgba(123, 179, 240, 150);
-            color: #f0f8ff;
-        }
-        QComboBox QAbstractItemView {
-            background: #1a1a2e;
-            color: #e8f4fd;
-            selection-background-color: #4a90e2;
-            selection-color: #ffffff;
-            border: 1px solid rgba(123, 179, 240, 120);
-            border-radius: 8px;
-            padding: 4px;
-        }
-        QComboBox QAbstractItemView::item {
-            padding: 6px 10px;
-            border-radius: 4px;
-        }
-        QComboBox QAbstractItemView::item:hover {
-            background: #1a1a1a;
-            color: #00ffff;
-        }
-        """)
-        
-        # Force style refresh
-        combo.style().unpolish(combo)
-        combo.style().polish(combo)
-        combo.update()
+        """Apply futuristic combo box styling (QSS via window stylesheet)."""
+        # Breite aus fester Zeichenzahl statt aus jedem Eintrag; Popup ohne Size-Hint pro Zeile
+        combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        combo.setMinimumContentsLength(20)
+        view = combo.view()
+        if isinstance(view, QListView):
+            view.setUniformItemSizes(True)
         
         # Add glow effect to combo box
         self._add_glow_effect(combo, intensity=0.2, color=QColor(74, 144, 226))
 
     def keyPressEvent(self, event):
         """Handle hotkey presses for window management."""
-        try:
-            # Track user activity for animation control
-            self._resume_animations()
-            
-            # Check for Ctrl+Number combinations
-            if event.modifiers() == Qt.ControlModifier:
-                if event.key() == Qt.Key_0:
-                    # Ctrl+0: Center GUI to its start quadrant
-                    self._center_gui()
-                    event.accept()
-                    return
-                elif event.key() == Qt.Key_1:
-                    # Ctrl+1: Place last window in first RR_ORDER quadrant
-                    self._place_last_window_rr(0)
-                    event.accept()
-                    return
-                elif event.key() == Qt.Key_2:
-                    # Ctrl+2: Place last window in second RR_ORDER quadrant
-                    self._place_last_window_rr(1)
-                    event.accept()
-                    return
-                elif event.key() == Qt.Key_3:
-                    # Ctrl+3: Place last window in third RR_ORDER quadrant
-                    self._place_last_window_rr(2)
-                    event.accept()
-                    return
-                    
-        except Exception as e:
-            self._log(f"Hotkey error: {e}")
+        # Track user activity for animation control
+        self._resume_animations()
+        
+        # Ctrl+Number: one dict lookup instead of an elif chain
+        handler = self._ctrl_hotkeys.get(int(event.key())) if event.modifiers() == Qt.ControlModifier else None
+        if handler is not None:
+            try:
+                handler()
+            except Exception as e:
+                self._log(f"Hotkey error: {e}")
+            event.accept()
+            return
             
         # Call parent keyPressEvent for other keys
         super().keyPressEvent(event)
 
+    def _watch_primary_screen(self, screen):
+        """Invalidate the screen cache when the (new) primary screen changes geometry or DPI."""
+        self._invalidate_screen_cache()
+        if screen is not None:
+            screen.geometryChanged.connect(self._invalidate_screen_cache)
+            screen.availableGeometryChanged.connect(self._invalidate_screen_cache)
+            screen.logicalDotsPerInchChanged.connect(self._invalidate_screen_cache)
+
+    def _invalidate_screen_cache(self, *_):
+        self._screen_cache = None
+        self._placement_rects.clear()
+        refresh_monitors()
+
+    def _quadrant(self, quad: str) -> Tuple[int, int, int, int]:
+        """get_quadrant_for_config, memoized per quadrant until the screen setup changes."""
+        rect = self._placement_rects.get(quad)
+        if rect is None:
+            rect = self._placement_rects[quad] = get_quadrant_for_config(quad, self.cfg)
+        return rect
+
+    def _get_screen_metrics(self) -> Tuple[QRect, float, float]:
+        """Return (availableGeometry, logical DPI, device pixel ratio) of the primary screen.
+
+        Queried once and cached until a screen signal invalidates it; the quadrant
+        tables are rebuilt together with the cache.
+        """
+        if self._screen_cache is None:
+            screen = QGuiApplication.primaryScreen()
+            self._screen_cache = (screen.availableGeometry(), screen.logicalDotsPerInch(),
+                                  screen.devicePixelRatio())
+            self._recompute_quadrants()
+        return self._screen_cache
+
+    def _quads(self) -> Dict[str, QRect]:
+        self._get_screen_metrics()
+        return self._quad_rects
+
+    def _gui_quads(self) -> Dict[str, QRect]:
+        self._get_screen_metrics()
+        return self._gui_quad_rects
+
+    def _recompute_quadrants(self):
+        """Rebuild the quadrant tables for window placement and GUI centering."""
+        try:
+            screen_geometry, dpi, _dpr = self._screen_cache
+            sw = screen_geometry.width()
+            sh = screen_geometry.height()
+
+            # Window placement quadrants (edge margin 1%, half size minus margin)
+            qw, qh = int(sw * 0.48), int(sh * 0.48)
+            left, right = int(sw * 0.01), int(sw * 0.51)
+            top, bottom = int(sh * 0.01), int(sh * 0.51)
+            self._quad_rects = {
+                "TL": QRect(left, top, qw, qh),
+                "TR": QRect(right, top, qw, qh),
+                "BL": QRect(left, bottom, qw, qh),
+                "BR": QRect(right, bottom, qw, qh),
+            }
+
+            # GUI start quadrants with DPI-scaled size constraints
+            margin = int(sw * self._edge_margin_ratio)
+            scale_factor = dpi / 96.0  # 96 DPI is standard
+            self._size_constraints = min_w, min_h, max_w, max_h = (
+                int(600 * scale_factor), int(400 * scale_factor), int(sw * 0.8), int(sh * 0.8))
+            if sw <= 1920:  # 1080p or smaller
+                w = int(sw * 0.6) - margin  # 60% for smaller screens
+                h = int(sh * 0.7) - margin  # 70% height for better visibility
+            else:  # 4K or larger
+                w = int(sw * 0.4) - margin  # 40% for larger screens
+                h = int(sh * 0.5) - margin  # 50% height
+            w = max(min_w, min(w, max_w))
+            h = max(min_h, min(h, max_h))
+            gx, gy = int(sw * 0.5) + margin, int(sh * 0.5) + margin
+            self._gui_quad_rects = {
+                "TL": QRect(margin, margin, w, h),
+                "TR": QRect(gx, margin, w, h),
+                "BL": QRect(margin, gy, w, h),
+                "BR": QRect(gx, gy, w, h),
+            }
+        except Exception as e:
+            self._log(f"Quadrant recompute error: {e}", "DEBUG")
+
     def _center_gui(self):
         """Center the GUI window in its configured start quadrant."""
         try:
-            # Get primary screen geometry
-            screen = QApplication.primaryScreen()
-            screen_geometry = screen.availableGeometry()
-            
             # Get configured start quadrant (default: TR)
-            quadrant = getattr(self.cfg, 'GUI_START_QUADRANT', 'TR')
-            
-            # Calculate quadrant dimensions with DPI scaling
-            margin = int(screen_geometry.width() * self.cfg.EDGE_MARGIN_RATIO)
-            
-            # Get DPI scaling factor
-            dpi_scale = screen.devicePixelRatio()
-            logical_dpi = screen.logicalDotsPerInch()
-            scale_factor = logical_dpi / 96.0  # 96 DPI is standard
-            
-            # Calculate scaled dimensions based on screen size
-            if screen_geometry.width() <= 1920:  # 1080p or smaller
-                w = int(screen_geometry.width() * 0.6) - margin  # 60% for smaller screens
-                h = int(screen_geometry.height() * 0.7) - margin  # 70% height for better visibility
-            else:  # 4K or larger
-                w = int(screen_geometry.width() * 0.4) - margin  # 40% for larger screens
-                h = int(screen_geometry.height() * 0.5) - margin  # 50% height
-                
-            # Apply minimum and maximum size constraints
-            min_width = int(600 * scale_factor)
-            min_height = int(400 * scale_factor)
-            max_width = int(screen_geometry.width() * 0.8)
-            max_height = int(screen_geometry.height() * 0.8)
-            
-            w = max(min_width, min(w, max_width))
-            h = max(min_height, min(h, max_height))
-            
-            # Calculate position based on quadrant
-            if quadrant == "TL":  # Top-Left
-                x = margin
-                y = margin
-            elif quadrant == "TR":  # Top-Right
-                x = int(screen_geometry.width() * 0.5) + margin
-                y = margin
-            elif quadrant == "BL":  # Bottom-Left
-                x = margin
-                y = int(screen_geometry.height() * 0.5) + margin
-            elif quadrant == "BR":  # Bottom-Right
-                x = int(screen_geometry.width() * 0.5) + margin
-                y = int(screen_geometry.height() * 0.5) + margin
-            else:  # Fallback to TR
-                x = int(screen_geometry.width() * 0.5) + margin
-                y = margin
+            quadrant = self._start_quadrant
+            gui_quads = self._gui_quads()
+            rect = gui_quads.get(quadrant)
+            if rect is None:  # Fallback to TR
                 quadrant = "TR"
-            
+                rect = gui_quads["TR"]
+
             # Center within the quadrant
-            center_x = x + (w - self.width()) // 2
-            center_y = y + (h - self.height()) // 2
+            center_x = rect.x() + (rect.width() - self.width()) // 2
+            center_y = rect.y() + (rect.height() - self.height()) // 2
             
             # Move to quadrant center
             self.move(center_x, center_y)
@@ -1590,81 +2364,38 @@ class CommandCenter(QWidget):
     def _place_last_window(self, quadrant):
         """Place the last active window in the specified quadrant."""
         try:
-            if not self._last_active_window:
-                self.log("No last active window to place")
-                return
-                
-            # Get window handle and PID
             hwnd = self._last_active_window
-            pid = self._last_active_pid
-            
-            if not hwnd or not win32gui.IsWindow(hwnd):
-                self.log("Last active window no longer valid")
+            if not hwnd:
+                self._log("No last active window to place")
+                return
+            if not _IsWindow(hwnd):
+                self._log("Last active window no longer valid")
                 self._last_active_window = None
                 self._last_active_pid = None
                 return
-                
-            # Place window using existing logic
-            if quadrant == "TL":
-                self._place_window_tl(hwnd, pid)
-            elif quadrant == "TR":
-                self._place_window_tr(hwnd, pid)
-            elif quadrant == "BL":
-                self._place_window_bl(hwnd, pid)
-            elif quadrant == "BR":
-                self._place_window_br(hwnd, pid)
-                
-            self._log(f"Last active window placed in {quadrant}")
-            
+            if self._place_window(hwnd, self._last_active_pid, quadrant):
+                self._log(f"Last active window placed in {quadrant}")
         except Exception as e:
             self._log(f"Place last window error: {e}")
 
     def _place_last_window_rr(self, rr_index: int):
         """Place the last active window in the RR_ORDER quadrant at the specified index."""
-        try:
-            if not self._last_active_window:
-                self._log("No last active window to place")
-                return
-                
-            # Get RR_ORDER quadrants from config
-            rr_quadrants = self.cfg.RR_ORDER
-            if rr_index >= len(rr_quadrants):
-                self._log(f"RR_ORDER index {rr_index} out of range (max: {len(rr_quadrants)-1})")
-                return
-                
-            quad = rr_quadrants[rr_index]
-            self._log(f"Placing last window in RR_ORDER[{rr_index}] = {quad}")
-            
-            # Get window handle and PID
-            hwnd = self._last_active_window
-            pid = self._last_active_pid
-            
-            if not hwnd or not win32gui.IsWindow(hwnd):
-                self._log("Last active window no longer valid")
-                self._last_active_window = None
-                self._last_active_pid = None
-                return
-                
-            # Place window using existing logic
-            if quad == "TL":
-                self._place_window_tl(hwnd, pid)
-            elif quad == "TR":
-                self._place_window_tr(hwnd, pid)
-            elif quad == "BL":
-                self._place_window_bl(hwnd, pid)
-            elif quad == "BR":
-                self._place_window_br(hwnd, pid)
-                
-            self._log(f"Last active window placed in {quad} (RR_ORDER[{rr_index}])")
-            
-        except Exception as e:
-            self._log(f"Error placing last active window: {e}")
+        rr_quadrants = self._rr_order
+        if rr_index >= len(rr_quadrants):
+            self._log(f"RR_ORDER index {rr_index} out of range (max: {len(rr_quadrants)-1})")
+            return
+        quad = rr_quadrants[rr_index]
+        self._log(f"Placing last window in RR_ORDER[{rr_index}] = {quad}")
+        self._place_last_window(quad)
 
     def _schedule_powershell_placement(self, pid: int, quad: str, label: str, title: str):
         """Enhanced PowerShell window placement with multiple detection methods."""
         max_attempts = 25  # More attempts for PowerShell
+        st = {"done": False, "poll_ms": 0}
         
         def place_powershell(attempt=0):
+            if st["done"]:
+                return
             attempt += 1
             
             # Try multiple detection methods for PowerShell
@@ -1689,91 +2420,88 @@ class CommandCenter(QWidget):
                 windows = self._find_console_windows_by_pid(pid)
             
             if windows:
-                target = max(windows, key=get_window_area)
-                x, y, w, h = get_quadrant_for_config(quad, self.cfg)
+                place_target(max(windows, key=get_window_area))
+                return
                 
-                # Debug: Log window details
-                try:
-                    win_title = win32gui.GetWindowText(target)
-                    win_class = win32gui.GetClassName(target)
-                    self._log(f"PowerShell window found: hwnd={target}, class={win_class}, title='{win_title}'")
-                except:
-                    pass
+            if attempt < max_attempts:
+                # Longer delay for PowerShell (mit Hook: seltener, nur für Fremd-Hosts wie Terminal)
+                delay = st["poll_ms"] or (800 if attempt < 10 else 1200)
+                QTimer.singleShot(delay, functools.partial(place_powershell, attempt))
+            else:
+                self._log(f"PowerShell placement timeout for {label} after {attempt} attempts")
+        
+        def place_target(target):
+            if st["done"]:
+                return
+            st["done"] = True
+            x, y, w, h = self._quadrant(quad)
+            # Debug: Log window details
+            try:
+                win_title = win32gui.GetWindowText(target)
+                win_class = win32gui.GetClassName(target)
+                self._log(f"PowerShell window found: hwnd={target}, class={win_class}, title='{win_title}'")
+            except:
+                pass
                 
-                # Enhanced PowerShell placement
-                success = self._place_console_window(target, x, y, w, h, label)
+            # Enhanced PowerShell placement
+            success = self._place_console_window(target, x, y, w, h, label)
                 
-                if success:
-                    self._log(f"PowerShell placed: {label} → {quad} (hwnd={target}, PID={pid})")
+            if success:
+                self._log(f"PowerShell placed: {label} → {quad} (hwnd={target}, PID={pid})")
                     
-                    # Update last active window for hotkey system
-                    self._update_last_active_window(target, pid)
+                # Update last active window for hotkey system
+                self._update_last_active_window(target, pid)
                     
-                    # Double-check placement
-                    QTimer.singleShot(500, lambda: self._place_console_window(target, x, y, w, h, label))
-                else:
-                    self._log(f"PowerShell placement failed for {label} (hwnd={target}) - trying alternative methods")
-                    # Try alternative placement methods
-                    self._try_powershell_alternative_placement(target, x, y, w, h, label)
-                return
-                
-            if attempt < max_attempts:
-                # Longer delay for PowerShell
-                delay = 800 if attempt < 10 else 1200
-                QTimer.singleShot(delay, lambda: place_powershell(attempt))
+                # Re-apply only if the app moves the window itself
+                self._hold_placement(target, functools.partial(self._place_console_window, target, x, y, w, h, label))
             else:
-                self._log(f"PowerShell placement timeout for {label} after {attempt} attempts")
+                self._log(f"PowerShell placement failed for {label} (hwnd={target}) - trying alternative methods")
+                # Try alternative placement methods
+                self._try_powershell_alternative_placement(target, x, y, w, h, label)
         
+        # Fenster des PID per Hook abfangen; Polling nur noch als Sicherheitsnetz
+        if self._await_pid_window(pid, place_target, budget_ms=25000):
+            max_attempts, st["poll_ms"] = 12, 2000
         QTimer.singleShot(1000, place_powershell)
 
     def _try_powershell_alternative_placement(self, hwnd: int, x: int, y: int, w: int, h: int, label: str):
         """Try alternative placement methods for PowerShell windows."""
-        try:
-            # Method 1: Direct WinAPI with different flags
-            flags = win32con.SWP_SHOWWINDOW | win32con.SWP_NOZORDER
-            result = win32gui.SetWindowPos(hwnd, 0, x, y, w, h, flags)
-            if result:
-                self._log(f"PowerShell placed (WinAPI): {label} at ({x}, {y}, {w}, {h})")
-                return True
-        except Exception as e:
-            self._log(f"WinAPI placement failed: {e}")
-        
-        try:
-            # Method 2: MoveWindow
-            result = win32gui.MoveWindow(hwnd, x, y, w, h, True)
-            if result:
-                self._log(f"PowerShell placed (MoveWindow): {label} at ({x}, {y}, {w}, {h})")
-                return True
-        except Exception as e:
-            self._log(f"MoveWindow placement failed: {e}")
-        
-        try:
-            # Method 3: SetWindowPos with different flags
-            flags = win32con.SWP_SHOWWINDOW | win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE
-            result = win32gui.SetWindowPos(hwnd, 0, x, y, w, h, flags)
-            if result:
-                self._log(f"PowerShell placed (SetWindowPos): {label} at ({x}, {y}, {w}, {h})")
-                return True
-        except Exception as e:
-            self._log(f"SetWindowPos placement failed: {e}")
-        
+        method = _apply_placement_strategies(hwnd, x, y, w, h, _PS_PLACEMENT_STRATEGIES)
+        if method:
+            self._log(f"PowerShell placed ({method}): {label} at ({x}, {y}, {w}, {h})")
+            return True
         self._log(f"All alternative placement methods failed for {label}")
         return False
 
     def _update_last_active_window(self, hwnd, pid):
         """Update the last active window for hotkey placement."""
         try:
-            if hwnd and win32gui.IsWindow(hwnd):
+            if hwnd and _IsWindow(hwnd):
                 self._last_active_window = hwnd
                 self._last_active_pid = pid
                 self._log(f"Last active window updated: hwnd={hwnd}, pid={pid}")
         except Exception:
             pass
 
+    def _place_window(self, hwnd, pid, quad: str) -> bool:
+        """Place window in the given quadrant (TL/TR/BL/BR) using the cached screen split."""
+        r = self._quads().get(quad)
+        if r is None:
+            self._log(f"Unknown quadrant: {quad}")
+            return False
+        try:
+            x, y, w, h = r.x(), r.y(), r.width(), r.height()
+            _SetWindowPos(hwnd, 0, x, y, w, h, _SWP_SHOWWINDOW)
+            self._log(f"Window placed {quad}: ({x}, {y}, {w}, {h})")
+            return True
+        except Exception as e:
+            self._log(f"{quad} placement error: {e}")
+            return False
+
     def _init_animations(self):
         """Initialize CPU-efficient animation system for VDI environments."""
         # Animation state - MUCH more conservative
-        self._animation_phase = 0.0
+        self._animation_phase = 0  # Ganzzahlige Phase, siehe _SIN_LUT
         self._animation_timer = QTimer(self)
         self._animation_timer.timeout.connect(self._update_animations)
         self._animation_timer.start(200)  # 5 FPS - VDI optimized (was 20 FPS)
@@ -1783,42 +2511,48 @@ class CommandCenter(QWidget):
         self._button_pulse = 0.0
         self._console_pulse = 0.0
         
+        # Zuletzt angewendete Stufen: nur bei Stufenwechsel Style/Glow anfassen
+        self._last_chrome_bucket = None
+        self._last_button_bucket = None
+        
         # Animation control - only animate when needed
         self._animations_enabled = True
-        self._last_activity = time.time()
+        self._last_activity = _now()
 
     def _update_animations(self):
         """Update all animations - CPU efficient for VDI."""
         try:
             # Smart animation control - pause when idle
-            current_time = time.time()
+            current_time = _now()
             if current_time - self._last_activity > 10:  # Pause after 10s idle
                 if self._animations_enabled:
                     self._animations_enabled = False
                     self._pause_animations()
+                # Timer ganz anhalten statt 5×/s leer zu feuern; _resume_animations startet neu
+                self._animation_timer.stop()
                 return
             elif not self._animations_enabled:
                 self._animations_enabled = True
             
-            # Increment animation phase - much slower
-            self._animation_phase += 0.05  # Was 0.1 - half speed
-            if self._animation_phase > 6.28:  # 2*PI
-                self._animation_phase = 0.0
+            # Increment animation phase - much slower (one step = 0.05 rad, wraps at 2*PI)
+            n = self._animation_phase = (self._animation_phase + 1) % _PHASE_STEPS
             
-            # Calculate pulse values - much more subtle
-            self._chrome_pulse = 0.2 + 0.05 * math.sin(self._animation_phase * 0.3)  # Was 0.3 + 0.1
-            self._button_pulse = 0.1 + 0.03 * math.sin(self._animation_phase * 0.4)  # Was 0.2 + 0.05
-            self._console_pulse = 0.05 + 0.02 * math.sin(self._animation_phase * 0.2)  # Was 0.1 + 0.05
+            # Calculate pulse values - much more subtle (LUT statt math.sin)
+            self._chrome_pulse = 0.2 + 0.05 * _SIN_LUT[(n * _PULSE_M_CHROME >> 8) & 255]    # Was 0.3 + 0.1
+            self._button_pulse = 0.1 + 0.03 * _SIN_LUT[(n * _PULSE_M_BUTTON >> 8) & 255]    # Was 0.2 + 0.05
+            self._console_pulse = 0.05 + 0.02 * _SIN_LUT[(n * _PULSE_M_CONSOLE >> 8) & 255] # Was 0.1 + 0.05
             
-            # Update chrome glow - only if significant change
-            if abs(self._chrome_pulse - getattr(self, '_last_chrome_pulse', 0)) > 0.01:
+            # Update chrome glow - only if the alpha bin changes (most ticks are pure math)
+            bucket = _chrome_bucket(self._chrome_pulse)
+            if bucket != self._last_chrome_bucket:
                 self._apply_chrome_style(self.chrome, border_boost=self._chrome_pulse)
-                self._last_chrome_pulse = self._chrome_pulse
+                self._last_chrome_bucket = bucket
             
-            # Update button glows - only if buttons exist and significant change
-            if hasattr(self, 'btns') and abs(self._button_pulse - getattr(self, '_last_button_pulse', 0)) > 0.01:
+            # Update button glows - only if buttons exist and the glow alphas change
+            bucket = NeonButton._glow_alphas(self._button_pulse)
+            if hasattr(self, 'btns') and bucket != self._last_button_bucket:
                 self._update_button_animations()
-                self._last_button_pulse = self._button_pulse
+                self._last_button_bucket = bucket
                 
         except Exception as e:
             # Silent fail for VDI compatibility
@@ -1834,67 +2568,30 @@ class CommandCenter(QWidget):
             
             # Apply static state
             self._apply_chrome_style(self.chrome, border_boost=self._chrome_pulse)
+            self._last_chrome_bucket = _chrome_bucket(self._chrome_pulse)
             if hasattr(self, 'btns'):
                 self._update_button_animations()
+                self._last_button_bucket = NeonButton._glow_alphas(self._button_pulse)
         except Exception:
             pass
 
     def _resume_animations(self):
         """Resume animations when user becomes active."""
-        self._last_activity = time.time()
+        self._last_activity = _now()
         self._animations_enabled = True
+        if not self._animation_timer.isActive():
+            self._animation_timer.start()
 
     def _update_button_animations(self):
         """Update button glow animations - CPU efficient."""
         try:
-            for btn in self.btns.values():
-                if hasattr(btn, '_update_glow'):
-                    btn._update_glow(self._button_pulse)
+            NeonButton._tick_all(self._button_pulse)
         except Exception:
             pass
 
     def _apply_console_style(self, console: QTextEdit):
-        """Apply futuristic Matrix-style console styling."""
-        console.setStyleSheet("""
-        QTextEdit {
-            background: qlineargradient(
-                x1:0, y1:0, x2:1, y2:1,
-                stop:0 #0a0a0a, stop:0.3 #1a1a1a, stop:0.7 #0f0f0f, stop:1 #0a0a0a
-            );
-            color: #00ff41;
-            border: 1px solid qlineargradient(
-                x1:0, y1:0, x2:1, y2:0,
-                stop:0 rgba(74, 144, 226, 120), stop:0.5 rgba(123, 179, 240, 100), stop:1 rgba(74, 144, 226, 120)
-            );
-            border-radius: 12px;
-            font-family: 'Consolas', 'Cascadia Mono', 'Courier New', monospace;
-            font-size: 11px;
-            padding: 12px;
-            selection-background-color: #00ff41;
-            selection-color: #000000;
-        }
-        QTextEdit::scrollbar:vertical {
-            background: #1a1a1a;
-            width: 14px;
-            border-radius: 7px;
-            border: 1px solid #00ff41;
-        }
-        QTextEdit::scrollbar::handle:vertical {
-            background: qlineargradient(
-                x1:0, y1:0, x2:1, y2:0,
-                stop:0 #4a90e2, stop:0.5 #7bb3f0, stop:1 #4a90e2
-            );
-            border-radius: 6px;
-            min-height: 20px;
-        }
-        QTextEdit::scrollbar::handle:vertical:hover {
-            background: #00ffff;
-        }
-        QTextEdit::scrollbar::add-line:vertical,
-        QTextEdit::scrollbar::sub-line:vertical {
-            height: 0px;
-        }
-        """)
+        """Apply futuristic Matrix-style console styling (QSS via window stylesheet)."""
+        console.setObjectName("console")
         
         # Set monospace font
         f = QFont()
@@ -1920,18 +2617,24 @@ class CommandCenter(QWidget):
     def _copy_console(self):
         """Copy console content to clipboard."""
         try:
+            self._flush_console()
             console_text = self.console.toPlainText()
             if console_text:
-                from PySide6.QtGui import QGuiApplication
                 clipboard = QGuiApplication.clipboard()
                 clipboard.setText(console_text)
                 
-                # Brief visual feedback
-                original_text = self.console.toHtml()
-                self.console.setHtml(original_text + "<br/><span style='color:#06d6a0;font-weight:bold;'>Console content copied to clipboard!</span>")
+                # Brief visual feedback: Overlay statt toHtml/setHtml-Rundreise über das ganze Dokument
+                banner = self._copy_banner
+                if banner is None:
+                    banner = self._copy_banner = QLabel("Console content copied to clipboard!", self.console)
+                    banner.setStyleSheet("color:#06d6a0; font-weight:bold; background:rgba(0,0,0,180); padding:2px 6px;")
+                    banner.adjustSize()
+                vp = self.console.viewport().geometry()
+                banner.move(vp.right() - banner.width() - 8, vp.bottom() - banner.height() - 6)
+                banner.show(); banner.raise_()
                 
                 # Remove feedback after 2 seconds
-                QTimer.singleShot(2000, lambda: self.console.setHtml(original_text))
+                QTimer.singleShot(2000, banner.hide)
                 
                 self._log("Console content copied to clipboard")
             else:
@@ -1941,50 +2644,21 @@ class CommandCenter(QWidget):
 
     def _try_alternative_window_move(self, hwnd: int, x: int, y: int, w: int, h: int) -> bool:
         """Try alternative WinAPI methods for stubborn windows like MMC."""
-        try:
-            import win32gui
-            import win32con
-            
-            # Method 1: Try with different SetWindowPos flags
-            try:
-                # SWP_NOACTIVATE | SWP_NOZORDER (don't activate or change Z-order)
-                win32gui.SetWindowPos(hwnd, None, x, y, w, h, 
-                                     win32con.SWP_NOACTIVATE | win32con.SWP_NOZORDER)
-                self._log(f"Alternative move method 1 succeeded for hwnd={hwnd}")
-                return True
-            except Exception:
-                pass
-            
-            # Method 2: Try MoveWindow API instead of SetWindowPos
-            try:
-                win32gui.MoveWindow(hwnd, x, y, w, h, True)  # True = repaint
-                self._log(f"Alternative move method 2 (MoveWindow) succeeded for hwnd={hwnd}")
-                return True
-            except Exception:
-                pass
-            
-            # Method 3: Try ShowWindow + SetWindowPos combination
-            try:
-                win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)  # Ensure not minimized
-                win32gui.SetWindowPos(hwnd, win32con.HWND_TOP, x, y, w, h, 
-                                     win32con.SWP_NOACTIVATE)
-                self._log(f"Alternative move method 3 (ShowWindow+SetWindowPos) succeeded for hwnd={hwnd}")
-                return True
-            except Exception:
-                pass
-            
-            self._log(f"All alternative move methods failed for hwnd={hwnd}")
-            return False
-            
-        except Exception as e:
-            self._log(f"Alternative move method exception: {e}")
-            return False
+        method = _apply_placement_strategies(hwnd, x, y, w, h, _ALT_MOVE_STRATEGIES)
+        if method:
+            self._log(f"Alternative move ({method}) succeeded for hwnd={hwnd}")
+            return True
+        self._log(f"All alternative move methods failed for hwnd={hwnd}")
+        return False
 
     def _schedule_window_placement_by_pid(self, pid: int, quad: str, label: str, is_browser: bool = False):
         """Schedule window placement based on PID with enhanced CMD/PS1 support."""        
         max_attempts = 20  # Increased for CMD/PS1 which can be slower
+        st = {"done": False, "poll_ms": 0}
         
         def place_by_pid(attempt=0):
+            if st["done"]:
+                return
             attempt += 1
             
             # Enhanced window detection for CMD/PS1
@@ -1996,374 +2670,302 @@ class CommandCenter(QWidget):
                 windows = self._find_console_windows_by_pid(pid)
             
             if windows:
-                target = max(windows, key=get_window_area)
-                x, y, w, h = get_quadrant_for_config(quad, self.cfg)
-                
-                # Enhanced placement for console applications
-                if label.lower() in ['cmd', 'powershell', 'ps']:
-                    success = self._place_console_window(target, x, y, w, h, label)
-                else:
-                    success = move_window(target, x, y, w, h)
-                
-                if success:
-                    self._log(f"Window placed: {label} → {quad} (hwnd={target}, PID={pid})")
-                    
-                    # Update last active window for hotkey system
-                    self._update_last_active_window(target, pid)
-                    
-                    # Double-check placement for console apps
-                    if label.lower() in ['cmd', 'powershell', 'ps']:
-                        QTimer.singleShot(300, lambda: self._place_console_window(target, x, y, w, h, label))
-                    else:
-                        QTimer.singleShot(500, lambda: move_window(target, x, y, w, h))
-                else:
-                    self._log(f"Window placement failed for {label} (hwnd={target})")
+                place_target(max(windows, key=get_window_area))
                 return
                 
             if attempt < max_attempts:
                 # Longer delay for console applications
-                delay = 600 if label.lower() in ['cmd', 'powershell', 'ps'] else 500
-                QTimer.singleShot(delay, lambda: place_by_pid(attempt))
+                delay = st["poll_ms"] or (600 if label.lower() in ['cmd', 'powershell', 'ps'] else 500)
+                QTimer.singleShot(delay, functools.partial(place_by_pid, attempt))
             else:
                 self._log(f"Window placement timeout for {label} (PID={pid}) after {attempt} attempts")
         
+        def place_target(target):
+            if st["done"]:
+                return
+            st["done"] = True
+            x, y, w, h = self._quadrant(quad)
+            # Enhanced placement for console applications
+            if label.lower() in ['cmd', 'powershell', 'ps']:
+                success = self._place_console_window(target, x, y, w, h, label)
+            else:
+                success = move_window_unchecked(target, x, y, w, h)
+                
+            if success:
+                self._log(f"Window placed: {label} → {quad} (hwnd={target}, PID={pid})")
+                    
+                # Update last active window for hotkey system
+                self._update_last_active_window(target, pid)
+                    
+                # Re-apply only if the app moves itself (console apps: console placement)
+                if label.lower() in ['cmd', 'powershell', 'ps']:
+                    self._hold_placement(target, functools.partial(self._place_console_window, target, x, y, w, h, label))
+                else:
+                    self._hold_placement(target, functools.partial(move_window_unchecked, target, x, y, w, h, restore=False))
+            else:
+                self._log(f"Window placement failed for {label} (hwnd={target})")
+        
+        # Fenster des PID per Hook abfangen; Polling nur noch als Sicherheitsnetz
+        if self._await_pid_window(pid, place_target, budget_ms=20000):
+            max_attempts, st["poll_ms"] = 6, 2000
         # Longer initial delay for console applications
         initial_delay = 1200 if label.lower() in ['cmd', 'powershell', 'ps'] else 800
         QTimer.singleShot(initial_delay, place_by_pid)
 
+    # Ein EnumWindows-Durchlauf bedient alle Launches, die im selben Zeitfenster pollen
+    CONSOLE_SCAN_TTL_S = 0.25
+    WINDOW_SNAPSHOT_TTL_S = 0.2
+
+    def _window_snapshot(self) -> Tuple[float, List[int], Dict[int, str]]:
+        now = _now()
+        snap = self._win_snapshot
+        if snap is None or now - snap[0] > self.WINDOW_SNAPSHOT_TTL_S:
+            snap = self._win_snapshot = (now, enum_visible_toplevel_windows(), {})
+        return snap
+
+    def _find_windows(self, **criteria) -> List[int]:
+        """find_windows_by_criteria over one top-level snapshot shared by all pending placements."""
+        snap = self._window_snapshot()
+        return find_windows_by_criteria(hwnds=snap[1], pid_cache=snap[2], **criteria)
+
+    def _find_windows_multi(self, *queries: Dict[str, Any]) -> List[List[int]]:
+        """find_windows_multi over the shared snapshot; one result list per query."""
+        snap = self._window_snapshot()
+        return find_windows_multi(queries, hwnds=snap[1], pid_cache=snap[2])
+
     def _find_console_windows_by_pid(self, pid: int) -> List[int]:
         """Enhanced console window detection for CMD/PS1 applications."""
+        now = _now()
+        scan = self._console_scan
+        if scan is None or now - scan[0] > self.CONSOLE_SCAN_TTL_S:
+            scan = self._console_scan = (now, self._scan_console_windows())
+        return list(scan[1].get(int(pid), ()))
+
+    def _scan_console_windows(self) -> Dict[int, List[int]]:
+        """One top-level window walk: visible console windows (>= 200x120), grouped by PID."""
         try:
-            import win32gui
-            import win32process
-            
-            # Look for console-specific window classes
-            console_classes = ["ConsoleWindowClass", "VirtualConsoleClass"]
-            windows = []
+            by_pid: Dict[int, List[int]] = {}
             
             def enum_callback(hwnd, _):
                 try:
+                    # Class first: rejects almost every window before any other call
+                    if win32gui.GetClassName(hwnd) not in _CONSOLE_CLASSES:
+                        return True
                     if not win32gui.IsWindowVisible(hwnd):
                         return True
                     if win32gui.GetParent(hwnd):
                         return True
                     
-                    # Check if it's a console window
-                    class_name = win32gui.GetClassName(hwnd)
-                    if class_name not in console_classes:
-                        return True
-                    
-                    # Check PID match
                     _, window_pid = win32process.GetWindowThreadProcessId(hwnd)
-                    if int(window_pid) != int(pid):
-                        return True
                     
-                    # Check minimum size
+                    # Check minimum size (last: the most expensive query)
                     l, t, r, b = win32gui.GetWindowRect(hwnd)
                     if (r - l) < 200 or (b - t) < 120:
                         return True
                     
-                    windows.append(hwnd)
+                    by_pid.setdefault(int(window_pid), []).append(hwnd)
                 except Exception:
                     pass
                 return True
             
             win32gui.EnumWindows(enum_callback, None)
-            return windows
+            return by_pid
             
         except Exception as e:
             self._log(f"Console window detection failed: {e}")
-            return []
+            return {}
 
     def _place_console_window(self, hwnd: int, x: int, y: int, w: int, h: int, label: str) -> bool:
         """Enhanced console window placement with multiple fallback methods."""
         try:
-            import win32gui
-            import win32con
-            
-            # Method 1: Standard SetWindowPos
-            try:
-                if move_window(hwnd, x, y, w, h):
-                    return True
-            except Exception:
-                pass
-            
-            # Method 2: Force console window restoration and placement
-            try:
-                # Ensure window is not minimized
-                win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                win32gui.SetForegroundWindow(hwnd)
-                
-                # Try SetWindowPos with different flags
-                win32gui.SetWindowPos(hwnd, win32con.HWND_TOP, x, y, w, h, 
-                                    win32con.SWP_SHOWWINDOW | win32con.SWP_NOACTIVATE)
-                return True
-            except Exception:
-                pass
-            
-            # Method 3: MoveWindow API (often works better for console windows)
-            try:
-                win32gui.MoveWindow(hwnd, x, y, w, h, True)
+            if move_window_unchecked(hwnd, x, y, w, h):
                 return True
-            except Exception:
-                pass
-            
-            # Method 4: Alternative SetWindowPos flags
-            try:
-                win32gui.SetWindowPos(hwnd, None, x, y, w, h, 
-                                    win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE)
-                return True
-            except Exception:
-                pass
-            
-            return False
-            
-        except Exception as e:
-            self._log(f"Console placement failed for {label}: {e}")
-            return False
+        except Exception:
+            pass
+        # Konsolen vor dem Verschieben wiederherstellen und in den Vordergrund holen
+        if _apply_placement_strategies(hwnd, x, y, w, h, _CONSOLE_PLACEMENT_STRATEGIES,
+                                       on_restore=win32gui.SetForegroundWindow):
+            return True
+        self._log(f"Console placement failed for {label}")
+        return False
 
     def _get_current_session_id(self) -> int:
         """Get current RDSH session ID for proper window targeting."""
-        try:
-            import win32ts
-            return win32ts.WTSGetCurrentSessionId()
-        except Exception:
-            return 0
+        return _current_session_id()
 
     def _launch_rds_application(self, path: str, label: str, args: List[str], uac: bool, quad: str, window_placement: dict):
         """Launch RDSH application with enhanced session-aware window placement."""
         try:
             # Get current session ID for logging
-            current_session = self._get_current_session_id()
+            current_session = self._session_id
             self._log(f"RDSH Launch: {label} in session {current_session}")
             
             # Launch the application
-            if uac:
-                ok, pid, elevated, err = try_start_exe_uac(path, args=args)
-            else:
-                ok, pid, elevated, err = try_start_exe(path, args=args)
-            
-            if ok and pid:
-                self._log(f"RDSH App started: {label} (PID={pid}, Session={current_session}) → {quad}")
-                
-                # Enhanced RDSH window placement
-                self._schedule_rds_window_placement(pid, quad, label, window_placement, current_session)
-            elif ok:
-                self._log(f"RDSH App started (no PID): {label} → {quad}")
-                # Fallback to generic placement
-                self._schedule_window_placement_generic(path, quad, label)
-            else:
-                self._log(f"RDSH App start failed: {label} | {err}")
+            def started(ok, pid, err, _snap):
+                if ok and pid:
+                    self._log(f"RDSH App started: {label} (PID={pid}, Session={current_session}) → {quad}")
+                    
+                    # Enhanced RDSH window placement
+                    self._schedule_rds_window_placement(pid, quad, label, window_placement, current_session)
+                elif ok:
+                    self._log(f"RDSH App started (no PID): {label} → {quad}")
+                    # Fallback to generic placement
+                    self._schedule_window_placement_generic(path, quad, label)
+                else:
+                    self._log(f"RDSH App start failed: {label} | {err}")
+            self._start_exe_async(path, args, uac, started, "RDSH Launch exception")
                 
         except Exception as e:
             self._log(f"RDSH Launch exception: {e}")
 
     def _schedule_rds_window_placement(self, pid: int, quad: str, label: str, window_placement: dict, session_id: int):
         """Schedule RDSH-aware window placement with enhanced detection."""
-        max_attempts = 25  # Longer timeout for RDSH applications
         method = window_placement.get("method", "pid")
         title_contains = window_placement.get("title_contains", [])
         class_names = window_placement.get("class_names", [])
-        fallback_timeout = window_placement.get("fallback_timeout", 5000)
         
-        def place_rds_window(attempt=0):
-            attempt += 1
-            
+        def find_rds_windows():
             # Try different detection methods based on configuration
             windows = []
             
             if method == "pid":
                 # Standard PID-based detection
-                windows = find_windows_by_criteria(pid=pid, session_id=session_id)
+                windows = self._find_windows(pid=pid, session_id=session_id)
             elif method == "title_match":
                 # Title-based detection for RDSH applications
-                windows = find_windows_by_criteria(
+                windows = self._find_windows(
                     title_contains=title_contains,
                     class_names=class_names,
                     session_id=session_id
                 )
             elif method == "hybrid":
-                # Try both PID and title matching
-                windows = find_windows_by_criteria(pid=pid, session_id=session_id)
-                if not windows:
-                    windows = find_windows_by_criteria(
-                        title_contains=title_contains,
-                        class_names=class_names,
-                        session_id=session_id
-                    )
+                # PID und Titel in einem Durchlauf; Titel/Klasse nur als Fallback, wenn die PID
+                # kein Fenster hat (und nur, wenn konfiguriert – leere Filter träfen jedes Fenster)
+                queries = [{"pid": pid, "session_id": session_id}]
+                if title_contains or class_names:
+                    queries.append({"title_contains": title_contains, "class_names": class_names,
+                                    "session_id": session_id})
+                windows = next((found for found in self._find_windows_multi(*queries) if found), [])
+            return windows
+        
+        def place_rds_window(target):
+            x, y, w, h = self._quadrant(quad)
+            self._queue_move(target, x, y, w, h, functools.partial(placed, target, x, y, w, h))
+        
+        def placed(target, x, y, w, h, ok):
+            # Enhanced placement for RDSH windows (Fallbacks nur, wenn der Batch-Move scheitert)
+            success = ok or self._place_rds_window(target, x, y, w, h, label)
             
-            if windows:
-                target = max(windows, key=get_window_area)
-                x, y, w, h = get_quadrant_for_config(quad, self.cfg)
+            if success:
+                self._log(f"RDSH Window placed: {label} → {quad} (hwnd={target}, Session={session_id})")
                 
-                # Enhanced placement for RDSH windows
-                success = self._place_rds_window(target, x, y, w, h, label)
+                # Update last active window for hotkey system
+                self._update_last_active_window(target, pid)
                 
-                if success:
-                    self._log(f"RDSH Window placed: {label} → {quad} (hwnd={target}, Session={session_id})")
-                    
-                    # Update last active window for hotkey system
-                    self._update_last_active_window(target, pid)
-                    
-                    # Double-check placement
-                    QTimer.singleShot(500, lambda: self._place_rds_window(target, x, y, w, h, label))
-                else:
-                    self._log(f"RDSH Window placement failed for {label} (hwnd={target})")
-                return
-            
-            if attempt < max_attempts:
-                # Longer delay for RDSH applications
-                delay = 800 if attempt < 10 else 1000
-                QTimer.singleShot(delay, lambda: place_rds_window(attempt))
+                # Re-apply only if the app moves the window itself
+                self._hold_placement(target, functools.partial(self._place_rds_window, target, x, y, w, h, label))
             else:
-                self._log(f"RDSH Window placement timeout for {label} after {attempt} attempts")
+                self._log(f"RDSH Window placement failed for {label} (hwnd={target})")
         
-        # Initial delay for RDSH applications
-        QTimer.singleShot(1500, place_rds_window)
+        # Gleiches Zeitbudget wie die alte Kette (1,5 s Vorlauf + 25 Versuche à 0,8–1 s)
+        self._hook_for_window(
+            find_rds_windows, place_rds_window,
+            functools.partial(self._log, f"RDSH Window placement timeout for {label}"),
+            timeout_ms=24000, first_delay_ms=1500,
+            pid=pid if method == "pid" else 0, poll_ms=1000,
+            watch_titles=method in ("title_match", "hybrid") and bool(title_contains))
 
     def _place_rds_window(self, hwnd: int, x: int, y: int, w: int, h: int, label: str) -> bool:
-        """Enhanced RDSH window placement with multiple fallback methods."""
+        """Enhanced RDSH window placement with multiple fallback methods.
+
+        Method 0 is the standard move, 1.. index _RDS_PLACEMENT_STRATEGIES; the last
+        winner for label is tried first, so steady state is a single call.
+        """
+        first = self._rds_success_method.get(label, 0)
         try:
-            import win32gui
-            import win32con
-            
-            # Method 1: Standard placement
-            if move_window(hwnd, x, y, w, h):
-                return True
-            
-            # Method 2: RDSH-specific placement (often needs different flags)
-            try:
-                win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                win32gui.SetWindowPos(hwnd, win32con.HWND_TOP, x, y, w, h, 
-                                    win32con.SWP_SHOWWINDOW | win32con.SWP_NOACTIVATE)
-                return True
-            except Exception:
-                pass
-            
-            # Method 3: Alternative flags for RDSH windows
-            try:
-                win32gui.SetWindowPos(hwnd, None, x, y, w, h, 
-                                    win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE | win32con.SWP_SHOWWINDOW)
-                return True
-            except Exception:
-                pass
-            
-            # Method 4: MoveWindow as last resort
-            try:
-                win32gui.MoveWindow(hwnd, x, y, w, h, True)
-                return True
-            except Exception:
-                pass
-            
-            return False
-            
+            for i in (first,) + tuple(i for i in range(len(_RDS_PLACEMENT_STRATEGIES) + 1) if i != first):
+                if i == 0:
+                    ok = move_window_unchecked(hwnd, x, y, w, h)
+                else:
+                    ok = _apply_placement_strategies(hwnd, x, y, w, h, _RDS_PLACEMENT_STRATEGIES[i - 1:i])
+                if ok:
+                    self._rds_success_method[label] = i
+                    return True
         except Exception as e:
-            self._log(f"RDSH placement failed for {label}: {e}")
+            self._log(f"RDSH placement error for {label}: {e}")
             return False
+        self._log(f"RDSH placement failed for {label}")
+        return False
 
     def _schedule_window_placement_by_title(self, title: str, quad: str, label: str):
         """Schedule window placement based on window title."""
-        def place_by_title(attempt=0):
-            attempt += 1
-            windows = find_windows_by_criteria(title_contains=[title])
-            if windows:
-                target = max(windows, key=get_window_area)
-                x, y, w, h = get_quadrant_for_config(quad, self.cfg)
-                ok = move_window(target, x, y, w, h)
-                if ok:
-                    self._log(f"Window placed: {label} → {quad} (hwnd={target}, title='{title}')")
-                    
-                    # Update last active window for hotkey system
-                    self._update_last_active_window(target, None)
-                    
-                    QTimer.singleShot(500, lambda: move_window(target, x, y, w, h))
-                else:
-                    self._log(f"Window placement failed for {label} (hwnd={target})")
-                return
-            if attempt < 15:
-                QTimer.singleShot(500, lambda: place_by_title(attempt))
+        def place_by_title(target):
+            x, y, w, h = self._quadrant(quad)
+            self._queue_move(target, x, y, w, h, functools.partial(placed, target, x, y, w, h))
+        
+        def placed(target, x, y, w, h, ok):
+            if ok:
+                self._log(f"Window placed: {label} → {quad} (hwnd={target}, title='{title}')")
+                
+                # Update last active window for hotkey system
+                self._update_last_active_window(target, None)
+                
+                self._hold_placement(target, functools.partial(move_window_unchecked, target, x, y, w, h, restore=False))
             else:
-                self._log(f"Window placement timeout for {label} (title='{title}')")
+                self._log(f"Window placement failed for {label} (hwnd={target})")
         
-        QTimer.singleShot(1200, place_by_title)  # Longer delay for elevated processes
+        # Longer first delay for elevated processes
+        self._hook_for_window(
+            functools.partial(self._find_windows, title_contains=(title,)), place_by_title,
+            functools.partial(self._log, f"Window placement timeout for {label} (title='{title}')"),
+            timeout_ms=8200, first_delay_ms=1200, poll_ms=500, watch_titles=True)
 
     def _schedule_window_placement_generic(self, exe_path: str, quad: str, label: str):
         """Schedule window placement based on executable name."""
-        exe_name = os.path.basename(exe_path).lower()
-        
-        # Heuristics for different program types
-        image_names = [exe_name]
-        class_names = []
-        title_hints = []
-        
-        if exe_name in ("taskmgr.exe", "taskmanager.exe"):
-            class_names = ["TaskManagerWindow"]
-            title_hints = ["task manager", "taskmanager"]
-        elif exe_name in ("msedge.exe", "chrome.exe", "firefox.exe"):
-            image_names = ["msedge.exe", "chrome.exe", "firefox.exe"]
-            class_names = ["Chrome_WidgetWin_1", "MozillaWindowClass", "ApplicationFrameWindow"]
-        elif exe_name in ("eventvwr.exe", "mmc.exe"):
-            class_names = ["MMCMainFrame"]
-            title_hints = ["event viewer", "ereignisanzeige"]
+        exe_name, image_names, class_names, title_hints = _classify_exe(exe_path)
         
-        def place_generic(attempt=0):
-            attempt += 1
-            windows = find_windows_by_criteria(
+        def find_generic():
+            return self._find_windows(
                 image_names=image_names,
                 class_names=class_names if class_names else None,
                 title_contains=title_hints if title_hints else None
             )
-            if windows:
-                target = max(windows, key=get_window_area)
-                x, y, w, h = get_quadrant_for_config(quad, self.cfg)
-                ok = move_window(target, x, y, w, h)
-                if ok:
-                    self._log(f"Window placed: {label} → {quad} (hwnd={target}, exe={exe_name})")
-                    
-                    # Update last active window for hotkey system
-                    self._update_last_active_window(target, None)
-                    
-                    QTimer.singleShot(500, lambda: move_window(target, x, y, w, h))
-                else:
-                    self._log(f"Window placement failed for {label} (hwnd={target})")
-                return
-            if attempt < 12:
-                QTimer.singleShot(600, lambda: place_generic(attempt))
+        
+        def place_generic(target):
+            x, y, w, h = self._quadrant(quad)
+            self._queue_move(target, x, y, w, h, functools.partial(placed, target, x, y, w, h))
+        
+        def placed(target, x, y, w, h, ok):
+            if ok:
+                self._log(f"Window placed: {label} → {quad} (hwnd={target}, exe={exe_name})")
+                
+                # Update last active window for hotkey system
+                self._update_last_active_window(target, None)
+                
+                self._hold_placement(target, functools.partial(move_window_unchecked, target, x, y, w, h, restore=False))
             else:
-                self._log(f"Window placement timeout for {label} (exe={exe_name})")
+                self._log(f"Window placement failed for {label} (hwnd={target})")
         
-        QTimer.singleShot(1000, place_generic)
+        self._hook_for_window(
+            find_generic, place_generic,
+            functools.partial(self._log, f"Window placement timeout for {label} (exe={exe_name})"),
+            timeout_ms=7600, first_delay_ms=1000, poll_ms=600, watch_titles=bool(title_hints))
 
     def _launch_url_isolated(self, url: str, quad: str):
         """Launch URL in isolated browser."""
-        browsers = {
-            "edge": [which("msedge.exe"), r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe"],
-            "chrome": [which("chrome.exe"), r"C:\Program Files\Google\Chrome\Application\chrome.exe"],
-            "firefox": [which("firefox.exe"), r"C:\Program Files\Mozilla Firefox\firefox.exe"]
-        }
-        
-        browser_exe = None
-        browser_name = ""
+        browser = _resolve_browser()
         
-        for name, paths in browsers.items():
-            for path in paths:
-                if path and os.path.exists(path):
-                    browser_exe = path
-                    browser_name = name
-                    break
-            if browser_exe:
-                break
-        
-        if not browser_exe:
+        if not browser:
             # Fallback to default browser
             if os.name == "nt":
                 os.startfile(url)
             self._log(f"URL launched (default browser): {url}")
             return
         
-        # Create temp profile
-        import random
-        temp_profile = os.path.join(tempfile.gettempdir(), f"CockpitBrowser_{browser_name}_{random.randint(1000,9999)}")
+        browser_exe, browser_name = browser
+        
+        # Create temp profile (32 Bit Zufall statt 9000 möglicher Suffixe)
+        temp_profile = os.path.join(tempfile.gettempdir(), f"CockpitBrowser_{browser_name}_{random.getrandbits(32):08x}")
         os.makedirs(temp_profile, exist_ok=True)
         
         if browser_name in ("edge", "chrome"):
@@ -2377,7 +2979,7 @@ class CommandCenter(QWidget):
     def _launch_explorer_fixed(self, label: str, path: str, args, quad: str):
         """Launch Explorer with placement."""
         try:
-            explorer_path = os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "explorer.exe")
+            explorer_path = _EXPLORER_PATH
             
             if args:
                 # Use provided args as-is (they should already include /n, /e,)
@@ -2388,101 +2990,82 @@ class CommandCenter(QWidget):
                 # Default: This PC
                 full_args = [explorer_path, "/n,", "/e,", "::{20D04FE0-3AEA-1069-A2D8-08002B30309D}"]
             
-            before = get_explorer_windows()
+            before = set(get_explorer_windows())
             subprocess.Popen(full_args)
             self._log(f"Explorer launched: {' '.join(full_args)}")
             
-            def poll_explorer(attempt=0):
-                attempt += 1
-                current = get_explorer_windows()
-                new_hwnds = [h for h in current if h not in before]
-                if new_hwnds:
-                    target = max(new_hwnds, key=get_window_area)
-                    x, y, w, h = get_quadrant_for_config(quad, self.cfg)
-                    ok = move_window(target, x, y, w, h)
-                    if ok:
-                        self._log(f"Explorer placed: {label} → {quad} (hwnd={target})")
-                        
-                        # Update last active window for hotkey system
-                        self._update_last_active_window(target, None)
-                        
-                    else:
-                        self._log(f"Explorer placement failed for {target}")
-                    return
-                if attempt < 20:
-                    QTimer.singleShot(500, lambda: poll_explorer(attempt))
+            def place_explorer(target):
+                x, y, w, h = self._quadrant(quad)
+                self._queue_move(target, x, y, w, h, functools.partial(explorer_placed, target, x, y, w, h))
+            
+            def explorer_placed(target, x, y, w, h, ok):
+                if ok:
+                    self._log(f"Explorer placed: {label} → {quad} (hwnd={target})")
+                    
+                    # Update last active window for hotkey system
+                    self._update_last_active_window(target, None)
+                    
+                    # Nachkorrektur nur, wenn Explorer sein Fenster selbst noch verschiebt
+                    self._hold_placement(target, functools.partial(move_window_unchecked, target, x, y, w, h, restore=False))
                 else:
-                    self._log(f"Explorer timeout for {label}")
+                    self._log(f"Explorer placement failed for {target}")
+            
+            # Neue Fenster kommen meist aus dem bestehenden explorer.exe (Popen-PID endet sofort),
+            # daher kein PID-Filter: Show-Hook + geteilter Snapshot statt eigenem EnumWindows
+            def new_explorer_windows():
+                return [h for h in self._find_windows(class_names=_EXPLORER_CLASSES, image_names=_EXPLORER_IMAGES)
+                        if h not in before]
             
-            QTimer.singleShot(300, poll_explorer)
+            # Gleiches Budget wie vorher (300 ms + 20 × 500 ms), gescannt wird nur bei neuen Fenstern
+            self._hook_for_window(
+                new_explorer_windows, place_explorer,
+                functools.partial(self._log, f"Explorer timeout for {label}"),
+                timeout_ms=10300, first_delay_ms=300, poll_ms=500)
             
         except Exception as e:
             self._log(f"Explorer launch failed: {e}")
 
-    # Drag handling
+    # Drag handling: Verschieben übernimmt der Window-Manager (keine Python-Events pro Mausbewegung)
     def mousePressEvent(self, e):
         if e.button() == Qt.LeftButton:
-            if getattr(e, "position", None):
-                y = e.position().y()
-                pos_to_point = e.globalPosition().toPoint()
-            else:
-                y = e.pos().y()
-                pos_to_point = e.globalPos()
-            if y <= 40 or self.header.underMouse():
-                self._dragging = True
-                self._drag_off = pos_to_point - self.frameGeometry().topLeft()
-                e.accept()
+            if _event_y(e) <= 40 or self.header.underMouse():
+                wh = self.windowHandle()
+                if wh is not None and wh.startSystemMove():
+                    e.accept()
+                    return
         super().mousePressEvent(e)
 
-    def mouseMoveEvent(self, e):
-        if self._dragging and (e.buttons() & Qt.LeftButton):
-            if getattr(e, "globalPosition", None):
-                pt = e.globalPosition().toPoint() - self._drag_off
-            else:
-                pt = e.globalPos() - self._drag_off
-            x, y, w, h = clamp_rect_to_primary(pt.x(), pt.y(), self.width(), self.height())
-            self.setGeometry(x, y, w, h)
-            e.accept()
-        super().mouseMoveEvent(e)
-
-    def mouseReleaseEvent(self, e):
-        self._dragging = False
-        super().mouseReleaseEvent(e)
-
     def resizeEvent(self, e):
         """Handle window resize to dynamically adjust button grid."""
         super().resizeEvent(e)
-        # Rebuild buttons with new column count after a short delay
-        # to avoid rebuilding too frequently during resize
-        if hasattr(self, '_resize_timer'):
-            self._resize_timer.stop()
-        self._resize_timer = QTimer(self)  # type: ignore
-        self._resize_timer.timeout.connect(self._rebuild_buttons_on_resize)
-        self._resize_timer.setSingleShot(True)
-        self._resize_timer.start(300)  # 300ms delay
+        self._btn_cols = self._compute_btn_cols()
+        # Coalesce the resize burst; the rebuild itself only runs when the column count changed
+        self._resize_timer.start()
 
     def _rebuild_buttons_on_resize(self):
         """Rebuild buttons after window resize."""
+        if self._btn_cols == self._built_cols:
+            return
         if hasattr(self, 'splitter') and self.splitter.count() > 0:
             self._build_buttons()
 
     # Baseline
     def _start_baseline(self):
-        ps = which("pwsh.exe","powershell.exe") or r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe"
+        ps = _ps_exe()
         script = self.cfg.BASELINE_PATH  # Wurde bereits von apply_json_overrides aufgelöst
         args = list(self.cfg.BASELINE_ARGS)
 
         env = os.environ.copy()
         env["COCKPIT_NONINTERACTIVE"] = "1"
 
+        # Information-Stream sichtbar (Write-Information), Warning/Verbose/Debug/Information
+        # auf stdout; Fehler bleiben auf stderr und werden als [ERR] markiert.
+        # Argumente als PowerShell-Literale statt shlex-Quoting
         ps_cmd = [
             ps, "-NoLogo","-NoProfile","-ExecutionPolicy","Bypass","-NonInteractive",
             "-WindowStyle", "Hidden", "-Command",
-            "[Console]::OutputEncoding=[Text.UTF8Encoding]::new(); "
-            "$OutputEncoding=[Text.UTF8Encoding]::new(); "
-            "$env:COCKPIT_NONINTERACTIVE='1'; "
             "$InformationPreference='Continue'; "
-            f"& '{script}' " + " ".join(map(shlex.quote, args)) + " *>&1"
+            f"& {_ps_literal(script)} " + " ".join(map(_ps_literal, args)) + " 3>&1 4>&1 5>&1 6>&1"
         ]
 
         try:
@@ -2500,76 +3083,96 @@ class CommandCenter(QWidget):
             return
 
         self._log("[Baseline] started")
-        self._q_out, self._q_err = Queue(), Queue()
-
-        def _reader(stream, q):
-            for raw in iter(stream.readline, b""):
-                try:
-                    q.put(raw.decode("utf-8", errors="ignore"))
-                except Exception:
-                    pass
+        p, bus = self._baseline_p, self._baseline_bus
+
+        def _reader(stream, is_err):
+            # read1 liefert alles, was die Pipe gerade hat: ein Signal pro Chunk statt pro Zeile
+            tail = b""
+            for chunk in iter(lambda: stream.read1(65536), b""):
+                parts = (tail + chunk).split(b"\n")
+                tail = parts.pop()
+                if parts:
+                    try:
+                        bus.lines.emit([ln.decode(_OEM_ENCODING, errors="ignore") for ln in parts], is_err)
+                    except Exception:
+                        pass
+            if tail:
+                bus.lines.emit([tail.decode(_OEM_ENCODING, errors="ignore")], is_err)
             try: stream.close()
             except Exception: pass
 
-        threading.Thread(target=_reader, args=(self._baseline_p.stdout, self._q_out), daemon=True).start()
-        threading.Thread(target=_reader, args=(self._baseline_p.stderr, self._q_err), daemon=True).start()
-
-        self._baseline_timer = QTimer(self)
-        self._baseline_timer.timeout.connect(self._baseline_pump)
-        self._baseline_timer.start(120)
+        def _read_all():
+            # stdout hier, stderr daneben; Exit erst melden, wenn beide Pipes leer sind
+            t_err = threading.Thread(target=_reader, args=(p.stderr, True), daemon=True)
+            t_err.start()
+            _reader(p.stdout, False)
+            t_err.join()
+            bus.finished.emit(p.wait())
+
+        threading.Thread(target=_read_all, daemon=True).start()
+
+    def _on_baseline_lines(self, lines: List[str], is_err: bool):
+        # Landen gemeinsam im Konsolen-Puffer → ein Edit-Block beim nächsten Flush
+        if is_err:
+            for line in lines:
+                self._append_line(f"[Baseline][ERR] {line.rstrip()}", "#ff6b6b")
+        else:
+            for line in lines:
+                self._append_line(f"[Baseline] {line.rstrip()}", self._stylize(line))
 
-    def _baseline_pump(self):
-        try:
-            while True:
-                line = self._q_out.get_nowait()
-                self._append_html(self._stylize(f"[Baseline] {line.rstrip()}"))
-        except Empty:
-            pass
-        try:
-            while True:
-                line = self._q_err.get_nowait()
-                self._append_html(self._fmt_line(f"[Baseline][ERR] {line.rstrip()}", "#ff6b6b"))
-        except Empty:
-            pass
-        if self._baseline_p and (self._baseline_p.poll() is not None):
-            code = self._baseline_p.returncode
-            self._append_html(self._fmt_line(f"[Baseline] finished (ExitCode={code})", "#9fa7ad"))
-            if self._baseline_timer: self._baseline_timer.stop()
-            self._baseline_p = None
+    def _on_baseline_finished(self, code: int):
+        self._append_line(f"[Baseline] finished (ExitCode={code})", "#9fa7ad")
+        self._baseline_p = None
 
     # Console helpers
-    def _append_html(self, html_line: str):
-        self.console.moveCursor(QTextCursor.End)
-        self.console.insertHtml(html_line)
-        self.console.insertHtml("<br/>")
-        self.console.moveCursor(QTextCursor.End)
-
-    def _fmt_line(self, text:str, col:str="#bfe0bf", emoji:str=""):
-        esc = html.escape(text)
-        prefix = f"<span style='color:{col}'>{emoji}</span> " if emoji else ""
-        return f"<span style='font-family:Consolas; color:{col}'>{prefix}{esc}</span>"
+    CONSOLE_FLUSH_MS = 50
+
+    def _append_line(self, text: str, col: str = "#bfe0bf"):
+        self._console_pending.append((text, col))
+        if not self._console_flush_pending:
+            self._console_flush_pending = True
+            QTimer.singleShot(self.CONSOLE_FLUSH_MS, self._flush_console)
+
+    def _flush_console(self):
+        # Plain text + gecachtes Zeichenformat direkt ins Dokument: kein HTML-Parser, ein Edit-Block pro Burst
+        self._console_flush_pending = False
+        if not self._console_pending:
+            return
+        fmts = self._console_formats
+        cur = QTextCursor(self.console.document())
+        cur.movePosition(QTextCursor.End)
+        cur.beginEditBlock()
+        for text, col in self._console_pending:
+            fmt = fmts.get(col)
+            if fmt is None:
+                fmt = fmts[col] = QTextCharFormat()
+                fmt.setForeground(QColor(col))
+            cur.insertText(text + "\n", fmt)
+        cur.endEditBlock()
+        self._console_pending.clear()
+        sb = self.console.verticalScrollBar()
+        sb.setValue(sb.maximum())
 
     def _stylize(self, raw:str) -> str:
-        low = raw.lower()
-        if any(k in low for k in ("error","err","fail","failed")):
-            return self._fmt_line(raw, "#ff6b6b")
-        if any(k in low for k in ("warn","warning")):
-            return self._fmt_line(raw, "#ffd166")
-        if any(k in low for k in ("success","ok","passed","done")):
-            return self._fmt_line(raw, "#06d6a0")
-        return self._fmt_line(raw, "#bfe0bf")
+        """Farbe für eine Baseline-Zeile anhand von Schlüsselwörtern (err > warn > ok)."""
+        best = None
+        for m in _STYLE_RE.finditer(raw):
+            g = m.lastgroup
+            if g == "err":
+                return _STYLE_COLOR["err"]
+            if best is None or g == "warn":
+                best = g
+        return _STYLE_COLOR.get(best, "#bfe0bf")
 
     def _build_log(self):
         self.console=QTextEdit()
         self.console.setReadOnly(True)
+        # Nur-Lese-Log: kein Undo-Stack, Dokumentgröße gedeckelt → Einfügen bleibt konstant teuer
+        self.console.setUndoRedoEnabled(False)
+        self.console.document().setMaximumBlockCount(max(0, self.cfg.CONSOLE_MAX_LINES))
         self._apply_console_style(self.console)
         self.splitter.addWidget(self.console)
         self.splitter.setStretchFactor(0,1); self.splitter.setStretchFactor(1,2)
-        
-        # Force style refresh for console
-        self.console.style().unpolish(self.console)
-        self.console.style().polish(self.console)
-        self.console.update()
 
     def _rebuild_menu_combo(self):
         names = list(self.state.menus.keys())
@@ -2583,6 +3186,63 @@ class CommandCenter(QWidget):
         self.menu_combo.setCurrentIndex(idx)
         self.menu_combo.blockSignals(False)
 
+    def _init_config_watch(self):
+        """Watch the config file so edits swap in freshly built menus."""
+        self._cfg_watcher = QFileSystemWatcher(self)
+        self._cfg_reload_timer = QTimer(self)
+        self._cfg_reload_timer.setSingleShot(True)
+        self._cfg_reload_timer.setInterval(250)  # Editoren schreiben oft mehrfach
+        self._cfg_reload_timer.timeout.connect(self._reload_menus)
+        path = self.state.config_path
+        if path:
+            self._cfg_watcher.addPath(path)
+            self._cfg_watcher.fileChanged.connect(lambda _p: self._cfg_reload_timer.start())
+
+    def _reload_menus(self):
+        path = self.state.config_path
+        # Atomares Speichern ersetzt die Datei → Pfad neu registrieren
+        if path not in self._cfg_watcher.files() and os.path.isfile(path):
+            self._cfg_watcher.addPath(path)
+        try:
+            cfg = load_config(path, Config())
+            _expand_env_cached.cache_clear()
+            _resolve_cached.cache_clear()
+            _resolve_in_dirs.cache_clear()
+            _resolve_script.cache_clear()
+            _resolve_browser.cache_clear()
+            menus = load_menus(path, cfg)
+        except Exception as e:
+            self._log(f"CONFIG: Reload failed: {e}", "WARNING")
+            return
+        cfg_changed = cfg != self.cfg
+        if cfg_changed:
+            self._apply_config(cfg)
+        if not menus or (menus is self.state.menus and not cfg_changed):
+            return
+        self.state.menus = menus
+        if self.state.menu_name not in menus:
+            self.state.menu_name = next(iter(menus))
+            self.header.setText(f"Support Cockpit — {self.state.menu_name}")
+            self.setWindowTitle(f"Support Cockpit — {self.state.menu_name}")
+        self._rebuild_menu_combo()
+        self._build_buttons()
+        self._log("CONFIG: Config and menus reloaded" if cfg_changed else "CONFIG: Menus reloaded")
+
+    def _apply_config(self, cfg: Config):
+        """Swap in a reloaded config and rebuild the state derived from it.
+
+        Log directories are not re-read; the running Logger keeps its files.
+        """
+        self.state.cfg = self.cfg = cfg
+        self._console_level = LogLevel.from_string(cfg.CONSOLE_LOG_LEVEL)
+        self._start_quadrant = cfg.GUI_START_QUADRANT
+        self._rr_order = tuple(cfg.RR_ORDER)
+        self._edge_margin_ratio = float(cfg.EDGE_MARGIN_RATIO)
+        self.console.document().setMaximumBlockCount(max(0, cfg.CONSOLE_MAX_LINES))
+        # Quadranten hängen an FILL_RATIO/EDGE_MARGIN: wie nach einem Screen-Wechsel neu berechnen
+        self._invalidate_screen_cache()
+        self._btn_cols = self._compute_btn_cols()
+
     def _switch_menu(self, name: str):
         if not name or name not in self.state.menus:
             return
@@ -2595,31 +3255,31 @@ class CommandCenter(QWidget):
         self._log(f"MENU: Switched to '{name}'")
 
     def place_command_center(self):
-        r=primary_rect_logical()
+        r=self._get_screen_metrics()[0]
         w=min(640,max(440,int(r.width()*0.33))); h=min(520,max(380,int(r.height()*0.45)))
         m=max(24,int(0.02*r.width())); x=r.right()-w-m; y=r.top()+m
         x,y,w,h = clamp_rect_to_primary(x,y,w,h)
         self.setGeometry(x,y,w,h); self.showNormal(); self.raise_(); self.activateWindow()
+        # Fenster wechselt den Monitor → Metriken neu lesen (Handle existiert erst nach show)
+        wh = self.windowHandle()
+        if wh is not None and not self._screen_hooked:
+            wh.screenChanged.connect(self._invalidate_screen_cache)
+            self._screen_hooked = True
         QTimer.singleShot(150, lambda:(self.raise_(), self.activateWindow()))
-        self._append_html(self._fmt_line(f"Cockpit @ {w}x{h} ({x},{y})", "#9fa7ad"))
+        self._append_line(f"Cockpit @ {w}x{h} ({x},{y})", "#9fa7ad")
 
     def _log(self, s: str, level: str = "INFO", **ev):
         # Always write to file (unchanged logging behavior)
         self.state.logger.text(s)
         
-        # Check if we should show this in console based on log level
-        console_level = LogLevel.from_string(getattr(self.cfg, "CONSOLE_LOG_LEVEL", "INFO"))
-        msg_level = LogLevel.from_string(level)
-        
-        if msg_level >= console_level:
-            line = f"[{_ts()}] {s}"
-            color = {
-                "DEBUG": "#6c757d",    # Gray
-                "INFO": "#bfe0bf",     # Green (original)
-                "WARNING": "#ffc107",  # Yellow
-                "ERROR": "#dc3545"     # Red
-            }.get(level.upper(), "#bfe0bf")
-            self._append_html(self._fmt_line(line, color))
+        # Unterhalb des Konsolen-Levels: kein Formatieren, kein Widget-Update
+        num = _LEVEL_NUM.get(level)
+        if num is None:  # nur für klein geschriebene Levels
+            level = level.upper()
+            num = _LEVEL_NUM.get(level, LogLevel.INFO)
+        if num < self._console_level:
+            return
+        self._append_line("[" + _ts() + "] " + s, _LEVEL_COLOR.get(level, "#bfe0bf"))
 
 def _fatal(msg: str):
     try:
@@ -2631,6 +3291,7 @@ def _fatal(msg: str):
     sys.exit(2)
 
 def main():
+    _bind_window_utils()
     enable_dpi_awareness()
     base_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
     cfg_path = _discover_config_path(sys.argv[1:], base_dir)
@@ -2638,20 +3299,22 @@ def main():
         _fatal("No configuration found.")
 
     try:
-        j=_load_json(cfg_path)
+        cfg = load_config(cfg_path, Config())
+        menus = load_menus(cfg_path, cfg)
     except Exception as e:
         _fatal(f"Configuration could not be read:\n{e}")
 
-    cfg = apply_json_overrides(Config(), j)
-    menus = extract_menus(j, cfg)
     if not menus:
         _fatal("Configuration contains no TOOLS.")
 
     start_menu = cfg.DEFAULT_CLUSTER if (cfg.DEFAULT_CLUSTER and cfg.DEFAULT_CLUSTER in menus) else list(menus.keys())[0]
     app=QApplication(sys.argv)
-    state=AppState(cfg, menus, start_menu)
+    app.setStyleSheet(NeonButton.app_style())
+    state=AppState(cfg, menus, start_menu, cfg_path)
     cc=CommandCenter(state); cc.show()
-    sys.exit(app.exec())
+    rc = app.exec()
+    state.logger.close()
+    sys.exit(rc)
 
 if __name__=="__main__":
     main()
\ No newline at end of file
@@ -2,11 +2,13 @@
 # Pure Win32 window utilities - no Qt dependencies, no state dependencies
 
 import ctypes
+import functools
 import os
+import re
+import threading
+from collections import OrderedDict
 from ctypes import wintypes
-from typing import Tuple, List
-import win32gui
-import win32process
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 import win32api
 
 # ---------- Constants ----------
@@ -35,16 +37,94 @@ def enable_dpi_awareness():
         pass
 
 # ---------- Monitor / Geometry ----------
+class PrimaryMonitor(NamedTuple):
+    """Primary monitor workarea in physical pixels plus its effective DPI."""
+    left: int
+    top: int
+    right: int
+    bottom: int
+    dpi_x: int
+    dpi_y: int
+
+MDT_EFFECTIVE_DPI = 0
+try:
+    # shcore (Windows 8.1+): per-monitor DPI; older systems report 96
+    _GetDpiForMonitor = ctypes.WinDLL("shcore").GetDpiForMonitor
+    _GetDpiForMonitor.argtypes = [wintypes.HMONITOR, ctypes.c_int, ctypes.POINTER(wintypes.UINT), ctypes.POINTER(wintypes.UINT)]
+    _GetDpiForMonitor.restype = ctypes.c_long
+except (OSError, AttributeError):
+    _GetDpiForMonitor = None
+
+# Primary workarea + DPI, queried once; refresh_monitors() drops both after a display/workarea change
+_MONITOR_CACHE: Optional[PrimaryMonitor] = None
+_WORKAREA_CACHE: Optional[Tuple[int, int, int, int]] = None
+
+def refresh_monitors() -> None:
+    """Invalidate the cached primary workarea and DPI (call on display or workarea changes)."""
+    global _MONITOR_CACHE, _WORKAREA_CACHE
+    _MONITOR_CACHE = _WORKAREA_CACHE = None
+
+def _monitor_dpi(hmon) -> Tuple[int, int]:
+    if _GetDpiForMonitor is not None:
+        dx, dy = wintypes.UINT(), wintypes.UINT()
+        if _GetDpiForMonitor(int(hmon), MDT_EFFECTIVE_DPI, ctypes.byref(dx), ctypes.byref(dy)) == 0:
+            return dx.value, dy.value
+    return 96, 96
+
+def primary_monitor_info() -> PrimaryMonitor:
+    """Primary workarea (L, T, R, B) and effective DPI in one cached record; cached until refresh_monitors()."""
+    global _MONITOR_CACHE, _WORKAREA_CACHE
+    if _MONITOR_CACHE is not None:
+        return _MONITOR_CACHE
+    try:
+        for hmon, hdc, r in win32api.EnumDisplayMonitors():
+            inf = win32api.GetMonitorInfo(hmon)
+            if inf.get('Flags', 0) == MONITORINFOF_PRIMARY:
+                L, T, R, B = inf['Work']
+                _MONITOR_CACHE = PrimaryMonitor(L, T, R, B, *_monitor_dpi(hmon))
+                _WORKAREA_CACHE = (L, T, R, B)
+                return _MONITOR_CACHE
+    except Exception:
+        pass
+    # Fallback to 1920x1080 @ 96 DPI (not cached, retried on the next call)
+    return PrimaryMonitor(0, 0, 1920, 1080, 96, 96)
+
 def primary_workarea_physical() -> Tuple[int, int, int, int]:
-    """Get primary monitor workarea in physical pixels (L, T, R, B)."""
-    mons = win32api.EnumDisplayMonitors()
-    for hmon, hdc, r in mons:
-        inf = win32api.GetMonitorInfo(hmon)
-        if inf.get('Flags', 0) == MONITORINFOF_PRIMARY:
-            L, T, R, B = inf['Work']
-            return L, T, R, B
-    # Fallback to 1920x1080
-    return 0, 0, 1920, 1080
+    """Get primary monitor workarea in physical pixels (L, T, R, B); cached until refresh_monitors()."""
+    if _WORKAREA_CACHE is not None:
+        return _WORKAREA_CACHE
+    return tuple(primary_monitor_info()[:4])
+
+# Quadrant -> (column, row) in halves of the workarea; anything else is FULL
+_QUADRANT_CELLS = {"TL": (0, 0), "TR": (1, 0), "BL": (0, 1), "BR": (1, 1)}
+
+@functools.lru_cache(maxsize=64)
+def _quadrant_fn(quad: str, fill_ratio: float, edge_margin_ratio: float) -> Callable[[Tuple[int, int, int, int]], Tuple[int, int, int, int]]:
+    """Specialize the quadrant math for fixed (quad, fill_ratio, edge_margin_ratio); applied to a workarea (L, T, R, B)."""
+    cell = _QUADRANT_CELLS.get(quad)
+    
+    if cell is None:
+        def quadrant(area):
+            L, T, R, B = area
+            outer = max(8, int(edge_margin_ratio * min(R - L, B - T)))
+            L += outer
+            T += outer
+            w, h = R - outer - L, B - outer - T
+            tw, th = int(w * fill_ratio), int(h * fill_ratio)
+            return L + ((w - tw) >> 1), T + ((h - th) >> 1), tw, th
+        return quadrant
+    
+    col, row = cell
+    
+    def quadrant(area):
+        L, T, R, B = area
+        outer = max(8, int(edge_margin_ratio * min(R - L, B - T)))
+        L += outer
+        T += outer
+        w, h = (R - outer - L) >> 1, (B - outer - T) >> 1
+        tw, th = int(w * fill_ratio), int(h * fill_ratio)
+        return L + col * w + ((w - tw) >> 1), T + row * h + ((h - th) >> 1), tw, th
+    return quadrant
 
 def get_quadrant_physical(quad: str, fill_ratio: float = 0.995, edge_margin_ratio: float = 0.01) -> Tuple[int, int, int, int]:
     """
@@ -58,41 +138,12 @@ def get_quadrant_physical(quad: str, fill_ratio: float = 0.995, edge_margin_rati
     Returns:
         Tuple of (x, y, width, height) in pixels
     """
-    L, T, R, B = primary_workarea_physical()
-    W, H = R - L, B - T
-    
-    # Apply edge margin
-    outer = max(8, int(edge_margin_ratio * min(W, H)))
-    L += outer
-    T += outer
-    R -= outer
-    B -= outer
-    W, H = R - L, B - T
-    
-    # Calculate quadrant
-    half_w, half_h = W // 2, H // 2
-    
-    quadrant_map = {
-        "TL": (L, T, half_w, half_h),
-        "TR": (L + half_w, T, half_w, half_h),
-        "BL": (L, T + half_h, half_w, half_h),
-        "BR": (L + half_w, T + half_h, half_w, half_h),
-        "FULL": (L, T, W, H)
-    }
-    
-    x, y, w, h = quadrant_map.get(quad, quadrant_map["FULL"])
-    
-    # Apply fill ratio
-    target_w = int(w * fill_ratio)
-    target_h = int(h * fill_ratio)
-    x += (w - target_w) // 2
-    y += (h - target_h) // 2
-    
-    return x, y, target_w, target_h
+    area = primary_workarea_physical()
+    # Clamped here against the same workarea, so callers can move with move_window_unchecked()
+    return _clamp_rect(area, *_quadrant_fn(quad, fill_ratio, edge_margin_ratio)(area))
 
-def clamp_rect_to_primary(x: int, y: int, w: int, h: int) -> Tuple[int, int, int, int]:
-    """Clamp rectangle to primary monitor workarea."""
-    L, T, R, B = primary_workarea_physical()
+def _clamp_rect(area: Tuple[int, int, int, int], x: int, y: int, w: int, h: int) -> Tuple[int, int, int, int]:
+    L, T, R, B = area
     
     if x < L:
         x = L
@@ -105,38 +156,147 @@ def clamp_rect_to_primary(x: int, y: int, w: int, h: int) -> Tuple[int, int, int
         
     return x, y, w, h
 
+def clamp_rect_to_primary(x: int, y: int, w: int, h: int) -> Tuple[int, int, int, int]:
+    """Clamp rectangle to primary monitor workarea."""
+    return _clamp_rect(primary_workarea_physical(), x, y, w, h)
+
 # ---------- Process Info ----------
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+_ProcessIdToSessionId = _kernel32.ProcessIdToSessionId
+_ProcessIdToSessionId.argtypes = [wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)]
+_ProcessIdToSessionId.restype = wintypes.BOOL
+
 def _get_process_session_id(pid: int) -> int:
     """Get the session ID for a process (important for RDSH scenarios)."""
+    sid = wintypes.DWORD(0)
+    if _ProcessIdToSessionId(int(pid), ctypes.byref(sid)):
+        return sid.value
+    # Fallback: return current session if we can't determine
+    if _ProcessIdToSessionId(os.getpid(), ctypes.byref(sid)):
+        return sid.value
+    return 0
+
+_OpenProcess = _kernel32.OpenProcess
+_OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+_OpenProcess.restype = wintypes.HANDLE
+_QueryFullProcessImageNameW = _kernel32.QueryFullProcessImageNameW
+_QueryFullProcessImageNameW.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD)]
+_QueryFullProcessImageNameW.restype = wintypes.BOOL
+_CloseHandle = _kernel32.CloseHandle
+_CloseHandle.argtypes = [wintypes.HANDLE]
+_CloseHandle.restype = wintypes.BOOL
+_ERROR_INSUFFICIENT_BUFFER = 122
+_IMAGE_PATH_MAX = 32768
+
+# Path buffer per thread (lookups also run in worker threads): MAX_PATH first, grown and kept on demand
+_image_buf = threading.local()
+
+# One RECT per thread for single-window rect probes (no Structure allocation per call)
+_rect_tls = threading.local()
+
+def _rect() -> wintypes.RECT:
+    r = getattr(_rect_tls, "rect", None)
+    if r is None:
+        r = _rect_tls.rect = wintypes.RECT()
+    return r
+
+@functools.lru_cache(maxsize=512)
+def _query_image_name(pid: int) -> str:
+    # Raises on failure: lru_cache keeps only successful lookups, a process that is
+    # still starting (or access denied) is retried on the next call
+    h = _OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not h:
+        raise OSError(ctypes.get_last_error(), "OpenProcess failed")
     try:
-        import win32ts
-        return win32ts.ProcessIdToSessionId(pid)
+        buf = getattr(_image_buf, "buf", None)
+        if buf is None:
+            buf = _image_buf.buf = ctypes.create_unicode_buffer(260)
+        while True:
+            size = wintypes.DWORD(len(buf))
+            if _QueryFullProcessImageNameW(h, 0, buf, ctypes.byref(size)):
+                return os.path.basename(buf.value).lower()
+            err = ctypes.get_last_error()
+            if err != _ERROR_INSUFFICIENT_BUFFER or len(buf) >= _IMAGE_PATH_MAX:
+                raise OSError(err, "QueryFullProcessImageNameW failed")
+            buf = _image_buf.buf = ctypes.create_unicode_buffer(min(len(buf) * 2, _IMAGE_PATH_MAX))
+    finally:
+        _CloseHandle(h)
+
+class _UNICODE_STRING(ctypes.Structure):
+    _fields_ = [("Length", wintypes.USHORT), ("MaximumLength", wintypes.USHORT), ("Buffer", ctypes.c_void_p)]
+
+class _SYSTEM_PROCESS_INFORMATION(ctypes.Structure):
+    # Leading part of the documented layout; ctypes aligns like MSVC on x86 and x64
+    _fields_ = [
+        ("NextEntryOffset", wintypes.ULONG), ("NumberOfThreads", wintypes.ULONG),
+        ("WorkingSetPrivateSize", ctypes.c_longlong), ("HardFaultCount", wintypes.ULONG),
+        ("NumberOfThreadsHighWatermark", wintypes.ULONG), ("CycleTime", ctypes.c_ulonglong),
+        ("CreateTime", ctypes.c_longlong), ("UserTime", ctypes.c_longlong), ("KernelTime", ctypes.c_longlong),
+        ("ImageName", _UNICODE_STRING), ("BasePriority", ctypes.c_long), ("UniqueProcessId", ctypes.c_void_p),
+        ("InheritedFromUniqueProcessId", ctypes.c_void_p), ("HandleCount", wintypes.ULONG),
+        ("SessionId", wintypes.ULONG),
+    ]
+
+_SYSTEM_PROCESS_INFORMATION_CLASS = 5
+_STATUS_INFO_LENGTH_MISMATCH = 0xC0000004
+try:
+    _NtQuerySystemInformation = ctypes.WinDLL("ntdll").NtQuerySystemInformation
+    _NtQuerySystemInformation.argtypes = [ctypes.c_ulong, ctypes.c_void_p, wintypes.ULONG, ctypes.POINTER(wintypes.ULONG)]
+    _NtQuerySystemInformation.restype = ctypes.c_long
+except (OSError, AttributeError):
+    _NtQuerySystemInformation = None
+_process_snapshot_size = 1 << 18  # grows to the largest size seen
+
+def _snapshot_processes() -> Dict[int, Tuple[str, int]]:
+    """PID -> (lower-case image name, session ID) for all processes from one NtQuerySystemInformation call.
+
+    Returns an empty dict if the call is unavailable or fails; callers fall back to
+    get_image_name_basename() / _get_process_session_id() per PID.
+    """
+    global _process_snapshot_size
+    if _NtQuerySystemInformation is None:
+        return {}
+    try:
+        size = _process_snapshot_size
+        needed = wintypes.ULONG(0)
+        for _ in range(8):
+            buf = ctypes.create_string_buffer(size)
+            status = _NtQuerySystemInformation(_SYSTEM_PROCESS_INFORMATION_CLASS, buf, size, ctypes.byref(needed))
+            if (status & 0xFFFFFFFF) != _STATUS_INFO_LENGTH_MISMATCH:
+                break
+            # Process list can grow between calls: add headroom
+            size = max(size * 2, needed.value + (1 << 16))
+        else:
+            return {}
+        if status < 0:
+            return {}
+        _process_snapshot_size = size
+        
+        procs: Dict[int, Tuple[str, int]] = {}
+        base = ctypes.addressof(buf)
+        offset = 0
+        while True:
+            entry = _SYSTEM_PROCESS_INFORMATION.from_address(base + offset)
+            image = entry.ImageName
+            name = ctypes.wstring_at(image.Buffer, image.Length // 2).lower() if image.Buffer and image.Length else ""
+            procs[int(entry.UniqueProcessId or 0)] = (name, entry.SessionId)
+            if not entry.NextEntryOffset:
+                break
+            offset += entry.NextEntryOffset
+        return procs
     except Exception:
-        # Fallback: return current session if we can't determine
-        try:
-            return win32ts.WTSGetCurrentSessionId()
-        except Exception:
-            return 0
+        return {}
+
+def clear_process_caches() -> None:
+    """Forget memoized PID -> image names (PIDs get reused; call periodically)."""
+    _query_image_name.cache_clear()
 
 def get_image_name_basename(pid: int) -> str:
-    """Get the executable name for a process ID."""
+    """Get the executable name for a process ID (memoized per PID until clear_process_caches())."""
     try:
-        kernel32 = ctypes.windll.kernel32
-        h = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
-        if not h:
-            return ""
-        
-        buf = ctypes.create_unicode_buffer(32768)
-        size = wintypes.DWORD(len(buf))
-        
-        if kernel32.QueryFullProcessImageNameW(h, 0, buf, ctypes.byref(size)):
-            kernel32.CloseHandle(h)
-            return os.path.basename(buf.value).lower()
-        
-        kernel32.CloseHandle(h)
+        return _query_image_name(int(pid))
     except Exception:
-        pass
-    return ""
+        return ""
 
 # ---------- Window Movement (UAC-aware) ----------
 _user32 = ctypes.WinDLL("user32", use_last_error=True)
@@ -145,9 +305,58 @@ _SetWindowPos.argtypes = [wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_i
 _SetWindowPos.restype = wintypes.BOOL
 _HWND_TOP = wintypes.HWND(0)
 _SWP_FLAGS = 0x0004 | 0x0040  # NOZORDER | SHOWWINDOW
+_BeginDeferWindowPos = _user32.BeginDeferWindowPos
+_BeginDeferWindowPos.argtypes = [ctypes.c_int]
+_BeginDeferWindowPos.restype = wintypes.HANDLE
+_DeferWindowPos = _user32.DeferWindowPos
+_DeferWindowPos.argtypes = [wintypes.HANDLE, wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_uint]
+_DeferWindowPos.restype = wintypes.HANDLE
+_EndDeferWindowPos = _user32.EndDeferWindowPos
+_EndDeferWindowPos.argtypes = [wintypes.HANDLE]
+_EndDeferWindowPos.restype = wintypes.BOOL
+_IsIconic = _user32.IsIconic
+_IsIconic.argtypes = [wintypes.HWND]
+_IsIconic.restype = wintypes.BOOL
+_ShowWindow = _user32.ShowWindow
+_ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+_ShowWindow.restype = wintypes.BOOL
+_SW_RESTORE = 9
+
+def _restore_if_minimized(hwnd: int) -> None:
+    # Minimized windows ignore SetWindowPos/DeferWindowPos geometry
+    if _IsIconic(hwnd):
+        _ShowWindow(hwnd, _SW_RESTORE)
+
+_IsWindow = _user32.IsWindow
+_IsWindow.argtypes = [wintypes.HWND]
+_IsWindow.restype = wintypes.BOOL
 
-# Track HWNDs that refused moves (likely elevated / UAC boundary)
-_UNMANAGEABLE_HWND = set()
+# Track HWNDs that refused moves (likely elevated / UAC boundary); bounded, oldest first
+_UNMANAGEABLE_HWND: "OrderedDict[int, None]" = OrderedDict()
+_UNMANAGEABLE_MAX = 256
+_UNMANAGEABLE_PURGE_EVERY = 32
+_unmanageable_inserts = 0
+
+def _mark_unmanageable(hwnd: int) -> None:
+    """Remember a window that refused a move; drops destroyed HWNDs and caps the size."""
+    global _unmanageable_inserts
+    _UNMANAGEABLE_HWND[hwnd] = None
+    _UNMANAGEABLE_HWND.move_to_end(hwnd)
+    _unmanageable_inserts += 1
+    if _unmanageable_inserts % _UNMANAGEABLE_PURGE_EVERY == 0:
+        # HWND values get reused after a window is destroyed: forget dead handles
+        for dead in [h for h in _UNMANAGEABLE_HWND if not _IsWindow(h)]:
+            del _UNMANAGEABLE_HWND[dead]
+    while len(_UNMANAGEABLE_HWND) > _UNMANAGEABLE_MAX:
+        _UNMANAGEABLE_HWND.popitem(last=False)
+
+def _already_at(hwnd: int, x: int, y: int, w: int, h: int) -> bool:
+    # Re-applied layouts often target the current rect: skip the no-op move and its
+    # WM_WINDOWPOSCHANGED/WM_SIZE/WM_MOVE + redraw
+    r = _rect()
+    if not _GetWindowRect(hwnd, ctypes.byref(r)):
+        return False
+    return r.left == x and r.top == y and r.right - r.left == w and r.bottom - r.top == h
 
 def safe_set_window_pos_hwnd(hwnd: int, x: int, y: int, w: int, h: int) -> bool:
     """
@@ -158,19 +367,22 @@ def safe_set_window_pos_hwnd(hwnd: int, x: int, y: int, w: int, h: int) -> bool:
     """
     if hwnd in _UNMANAGEABLE_HWND:
         return False
+    x, y, w, h = int(x), int(y), int(w), int(h)
+    if _already_at(hwnd, x, y, w, h) and _IsWindowVisible(hwnd):
+        return True
     
-    ok = _SetWindowPos(wintypes.HWND(hwnd), _HWND_TOP, int(x), int(y), int(w), int(h), _SWP_FLAGS)
+    ok = _SetWindowPos(wintypes.HWND(hwnd), _HWND_TOP, x, y, w, h, _SWP_FLAGS)
     if ok:
         return True
     
     err = ctypes.get_last_error()
     if err == 5:  # ERROR_ACCESS_DENIED
-        _UNMANAGEABLE_HWND.add(hwnd)
+        _mark_unmanageable(hwnd)
         return False
     
     return False
 
-def move_window(hwnd: int, x: int, y: int, w: int, h: int) -> bool:
+def move_window(hwnd: int, x: int, y: int, w: int, h: int, restore: bool = True) -> bool:
     """
     Move and resize a window to the specified coordinates.
     
@@ -178,16 +390,18 @@ def move_window(hwnd: int, x: int, y: int, w: int, h: int) -> bool:
         hwnd: Window handle
         x, y: Top-left position
         w, h: Width and height
+        restore: Restore a minimized window first; pass False for re-applies of a
+            placement just made (skips IsIconic and never un-minimizes the user's window)
     
     Returns:
         True if successful, False otherwise
     """
-    try:
-        # Restore if minimized
-        if win32gui.IsIconic(hwnd):
-            win32gui.ShowWindow(hwnd, 9)  # SW_RESTORE
-    except Exception:
-        pass
+    if restore:
+        try:
+            # Restore if minimized
+            _restore_if_minimized(hwnd)
+        except Exception:
+            pass
     
     # Clamp to screen bounds
     x, y, w, h = clamp_rect_to_primary(int(x), int(y), int(w), int(h))
@@ -195,12 +409,232 @@ def move_window(hwnd: int, x: int, y: int, w: int, h: int) -> bool:
     # Use UAC-aware positioning
     return safe_set_window_pos_hwnd(hwnd, x, y, w, h)
 
+def move_window_unchecked(hwnd: int, x: int, y: int, w: int, h: int, restore: bool = True) -> bool:
+    """
+    move_window() without the workarea clamp, for rects that are already inside it
+    (e.g. from get_quadrant_physical()).
+    """
+    if restore:
+        try:
+            _restore_if_minimized(hwnd)
+        except Exception:
+            pass
+    return safe_set_window_pos_hwnd(hwnd, x, y, w, h)
+
+def move_windows(placements: Iterable[Tuple[int, int, int, int, int]], clamp: bool = True) -> Dict[int, bool]:
+    """
+    Move several windows in one DeferWindowPos transaction.
+    
+    Args:
+        placements: (hwnd, x, y, w, h) tuples
+        clamp: Clamp each rect to the workarea; False for rects that are already
+            inside it (e.g. from get_quadrant_physical())
+    
+    Returns:
+        hwnd -> success. If the batch cannot be committed (e.g. one window sits
+        behind a UAC boundary), every window falls back to a single move.
+    """
+    placements = list(placements)
+    result = {hwnd: False for hwnd, *_ in placements}
+    todo = []
+    for hwnd, x, y, w, h in placements:
+        if hwnd in _UNMANAGEABLE_HWND:
+            continue
+        try:
+            _restore_if_minimized(hwnd)
+        except Exception:
+            pass
+        rect = (int(x), int(y), int(w), int(h))
+        if clamp:
+            rect = clamp_rect_to_primary(*rect)
+        # Windows already in place need no DeferWindowPos entry
+        if _already_at(hwnd, *rect) and _IsWindowVisible(hwnd):
+            result[hwnd] = True
+            continue
+        todo.append((hwnd,) + rect)
+    if len(todo) == 1:
+        hwnd, x, y, w, h = todo[0]
+        result[hwnd] = safe_set_window_pos_hwnd(hwnd, x, y, w, h)
+        return result
+    
+    hdwp = _BeginDeferWindowPos(len(todo)) if todo else None
+    for hwnd, x, y, w, h in todo:
+        if not hdwp:
+            break
+        # On failure DeferWindowPos frees the structure itself and returns NULL
+        hdwp = _DeferWindowPos(hdwp, wintypes.HWND(hwnd), _HWND_TOP, x, y, w, h, _SWP_FLAGS)
+    if hdwp and _EndDeferWindowPos(hdwp):
+        for hwnd, *_ in todo:
+            result[hwnd] = True
+        return result
+    
+    for hwnd, x, y, w, h in todo:
+        result[hwnd] = safe_set_window_pos_hwnd(hwnd, x, y, w, h)
+    return result
+
+# ---------- WinEvent Hooks ----------
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_SHOW = 0x8002
+EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+
+_WinEventProc = ctypes.WINFUNCTYPE(
+    None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+    wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+)
+_SetWinEventHook = _user32.SetWinEventHook
+_SetWinEventHook.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, _WinEventProc,
+                             wintypes.DWORD, wintypes.DWORD, wintypes.DWORD]
+_SetWinEventHook.restype = wintypes.HANDLE
+_UnhookWinEvent = _user32.UnhookWinEvent
+_UnhookWinEvent.argtypes = [wintypes.HANDLE]
+_UnhookWinEvent.restype = wintypes.BOOL
+
+# Hook handle -> ctypes callback (must stay referenced while the hook is active)
+_HOOK_PROCS = {}
+
+def set_win_event_hook(callback, event_min: int = EVENT_OBJECT_SHOW, event_max: int = None, pid: int = 0) -> int:
+    """
+    Register an out-of-context WinEvent hook for window-level events.
+    
+    Args:
+        callback: Called as callback(event, hwnd) for OBJID_WINDOW events only
+        event_min, event_max: Event range (event_max defaults to event_min)
+        pid: Only report events from this process (0 = all processes)
+    
+    Returns:
+        Hook handle, 0 on failure. The callback runs on the registering thread,
+        which must pump messages (the Qt GUI thread does).
+    """
+    def _proc(_hook, event, hwnd, id_object, id_child, _tid, _time):
+        if id_object != OBJID_WINDOW or id_child != CHILDID_SELF or not hwnd:
+            return
+        try:
+            callback(event, hwnd)
+        except Exception:
+            pass
+    
+    proc = _WinEventProc(_proc)
+    hook = _SetWinEventHook(event_min, event_max or event_min, None, proc, int(pid or 0), 0,
+                            WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS)
+    if not hook:
+        return 0
+    _HOOK_PROCS[hook] = proc
+    return hook
+
+def unhook_win_event(hook: int) -> None:
+    """Remove a hook registered with set_win_event_hook (no-op for 0 / unknown handles)."""
+    if hook and _HOOK_PROCS.pop(hook, None) is not None:
+        _UnhookWinEvent(hook)
+
 # ---------- Window Enumeration ----------
+# Raw user32 entry points for the hot per-HWND queries: no pywin32 wrapper and no
+# result objects per call, strings land in per-search buffers
+_WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+_EnumWindows = _user32.EnumWindows
+_EnumWindows.argtypes = [_WNDENUMPROC, wintypes.LPARAM]
+_EnumWindows.restype = wintypes.BOOL
+_IsWindowVisible = _user32.IsWindowVisible
+_IsWindowVisible.argtypes = [wintypes.HWND]
+_IsWindowVisible.restype = wintypes.BOOL
+_GetWindowLongW = _user32.GetWindowLongW
+_GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+_GetWindowLongW.restype = ctypes.c_long
+_GetAncestor = _user32.GetAncestor
+_GetAncestor.argtypes = [wintypes.HWND, ctypes.c_uint]
+_GetAncestor.restype = wintypes.HWND
+_GWL_STYLE = -16
+_WS_CHILD = 0x40000000
+_GA_ROOT = 2
+
+def _is_toplevel(hwnd: int) -> bool:
+    # Style bit + root test instead of GetParent: GetParent also returns the owner,
+    # which wrongly rejected owned top-level windows (dialogs, tool windows)
+    return not (_GetWindowLongW(hwnd, _GWL_STYLE) & _WS_CHILD) and _GetAncestor(hwnd, _GA_ROOT) == hwnd
+
+_GetClassNameW = _user32.GetClassNameW
+_GetClassNameW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+_GetClassNameW.restype = ctypes.c_int
+_InternalGetWindowText = _user32.InternalGetWindowText
+_InternalGetWindowText.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+_InternalGetWindowText.restype = ctypes.c_int
+_GetWindowThreadProcessId = _user32.GetWindowThreadProcessId
+_GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+_GetWindowThreadProcessId.restype = wintypes.DWORD
+_GetWindowRect = _user32.GetWindowRect
+_GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+_GetWindowRect.restype = wintypes.BOOL
+_FindWindowExW = _user32.FindWindowExW
+_FindWindowExW.argtypes = [wintypes.HWND, wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR]
+_FindWindowExW.restype = wintypes.HWND
+# Passes every class filter (see _window_matcher), so it is always a candidate class
+_APP_FRAME_CLASS = "ApplicationFrameWindow"
+
+def _toplevel_windows_of_classes(classes: Iterable[str]) -> List[int]:
+    """Top-level windows of the given classes; user32 walks the window list in C per class."""
+    found: List[int] = []
+    for cls in classes:
+        hwnd = None
+        while True:
+            hwnd = _FindWindowExW(None, hwnd, cls, None)
+            if not hwnd:
+                break
+            found.append(hwnd)
+    return found
+
+class _WindowQuery:
+    """Reusable buffers for the per-HWND queries of one search (one instance per call: thread-safe)."""
+    __slots__ = ("_cls", "_text", "_pid", "_pid_hwnd", "_rect", "_cls_hwnd", "_cls_value",
+                 "_text_hwnd", "_text_value")
+    
+    def __init__(self):
+        self._cls = ctypes.create_unicode_buffer(256)
+        self._text = ctypes.create_unicode_buffer(512)
+        self._pid = wintypes.DWORD()
+        self._pid_hwnd = None
+        self._rect = wintypes.RECT()
+        self._cls_hwnd = self._text_hwnd = None
+        self._cls_value = self._text_value = ""
+    
+    # Several criteria sets (any_of, find_windows_multi) ask about the same window:
+    # each value is queried once per window
+    def class_name(self, hwnd: int) -> str:
+        if hwnd != self._cls_hwnd:
+            n = _GetClassNameW(hwnd, self._cls, 256)
+            self._cls_value = self._cls.value if n else ""
+            self._cls_hwnd = hwnd
+        return self._cls_value
+    
+    def title(self, hwnd: int) -> str:
+        if hwnd != self._text_hwnd:
+            n = _InternalGetWindowText(hwnd, self._text, 512)
+            self._text_value = self._text.value if n else ""
+            self._text_hwnd = hwnd
+        return self._text_value
+    
+    def pid(self, hwnd: int) -> int:
+        if hwnd != self._pid_hwnd:
+            self._pid.value = 0
+            _GetWindowThreadProcessId(hwnd, ctypes.byref(self._pid))
+            self._pid_hwnd = hwnd
+        return self._pid.value
+    
+    def size(self, hwnd: int) -> Tuple[int, int]:
+        r = self._rect
+        if not _GetWindowRect(hwnd, ctypes.byref(r)):
+            return 0, 0
+        return r.right - r.left, r.bottom - r.top
+
 def get_window_area(hwnd: int) -> int:
     """Calculate the visible area of a window."""
     try:
-        l, t, r, b = win32gui.GetWindowRect(hwnd)
-        return max(0, r - l) * max(0, b - t)
+        r = _rect()
+        if not _GetWindowRect(hwnd, ctypes.byref(r)):
+            return 0
+        return max(0, r.right - r.left) * max(0, r.bottom - r.top)
     except Exception:
         return 0
 
@@ -211,121 +645,229 @@ def enum_visible_toplevel_windows() -> List[int]:
     Returns:
         List of window handles (HWNDs)
     """
-    windows = []
+    windows: List[int] = []
+    append = windows.append
     
-    def enum_callback(hwnd, _):
+    # Closure over the bound append: no py_object cast of lParam per window
+    def collect(hwnd, _):
         try:
-            if not win32gui.IsWindowVisible(hwnd):
-                return True
-            if win32gui.GetParent(hwnd):
-                return True
-            windows.append(hwnd)
+            if _IsWindowVisible(hwnd) and _is_toplevel(hwnd):
+                append(hwnd)
         except Exception:
             pass
         return True
     
     try:
-        win32gui.EnumWindows(enum_callback, None)
+        _EnumWindows(_WNDENUMPROC(collect), 0)
     except Exception:
         pass
-    
     return windows
 
+@functools.lru_cache(maxsize=64)
+def _title_pattern(searches: Tuple[str, ...]):
+    """One case-insensitive alternation for all title substrings: a single scan per title."""
+    return re.compile("|".join(map(re.escape, searches)), re.IGNORECASE)
+
+def _window_matcher(
+    pid: int = None,
+    class_names: Iterable[str] = None,
+    title_contains: List[str] = None,
+    image_names: Iterable[str] = None,
+    session_id: int = None,
+    pid2img: Dict[int, str] = None,
+    pid2session: Dict[int, int] = None,
+    query: _WindowQuery = None
+) -> Callable[[int], bool]:
+    """Build the per-window predicate for one criteria set.
+
+    Checks run in ascending cost: class name, PID, title, image name (process
+    lookup), session ID; the first mismatch rejects the window.
+    """
+    # Normalize inputs
+    class_set = class_names if isinstance(class_names, frozenset) else frozenset(class_names or ())
+    title_searches = tuple(s for s in (title_contains or ()) if s)
+    title_search = _title_pattern(title_searches).search if title_searches else None
+    image_set = (image_names if isinstance(image_names, frozenset)
+                 else frozenset((name or "").lower() for name in (image_names or ())))
+    
+    want_pid = None if pid is None else int(pid)
+    class_name, window_pid_of, title_of = query.class_name, query.pid, query.title
+    
+    def match(hwnd: int) -> bool:
+        # Check class name (one user32 call, rejects most windows)
+        window_class = None
+        if class_set:
+            window_class = class_name(hwnd)
+            if window_class not in class_set:
+                # Special case for ApplicationFrameWindow
+                if window_class != _APP_FRAME_CLASS:
+                    return False
+        
+        # Check PID
+        if want_pid is not None and window_pid_of(hwnd) != want_pid:
+            return False
+        
+        # Check title
+        if title_search is not None:
+            if title_search(title_of(hwnd)) is None:
+                # Allow ApplicationFrameWindow with matching title even if class doesn't match
+                if not class_set or window_class != _APP_FRAME_CLASS:
+                    return False
+        
+        # Check image name (memoized per PID; may need a process handle)
+        if image_set:
+            try:
+                window_pid = window_pid_of(hwnd)
+                image_name = pid2img.get(window_pid)
+                if image_name is None:
+                    image_name = pid2img[window_pid] = get_image_name_basename(window_pid)
+                if image_name not in image_set:
+                    return False
+            except Exception:
+                return False
+        
+        # Check RDSH session ID (for remote desktop scenarios)
+        if session_id is not None:
+            try:
+                window_pid = window_pid_of(hwnd)
+                window_session = pid2session.get(window_pid)
+                if window_session is None:
+                    window_session = pid2session[window_pid] = _get_process_session_id(window_pid)
+                if window_session != session_id:
+                    return False
+            except Exception:
+                return False
+        return True
+    
+    return match
+
 def find_windows_by_criteria(
     pid: int = None,
-    class_names: List[str] = None,
+    class_names: Iterable[str] = None,
     title_contains: List[str] = None,
-    image_names: List[str] = None,
-    session_id: int = None
+    image_names: Iterable[str] = None,
+    session_id: int = None,
+    pid_cache: Dict[int, str] = None,
+    hwnds: Iterable[int] = None,
+    any_of: Iterable[Dict[str, Any]] = None
 ) -> List[int]:
     """
     Find windows matching the given criteria.
     
     Args:
         pid: Process ID to match
-        class_names: List of window class names to match
+        class_names: Window class names to match (list or frozenset)
         title_contains: List of strings that should be in the window title
-        image_names: List of executable names to match
+        image_names: Executable names to match (list or frozenset)
         session_id: RDSH session ID to match (for remote desktop scenarios)
+        pid_cache: Optional PID -> image name memo; pass the same dict across
+            repeated calls (e.g. a polling loop) to resolve each PID only once
+        hwnds: Optional pre-enumerated top-level windows (e.g. one shared
+            enum_visible_toplevel_windows() snapshot); skips the EnumWindows walk
+        any_of: Optional alternative criteria dicts (e.g. [{"pid": 42},
+            {"title_contains": [...]}]), each combined with the criteria above.
+            A window matches if any alternative matches; results are ordered by
+            the first matching alternative, all in a single walk
     
     Returns:
         List of matching window handles
     """
-    matching_windows = []
+    common = dict(pid=pid, class_names=class_names, title_contains=title_contains,
+                  image_names=image_names, session_id=session_id)
+    criteria_sets = [dict(common, **alt) for alt in any_of] if any_of is not None else [common]
+    buckets = _match_windows(criteria_sets, pid_cache, hwnds, first_match=True)
+    if len(buckets) == 1:
+        return buckets[0]
+    return [hwnd for bucket in buckets for hwnd in bucket]
+
+def find_windows_multi(
+    queries: Iterable[Dict[str, Any]],
+    pid_cache: Dict[int, str] = None,
+    hwnds: Iterable[int] = None
+) -> List[List[int]]:
+    """
+    Run several independent searches over one window walk.
     
-    # Normalize inputs
-    class_set = set(class_names or [])
-    title_searches = [s.lower() for s in (title_contains or []) if s]
-    image_set = set((name or "").lower() for name in (image_names or []))
+    Args:
+        queries: Criteria dicts with the keyword arguments of find_windows_by_criteria
+            (pid, class_names, title_contains, image_names, session_id)
+        pid_cache: Optional PID -> image name memo (see find_windows_by_criteria)
+        hwnds: Optional pre-enumerated top-level windows
     
-    def enum_callback(hwnd, _):
+    Returns:
+        One list of matching window handles per query, in query order; a window
+        can appear in several lists. Class, title and PID are queried once per window.
+    """
+    return _match_windows([dict(q) for q in queries], pid_cache, hwnds, first_match=False)
+
+def _match_windows(
+    criteria_sets: List[Dict[str, Any]],
+    pid_cache: Dict[int, str],
+    hwnds: Iterable[int],
+    first_match: bool
+) -> List[List[int]]:
+    """One pass over the candidate windows; one result bucket per criteria set."""
+    pid2img = pid_cache if pid_cache is not None else {}
+    # Image-name/session filters: resolve all PIDs with one process snapshot instead of
+    # one OpenProcess / ProcessIdToSessionId per window; a shared pid_cache that is
+    # already filled is reused as-is for image names
+    need_images = not pid2img and any(c.get("image_names") for c in criteria_sets)
+    need_sessions = any(c.get("session_id") is not None for c in criteria_sets)
+    pid2session: Dict[int, int] = {}
+    if need_images or need_sessions:
+        procs = _snapshot_processes()
+        if need_images:
+            pid2img.update((p, name) for p, (name, _) in procs.items() if name)
+        if need_sessions:
+            pid2session.update((p, sess) for p, (_, sess) in procs.items())
+    query = _WindowQuery()
+    matchers = [_window_matcher(pid2img=pid2img, pid2session=pid2session, query=query, **c)
+                for c in criteria_sets]
+    buckets: List[List[int]] = [[] for _ in matchers]
+    
+    # Own walk is already visible/top-level; a passed-in snapshot may be stale
+    recheck = hwnds is not None
+    if hwnds is None:
+        # Every criteria set filters by class: let FindWindowExW pick the candidates, so
+        # windows of other classes never reach Python (order: per class, z-order within)
+        if criteria_sets and all(c.get("class_names") for c in criteria_sets):
+            classes = {_APP_FRAME_CLASS}
+            for c in criteria_sets:
+                classes.update(c["class_names"])
+            hwnds = _toplevel_windows_of_classes(sorted(classes))
+            recheck = True
+        else:
+            hwnds = enum_visible_toplevel_windows()
+    
+    # Loop-invariant lookups as locals (LOAD_FAST per window instead of global/attribute loads)
+    is_visible, is_toplevel, size = _IsWindowVisible, _is_toplevel, query.size
+    alternatives = list(zip(buckets, matchers))
+    
+    for hwnd in hwnds:
         try:
-            if not win32gui.IsWindowVisible(hwnd):
-                return True
-            if win32gui.GetParent(hwnd):
-                return True
-            
-            # Check class name
-            if class_names:
-                window_class = win32gui.GetClassName(hwnd)
-                if window_class not in class_set:
-                    # Special case for ApplicationFrameWindow
-                    if window_class != "ApplicationFrameWindow":
-                        return True
-            
-            # Check PID
-            if pid is not None:
-                _, window_pid = win32process.GetWindowThreadProcessId(hwnd)
-                if int(window_pid) != int(pid):
-                    return True
-            
-            # Check title
-            if title_searches:
-                window_title = (win32gui.GetWindowText(hwnd) or "").lower()
-                if not any(search in window_title for search in title_searches):
-                    # Allow ApplicationFrameWindow with matching title even if class doesn't match
-                    if not class_names or win32gui.GetClassName(hwnd) != "ApplicationFrameWindow":
-                        return True
+            if recheck and (not is_visible(hwnd) or not is_toplevel(hwnd)):
+                continue
             
-            # Check image name
-            if image_set:
-                try:
-                    _, window_pid = win32process.GetWindowThreadProcessId(hwnd)
-                    image_name = get_image_name_basename(int(window_pid))
-                    if image_name not in image_set:
-                        return True
-                except Exception:
-                    return True
+            # Check minimum size first (filter out tiny windows): cheapest test, no strings
+            w, h = size(hwnd)
+            if w < 200 or h < 120:
+                continue
             
-            # Check RDSH session ID (for remote desktop scenarios)
-            if session_id is not None:
-                try:
-                    _, window_pid = win32process.GetWindowThreadProcessId(hwnd)
-                    window_session_id = _get_process_session_id(window_pid)
-                    if window_session_id != session_id:
-                        return True
-                except Exception:
-                    return True
-            
-            # Check minimum size (filter out tiny windows)
-            l, t, r, b = win32gui.GetWindowRect(hwnd)
-            if (r - l) < 200 or (b - t) < 120:
-                return True
-            
-            matching_windows.append(hwnd)
+            for bucket, match in alternatives:
+                if match(hwnd):
+                    bucket.append(hwnd)
+                    if first_match:
+                        break
             
         except Exception:
             pass
-        return True
-    
-    try:
-        win32gui.EnumWindows(enum_callback, None)
-    except Exception:
-        pass
     
-    return matching_windows
+    return buckets
 
 # ---------- Explorer-specific utilities ----------
+_EXPLORER_CLASSES = frozenset(("CabinetWClass", "ExploreWClass", "ApplicationFrameWindow"))
+_EXPLORER_IMAGES = frozenset(("explorer.exe",))
+
 def get_explorer_windows() -> List[int]:
     """
     Get all File Explorer top-level windows.
@@ -333,7 +875,4 @@ def get_explorer_windows() -> List[int]:
     Returns:
         List of Explorer window handles
     """
-    return find_windows_by_criteria(
-        class_names=["CabinetWClass", "ExploreWClass", "ApplicationFrameWindow"],
-        image_names=["explorer.exe"]
-    )
\ No newline at end of file
+    return find_windows_by_criteria(class_names=_EXPLORER_CLASSES, image_names=_EXPLORER_IMAGES)
\ No newline at end of file